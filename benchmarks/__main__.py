@@ -0,0 +1,15 @@
+"""
+Runs the whole benchmark suite and writes all results as one JSON document.
+
+Usage: python -m benchmarks [--quick] [--output FILE]
+"""
+from benchmarks import bench_control, bench_tracker, bench_workers
+from benchmarks.common import parse_args, write
+
+
+if __name__ == "__main__":
+    arguments = parse_args(__doc__)
+    results = []
+    for module in (bench_control, bench_workers, bench_tracker):
+        results.extend(module.run(arguments.quick))
+    write(results, arguments.output)
@@ -0,0 +1,118 @@
+"""
+Compares the built-in state engine of ThreadControlMixin against the former
+transitions.Machine based implementation.
+
+Usage: python -m benchmarks.bench_control [--quick] [--output FILE]
+"""
+import timeit
+import tracemalloc
+from threading import Event
+from typing import List
+from transitions import Machine, State
+from benchmarks.common import Result, parse_args, result, write
+from src.worker_threads.control import ThreadControlMixin
+
+
+class MachineControlMixin(Machine):
+    """
+    Former transitions.Machine backed implementation, kept as reference.
+    """
+    INITIAL = State("initial")
+    RUNNING = State("running")
+    STOPPED = State("stopped")
+    PAUSED = State("paused")
+
+    def __init__(self) -> None:
+        self._running = Event()
+        Machine.__init__(
+            self,
+            states=[self.INITIAL, self.RUNNING, self.STOPPED, self.PAUSED],
+            initial=self.INITIAL.name
+        )
+        self.add_transition("running", self.INITIAL.name, self.RUNNING.name,
+                            before="_before_running_state")
+        self.add_transition("pause", self.PAUSED.name, "=")
+        self.add_transition("pause", self.RUNNING.name, self.PAUSED.name,
+                            before="_before_paused_state")
+        self.add_transition("resume", self.RUNNING.name, "=")
+        self.add_transition("resume", self.PAUSED.name, self.RUNNING.name,
+                            before="_before_running_state")
+        self.add_transition("stop", self.STOPPED.name, "=")
+        self.add_transition("stop", [self.RUNNING.name, self.PAUSED.name],
+                            self.STOPPED.name, after="_after_stopped_state")
+
+    def _after_stopped_state(self) -> None:
+        if not self._running.is_set():
+            self._running.set()
+        self._running.clear()
+
+    def _before_running_state(self) -> None:
+        self._running.set()
+
+    def _before_paused_state(self) -> None:
+        self._running.clear()
+
+
+def spawn_time(cls: type, number: int = 2000) -> float:
+    """
+    Returns the mean construction time per instance in microseconds.
+    """
+    return timeit.timeit(cls, number=number) / number * 1e6
+
+
+def memory_per_instance(cls: type, number: int = 2000) -> float:
+    """
+    Returns the mean memory allocated per instance in bytes.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls() for _ in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / number
+
+
+def state_check_time(cls: type, number: int = 200000) -> float:
+    """
+    Returns the mean duration of one is_stopped() call in nanoseconds.
+    """
+    instance = cls()
+    instance.running()
+    return timeit.timeit(instance.is_stopped, number=number) / number * 1e9
+
+
+def transition_time(cls: type, number: int = 20000) -> float:
+    """
+    Returns the mean duration of one pause()/resume() round trip in microseconds.
+    """
+    instance = cls()
+    instance.running()
+
+    def round_trip() -> None:
+        instance.pause()
+        instance.resume()
+    return timeit.timeit(round_trip, number=number) / number * 1e6
+
+
+MEASUREMENTS = [
+    ("spawn_time", "us", spawn_time),
+    ("memory", "bytes", memory_per_instance),
+    ("state_check_time", "ns", state_check_time),
+    ("transition_time", "us", transition_time),
+]
+
+
+def run(quick: bool) -> List[Result]:
+    # The measurements are cheap, so quick runs use the same sizes
+    # pylint: disable=unused-argument
+    results = []
+    for metric, unit, measure in MEASUREMENTS:
+        for cls in (MachineControlMixin, ThreadControlMixin):
+            results.append(result("control", metric, measure(cls), unit, cls=cls.__name__))
+    return results
+
+
+if __name__ == "__main__":
+    arguments = parse_args(__doc__)
+    write(run(arguments.quick), arguments.output)
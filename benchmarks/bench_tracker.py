@@ -0,0 +1,141 @@
+"""
+Measures the cost of one NewFileTracker scan against directories of
+different sizes, both for an unchanged directory and with new files, as well
+as the detection latency of the inotify backend.
+
+Usage: python -m benchmarks.bench_tracker [--quick] [--output FILE]
+"""
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from typing import List
+from benchmarks.common import Result, parse_args, result, write
+from src.examples.tracker import NewFileTracker, RecursiveFileTracker
+
+
+def populate(folder: str, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        with open(os.path.join(folder, f"file{i:07d}.txt"), "wb"):
+            pass
+
+
+def scan_cost(files: int, repetitions: int) -> List[Result]:
+    folder = tempfile.mkdtemp(prefix="bench_tracker_")
+    try:
+        populate(folder, 0, files)
+        # As for a folder, which did not change for a while
+        past = time.time() - 60.0
+        os.utime(folder, (past, past))
+        tracker = NewFileTracker(folder, "*.txt", use_inotify=False)
+        start = time.perf_counter()
+        tracker.preparation()
+        preparation = time.perf_counter() - start
+        idle = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            tracker.run_routine()
+            idle.append(time.perf_counter() - start)
+        populate(folder, files, 10)
+        start = time.perf_counter()
+        tracker.run_routine()
+        changed = time.perf_counter() - start
+        assert tracker.new_files.qsize() == 10
+    finally:
+        shutil.rmtree(folder)
+    return [
+        result("tracker_scan", "preparation", preparation, "s", files=files),
+        result("tracker_scan", "idle_scan_median", statistics.median(idle), "s", files=files),
+        result("tracker_scan", "changed_scan", changed, "s", files=files),
+    ]
+
+
+def detection_latency(files: int, repetitions: int) -> List[Result]:
+    folder = tempfile.mkdtemp(prefix="bench_tracker_")
+    try:
+        populate(folder, 0, files)
+        tracker = NewFileTracker(folder, "*.txt")
+        tracker.start()
+        time.sleep(0.1)
+        latencies = []
+        for i in range(repetitions):
+            start = time.perf_counter()
+            populate(folder, files + i, 1)
+            tracker.new_files.get(timeout=10.0)
+            latencies.append(time.perf_counter() - start)
+        backend = "inotify" if tracker.uses_inotify else "scan"
+        tracker.stop()
+        tracker.join()
+    finally:
+        shutil.rmtree(folder)
+    return [
+        result("tracker_detection", "latency_median", statistics.median(latencies), "s",
+               files=files, backend=backend),
+        result("tracker_detection", "latency_max", max(latencies), "s",
+               files=files, backend=backend),
+    ]
+
+
+class _TimedTracker(RecursiveFileTracker):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared = threading.Event()
+        self.preparation_time = 0.0
+
+    def preparation(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().preparation()
+        finally:
+            self.preparation_time = time.perf_counter() - start
+            self.prepared.set()
+
+
+def tree_scan_cost(files: int, workers: int, repetitions: int) -> List[Result]:
+    root = tempfile.mkdtemp(prefix="bench_tracker_")
+    try:
+        past = time.time() - 60.0
+        for index in range(0, files, 1000):
+            folder = os.path.join(root, f"part{index // 1000:04d}")
+            os.mkdir(folder)
+            populate(folder, index, min(1000, files - index))
+            os.utime(folder, (past, past))
+        os.utime(root, (past, past))
+        # Scans run here only, while the tracker sleeps through its interval
+        tracker = _TimedTracker([root], include=["*.txt"], workers=workers,
+                                scan_interval=3600.0)
+        tracker.start()
+        tracker.prepared.wait()
+        idle = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            tracker.run_routine()
+            idle.append(time.perf_counter() - start)
+        tracker.stop()
+        tracker.join()
+        preparation = tracker.preparation_time
+    finally:
+        shutil.rmtree(root)
+    return [
+        result("tree_scan", "preparation", preparation, "s", files=files, workers=workers),
+        result("tree_scan", "idle_scan_median", statistics.median(idle), "s",
+               files=files, workers=workers),
+    ]
+
+
+def run(quick: bool) -> List[Result]:
+    sizes = (10000,) if quick else (10000, 100000, 1000000)
+    results = []
+    for files in sizes:
+        results.extend(scan_cost(files, 3 if files >= 1000000 else 10))
+        results.extend(detection_latency(files, 20))
+        for workers in (1, 4):
+            results.extend(tree_scan_cost(files, workers, 3 if files >= 1000000 else 10))
+    return results
+
+
+if __name__ == "__main__":
+    arguments = parse_args(__doc__)
+    write(run(arguments.quick), arguments.output)
@@ -0,0 +1,178 @@
+"""
+Measures the throughput of task workers with a shared queue and with work
+stealing, the rate and jitter of cycle workers, control latencies as well as
+construction cost and memory per worker.
+
+Usage: python -m benchmarks.bench_workers [--quick] [--output FILE]
+"""
+import hashlib
+import json
+import os
+import queue
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, List
+from benchmarks.common import Result, parse_args, result, write
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+from src.worker_threads.stealing import WorkStealingExecutor
+
+
+class CallableTaskWorker(TaskWorkerThread):
+    """
+    Task worker delegating each task to a plain callable.
+    """
+    def __init__(self, tasks: queue.Queue, run_task: Callable[[Any], Any]) -> None:
+        super().__init__(tasks)
+        self._run_task = run_task
+
+    def run_task(self, task: Any) -> Any:
+        return self._run_task(task)
+
+
+def trivial_task(task: Any) -> None:
+    """
+    Task without any work, exposes the overhead per task.
+    """
+
+
+def realistic_task(task: Any) -> None:
+    """
+    Task serializing and hashing a small record.
+    """
+    record = json.dumps({"id": task, "payload": "x" * 256})
+    hashlib.sha256(record.encode()).hexdigest()
+
+
+def task_throughput(quick: bool) -> List[Result]:
+    results = []
+    count = 20000 if quick else 200000
+    workers_range = [1, 2, 4] if quick else sorted({1, 2, 4, 8, 2 * (os.cpu_count() or 1)})
+    for name, function in (("trivial", trivial_task), ("realistic", realistic_task)):
+        for workers in workers_range:
+            tasks = queue.Queue()
+            for i in range(count):
+                tasks.put(i)
+            threads = [CallableTaskWorker(tasks, function) for _ in range(workers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            results.append(result("task_throughput", "tasks_per_second", count / elapsed,
+                                  "1/s", task=name, workers=workers, tasks=count))
+    return results
+
+
+def stealing_throughput(quick: bool) -> List[Result]:
+    results = []
+    count = 20000 if quick else 200000
+    workers_range = [1, 2, 4] if quick else sorted({1, 2, 4, 8, 2 * (os.cpu_count() or 1)})
+    for name, function in (("trivial", trivial_task), ("realistic", realistic_task)):
+        for workers in workers_range:
+            executor = WorkStealingExecutor(function, workers=workers)
+            for i in range(count):
+                executor.put(i)
+            start = time.perf_counter()
+            executor.start()
+            executor.join_tasks()
+            elapsed = time.perf_counter() - start
+            executor.stop(timeout=10.0)
+            results.append(result("stealing_throughput", "tasks_per_second", count / elapsed,
+                                  "1/s", task=name, workers=workers, tasks=count,
+                                  steals=executor.steals))
+    return results
+
+
+def cycle_rate(quick: bool) -> List[Result]:
+    results = []
+    duration = 0.5 if quick else 2.0
+    for schedule in (CycleWorkerThread.FIXED_DELAY, CycleWorkerThread.FIXED_RATE):
+        for delay in (0.0, 0.001, 0.01):
+            worker = CycleWorkerThread(delay=delay, target=trivial_task, args=(None,),
+                                       schedule=schedule)
+            worker.start()
+            time.sleep(duration)
+            worker.stop()
+            worker.join()
+            stats = worker.cycle_stats
+            params = {"schedule": schedule, "delay": delay}
+            results.append(result("cycle_rate", "cycles_per_second", stats.cycles / duration,
+                                  "1/s", **params))
+            results.append(result("cycle_rate", "mean_jitter", stats.mean_jitter, "s",
+                                  **params))
+            results.append(result("cycle_rate", "max_jitter", stats.max_jitter, "s", **params))
+    return results
+
+
+def control_latency(quick: bool) -> List[Result]:
+    results = []
+    repetitions = 20 if quick else 200
+    for delay in (0.0, 0.01):
+        resumed, exited = [], []
+        for _ in range(repetitions):
+            calls = []
+            worker = CycleWorkerThread(delay=delay, target=calls.append, args=(None,))
+            worker.start()
+            worker.pause()
+            while worker.is_working():
+                time.sleep(0)
+            count = len(calls)
+            start = time.perf_counter()
+            worker.resume()
+            while len(calls) == count:
+                time.sleep(0)
+            resumed.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            worker.stop()
+            worker.join()
+            exited.append(time.perf_counter() - start)
+        for metric, values in (("pause_resume", resumed), ("stop_exit", exited)):
+            results.append(result("control_latency", f"{metric}_median",
+                                  statistics.median(values), "s", delay=delay))
+            results.append(result("control_latency", f"{metric}_max",
+                                  max(values), "s", delay=delay))
+    return results
+
+
+def spawn_cost(quick: bool) -> List[Result]:
+    results = []
+    count = 200 if quick else 2000
+    factories = {
+        "CycleWorkerThread": lambda: CycleWorkerThread(target=trivial_task, args=(None,)),
+        "TaskWorkerThread": lambda: CallableTaskWorker(queue.Queue(), trivial_task),
+    }
+    for name, factory in factories.items():
+        start = time.perf_counter()
+        for _ in range(count):
+            factory()
+        results.append(result("spawn_cost", "construction", (time.perf_counter() - start) /
+                              count, "s", worker=name))
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        workers = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del workers
+        results.append(result("spawn_cost", "memory", (after - before) / count, "bytes",
+                              worker=name))
+        start = time.perf_counter()
+        for _ in range(count // 10):
+            worker = factory()
+            worker.start()
+            worker.stop()
+            worker.join()
+        results.append(result("spawn_cost", "start_stop_join", (time.perf_counter() - start) /
+                              (count // 10), "s", worker=name))
+    return results
+
+
+def run(quick: bool) -> List[Result]:
+    return task_throughput(quick) + stealing_throughput(quick) + cycle_rate(quick) + \
+        control_latency(quick) + spawn_cost(quick)
+
+
+if __name__ == "__main__":
+    arguments = parse_args(__doc__)
+    write(run(arguments.quick), arguments.output)
@@ -0,0 +1,65 @@
+"""
+Shared helpers of the benchmark suite.
+"""
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+
+Result = Dict[str, Any]
+
+
+def result(benchmark: str, metric: str, value: float, unit: str, **params: Any) -> Result:
+    """
+    Returns one machine-readable measurement.
+    """
+    return {
+        "benchmark": benchmark,
+        "metric": metric,
+        "value": value,
+        "unit": unit,
+        "params": params
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Returns a description of the environment the benchmarks ran in.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--quick", action="store_true", help="use smaller problem sizes")
+    return parser.parse_args()
+
+
+def write(results: List[Result], output: Optional[str] = None) -> None:
+    """
+    Writes the results together with the environment as JSON document.
+    """
+    document = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if output is None:
+        print(document)
+    else:
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(document + "\n")
@@ -0,0 +1,142 @@
+"""
+Persistent state of file trackers.
+"""
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+
+class TrackerCheckpoint:
+    """
+    This class stores the keys of the files seen by a tracker in an SQLite
+    database, so a restarted tracker resumes where it stopped. Changes are
+    buffered in memory and written in one transaction at most every
+    `flush_interval` seconds. Files seen after the last flush are reported
+    again after a crash.
+
+    The `source` identifies what the tracker watches, e.g. its folder and
+    pattern. A checkpoint written for another source is taken as empty.
+    """
+    def __init__(self, path: str, flush_interval: float = 1.0, source: str = "") -> None:
+        """
+        Initializes TrackerCheckpoint class.
+        """
+        if flush_interval < 0.0:
+            raise ValueError("Flush interval must be non-negative")
+        self._path = path
+        self._source = source
+        self._flush_interval = flush_interval
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        # Maps each changed key onto True if it was added, False if removed
+        self._pending = {}       # type: Dict[int, bool]
+        self._last_flush = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of changes not written yet.
+        """
+        return len(self._pending)
+
+    def due_in(self) -> Optional[float]:
+        """
+        Returns the time until buffered changes are due to be written, or
+        None if there are none.
+        """
+        if not self._pending:
+            return None
+        return max(0.0, self._last_flush + self._flush_interval - time.monotonic())
+
+    def open(self) -> bool:
+        """
+        Opens the database in the calling thread. Returns False, if the
+        checkpoint was newly created or holds no state of this source yet.
+        """
+        connection = sqlite3.connect(self._path)
+        self._connection = connection
+        with connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen_keys (key INTEGER PRIMARY KEY)"
+            )
+        meta = dict(connection.execute(
+            "SELECT key, value FROM meta WHERE key IN ('initialized', 'source')"
+        ))
+        return meta.get("initialized") == "1" and meta.get("source") == self._source
+
+    def load(self) -> Iterator[int]:
+        """
+        Returns the keys of all files seen so far.
+        """
+        return (key for (key,) in self._opened().execute("SELECT key FROM seen_keys"))
+
+    def reset(self, keys: Iterable[int]) -> None:
+        """
+        Replaces the stored state by the given keys and marks the checkpoint
+        as initialized.
+        """
+        connection = self._opened()
+        self._pending.clear()
+        with connection:
+            connection.execute("DELETE FROM seen_keys")
+            connection.executemany(
+                "INSERT OR IGNORE INTO seen_keys (key) VALUES (?)", ((key,) for key in keys)
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (("initialized", "1"), ("source", self._source))
+            )
+        self._last_flush = time.monotonic()
+
+    def add(self, key: int) -> None:
+        self._pending[key] = True
+
+    def discard(self, key: int) -> None:
+        self._pending[key] = False
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Writes all buffered changes, if the flush interval expired or the
+        flush is forced.
+        """
+        now = time.monotonic()
+        if not self._pending or (not force and now - self._last_flush < self._flush_interval):
+            return
+        connection = self._opened()
+        pending, self._pending = self._pending, {}
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO seen_keys (key) VALUES (?)",
+                ((key,) for key, added in pending.items() if added)
+            )
+            connection.executemany(
+                "DELETE FROM seen_keys WHERE key = ?",
+                ((key,) for key, added in pending.items() if not added)
+            )
+        self._last_flush = now
+
+    def close(self) -> None:
+        """
+        Writes all buffered changes and closes the database.
+        """
+        if self._connection is not None:
+            self.flush(force=True)
+            self._connection.close()
+            self._connection = None
+
+    def _opened(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise ValueError("Operation on closed checkpoint")
+        return self._connection
@@ -0,0 +1,151 @@
+"""
+Compact index of the files seen by a tracker.
+"""
+import array
+import bisect
+import hashlib
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def path_key(path: str) -> int:
+    """
+    Returns a stable, signed 64 bit key of the given path.
+    """
+    digest = hashlib.blake2b(path.encode("utf-8", "surrogateescape"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class SeenIndex:
+    """
+    This class stores the keys of all files seen by a tracker in a sorted
+    array, which takes 8 bytes per file instead of a whole path string.
+    Single files are inserted into and removed from small overlay sets, which
+    are merged into the array once they grew large enough.
+
+    Keys are 64 bit hashes of the paths, so two different paths are mixed up
+    with a probability of about n² / 2^65 for n files.
+    """
+    # Number of overlay entries, which are always kept before merging
+    _MIN_OVERLAY = 1024
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        """
+        Initializes SeenIndex class.
+        """
+        self._keys = array.array("q", sorted({path_key(path) for path in paths}))
+        self._added = set()    # type: Set[int]
+        self._removed = set()  # type: Set[int]
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[int]) -> "SeenIndex":
+        """
+        Creates an index from keys returned by `keys()` or `path_key()`.
+        """
+        index = cls()
+        index._keys = array.array("q", sorted(set(keys)))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._removed) + len(self._added)
+
+    def __contains__(self, path: str) -> bool:
+        return self._contains(path_key(path))
+
+    def keys(self) -> array.array:
+        """
+        Returns the sorted keys of all files in the index.
+        """
+        self._merge()
+        return self._keys
+
+    def add(self, path: str) -> bool:
+        """
+        Inserts the given file. Returns False, if it is already contained.
+        """
+        key = path_key(path)
+        if self._contains(key):
+            return False
+        if key in self._removed:
+            self._removed.discard(key)
+        else:
+            self._added.add(key)
+            self._merge_if_large()
+        return True
+
+    def discard(self, path: str) -> bool:
+        """
+        Removes the given file. Returns False, if it is not contained.
+        """
+        key = path_key(path)
+        if key in self._added:
+            self._added.discard(key)
+            return True
+        if key in self._removed or not self._find(key):
+            return False
+        self._removed.add(key)
+        self._merge_if_large()
+        return True
+
+    def sync(self, paths: Iterable[str]) -> Tuple[List[str], List[int]]:
+        """
+        Replaces the content of the index by the given files. Returns the
+        files, which were not contained before, and the keys of all files,
+        which are no longer contained.
+
+        Apart from one byte per file, memory is only allocated for changes.
+        """
+        self._merge()
+        keys = self._keys
+        seen = bytearray(len(keys))
+        new = {}  # type: Dict[int, str]
+        for path in paths:
+            key = path_key(path)
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                seen[i] = 1
+            elif key not in new:
+                new[key] = path
+        if not new and seen.count(0) == 0:
+            return [], []
+        removed = [key for key, flag in zip(keys, seen) if not flag]
+        if removed:
+            self._keys = array.array("q", (key for key, flag in zip(keys, seen) if flag))
+        self._insert(new)
+        return list(new.values()), removed
+
+    def _contains(self, key: int) -> bool:
+        if key in self._added:
+            return True
+        return key not in self._removed and self._find(key)
+
+    def _find(self, key: int) -> bool:
+        i = bisect.bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def _merge_if_large(self) -> None:
+        if len(self._added) + len(self._removed) > max(self._MIN_OVERLAY, len(self._keys) >> 6):
+            self._merge()
+
+    def _merge(self) -> None:
+        if self._removed:
+            removed, self._removed = self._removed, set()
+            self._keys = array.array("q", (key for key in self._keys if key not in removed))
+        if self._added:
+            added, self._added = self._added, set()
+            self._insert(added)
+
+    def _insert(self, keys: Iterable[int]) -> None:
+        # Merges the sorted new keys with the sorted array in one pass
+        new = sorted(keys)
+        if not new:
+            return
+        old = self._keys
+        merged = array.array("q")
+        start = 0
+        for key in new:
+            end = bisect.bisect_left(old, key, start)
+            merged.extend(old[start:end])
+            merged.append(key)
+            start = end
+        merged.extend(old[start:])
+        self._keys = merged
@@ -0,0 +1,151 @@
+"""
+Minimal ctypes binding of the Linux inotify API.
+"""
+import ctypes
+import ctypes.util
+import math
+import os
+import select
+import struct
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = 0o00004000
+IN_CLOEXEC = 0o02000000
+
+# struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+_EVENT_HEADER = struct.Struct("iIII")
+_BUFFER_SIZE = 64 * 1024
+
+
+@dataclass
+class InotifyEvent:
+    """
+    One event read from an inotify instance. The name is empty for events
+    concerning the watched directory itself.
+    """
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+class Inotify:
+    """
+    This class wraps one non-blocking inotify instance. Raises OSError, if
+    inotify is not available on the current platform.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes Inotify class.
+        """
+        if _libc is None:
+            raise OSError("inotify is not available on this platform")
+        self._libc = _libc
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd  # type: Optional[int]
+
+    @staticmethod
+    def available() -> bool:
+        return _libc is not None
+
+    def fileno(self) -> int:
+        if self._fd is None:
+            raise ValueError("I/O operation on closed inotify instance")
+        return self._fd
+
+    @property
+    def closed(self) -> bool:
+        return self._fd is None
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """
+        Adds a watch for the given path and returns its watch descriptor.
+        """
+        wd = int(self._libc.inotify_add_watch(self.fileno(), os.fsencode(path), mask))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        return wd
+
+    def remove_watch(self, wd: int) -> None:
+        if self._libc.inotify_rm_watch(self.fileno(), wd) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def read(self) -> List[InotifyEvent]:
+        """
+        Returns all pending events without blocking.
+        """
+        events = []  # type: List[InotifyEvent]
+        while True:
+            try:
+                buffer = os.read(self.fileno(), _BUFFER_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                events.append(InotifyEvent(wd, mask, cookie, os.fsdecode(name)))
+
+    def wait(self, others: Sequence[int] = (), timeout: Optional[float] = None) -> List[int]:
+        """
+        Waits until events are pending or one of the other file descriptors
+        becomes readable. Returns the readable file descriptors.
+        """
+        # Unlike select(), poll() is not limited to descriptors below FD_SETSIZE
+        fds = [self.fileno(), *others]
+        poller = select.poll()
+        for fd in fds:
+            poller.register(fd, select.POLLIN)
+        milliseconds = None if timeout is None else math.ceil(timeout * 1000)
+        ready = {fd for fd, _ in poller.poll(milliseconds)}
+        return [fd for fd in fds if fd in ready]
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "Inotify":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,12 +1,45 @@
 """
 Thread based tracker.
 """
+import fnmatch
 import glob
+import math
 import os
 import queue
+import re
+import threading
 import time
-from typing import Set
-from src.worker_threads.core import CycleWorkerThread
+from stat import S_ISREG
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple
+)
+from src.examples import inotify
+from src.examples.checkpoint import TrackerCheckpoint
+from src.examples.index import SeenIndex, path_key
+from src.examples.inotify import Inotify
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+
+
+# Folder mtimes younger than this may hide later changes within the same
+# timestamp granule, so such folders are scanned again on the next cycle
+_MTIME_RESOLUTION = 2.0
+
+# Events of the watched folder, which make further watching impossible
+_WATCH_LOST = inotify.IN_IGNORED | inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF
+_WATCH_MASK = (
+    inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO | inotify.IN_CREATE |
+    inotify.IN_MOVED_FROM | inotify.IN_DELETE |
+    inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF | inotify.IN_ONLYDIR
+)
 
 
 class NewFileTracker(CycleWorkerThread):
@@ -14,21 +47,64 @@ class NewFileTracker(CycleWorkerThread):
     This class checks periodically if new files of the given type are created
     in the given folder. As soon as new files are detected, they are put into
     `new_files` for further processing by other threads.
+
+    On Linux, the tracker is notified by inotify about files, which are
+    completely written, moved or linked into the folder, instead of scanning
+    the whole folder on each cycle. Between two cycles, which are at least
+    `scan_interval` seconds apart, the tracker idles until events arrive. It
+    falls back to scanning, if inotify is not available or the folder cannot
+    be watched, and rescans the folder once whenever the kernel's event queue
+    overflowed.
+
+    When scanning, the folder is only listed again if its mtime changed, so
+    idle cycles on an unchanged folder cost a single stat() call. Files seen
+    are kept in a compact `SeenIndex`, which is updated in place.
+
+    With a `max_scan_interval`, scanning backs off while the folder stays
+    unchanged: the interval doubles per idle scan up to `max_scan_interval`
+    and drops back to `scan_interval` as soon as a scan finds changes.
+    Trackers notified by inotify keep `scan_interval`, as idling costs
+    nothing there.
+
+    If a `checkpoint` file is given, all files seen are stored there every
+    `checkpoint_interval` seconds. A restarted tracker then reports exactly
+    the files, which arrived while it was down, instead of taking a new
+    snapshot.
     """
     def __init__(
             self,
             folder: str,
             f_type: str = "*",
-            scan_interval: float = 0.0
+            scan_interval: float = 0.0,
+            use_inotify: bool = True,
+            checkpoint: Optional[str] = None,
+            checkpoint_interval: float = 1.0,
+            max_scan_interval: Optional[float] = None
     ) -> None:
         """
         Initializes the file tracker.
         """
-        super().__init__(delay=scan_interval, daemon=True)
+        super().__init__(delay=scan_interval, daemon=True, max_delay=max_scan_interval)
         self.__f_queue = queue.Queue()  # type: queue.Queue
-        self.__ignored = set()          # type: Set[str]
+        self.__ignored = SeenIndex()
+        self.__folder = folder
         self.__pattern = os.path.join(folder, f_type)
         self.__start_time = time.time()
+        # Patterns spanning several folders are resolved by glob
+        self.__use_glob = bool(os.path.dirname(f_type)) or glob.has_magic(folder)
+        self.__use_inotify = use_inotify and Inotify.available() and not self.__use_glob
+        self.__folder_mtime = None  # type: Optional[int]
+        # Same semantics as glob: wildcards do not match hidden files
+        self.__match = re.compile(fnmatch.translate(f_type)).match
+        self.__hidden = f_type.startswith(".")
+        self.__inotify = None   # type: Optional[Inotify]
+        self.__wake_up = None   # type: Optional[Tuple[int, int]]
+        self.__wake_up_lock = threading.Lock()
+        self.__rescan = True
+        self.__checkpoint = None  # type: Optional[TrackerCheckpoint]
+        if checkpoint is not None:
+            self.__checkpoint = TrackerCheckpoint(checkpoint, checkpoint_interval,
+                                                  source=os.path.abspath(self.__pattern))
 
     @property
     def new_files(self) -> queue.Queue:
@@ -42,20 +118,417 @@ class NewFileTracker(CycleWorkerThread):
         """
         return self.__f_queue
 
+    @property
+    def checkpoint(self) -> Optional[TrackerCheckpoint]:
+        """
+        Returns the checkpoint of the tracker, if any.
+        """
+        return self.__checkpoint
+
+    @property
+    def uses_inotify(self) -> bool:
+        """
+        Indicates whether the tracker is currently notified by inotify instead
+        of scanning the folder.
+        """
+        return self.__inotify is not None
+
+    def pause(self) -> bool:
+        result = super().pause()
+        self._wake_up()
+        return result
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        result = super().stop()
+        self._wake_up()
+        if timeout is None:
+            return result
+        return self._await_stopped(timeout)
+
     def preparation(self) -> None:
         """
         Called once at the beginning. Takes a snapshot of the current folder
-        content, as a reference to distinguish new from old files.
+        content or restores the checkpoint, as a reference to distinguish new
+        from old files.
         """
-        self.__ignored = {file for file in glob.glob(self.__pattern) if
-                          os.path.getctime(file) < self.__start_time}
+        if self.__use_inotify:
+            # Watch before taking the snapshot, so no file slips through
+            self.__open_inotify()
+        checkpoint = self.__checkpoint
+        if checkpoint is not None and checkpoint.open():
+            # The first scan reports all files, which arrived in the meantime
+            self.__ignored = SeenIndex.from_keys(checkpoint.load())
+        else:
+            if self.__use_glob:
+                self.__ignored = SeenIndex(file for file in glob.iglob(self.__pattern) if
+                                           os.path.getctime(file) < self.__start_time)
+            else:
+                # DirEntry caches its stat result, on Windows even from the listing
+                self.__ignored = SeenIndex(entry.path for entry in self.__entries() if
+                                           entry.stat().st_ctime < self.__start_time)
+            if checkpoint is not None:
+                checkpoint.reset(self.__ignored.keys())
+        self.__folder_mtime = None
+        self.__rescan = True
 
-    def run_routine(self) -> None:
+    def run_routine(self) -> Optional[bool]:
         """
         Called periodically as soon as `scan_interval` has expired. Checks if
-        new files of the given type are created.
+        new files of the given type are created. Returns whether a scan found
+        changes, or None if the tracker is notified by inotify.
         """
-        files = set(glob.glob(self.__pattern))
-        for file in files.difference(self.__ignored):
+        changed = None  # type: Optional[bool]
+        if self.__inotify is not None and not self.__rescan:
+            self.__read_events()
+        if self.__inotify is None or self.__rescan:
+            self.__rescan = False
+            changed = self.__scan()
+        if self.__checkpoint is not None:
+            self.__checkpoint.flush()
+        return None if self.__inotify is not None else changed
+
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            # Also runs, if the routine raised, so buffered changes are kept
+            self.__close_inotify()
+            if self.__checkpoint is not None:
+                self.__checkpoint.close()
+
+    def _sleep_until_next_tick(self) -> None:
+        super()._sleep_until_next_tick()
+        if self.__inotify is not None and not self.__rescan:
+            # Idle time between events does not count as working
+            self.__wait_for_events()
+
+    def _wake_up(self) -> None:
+        # Interrupts waiting for inotify events, e.g. on control events
+        self.__interrupt()
+
+    def __scan(self) -> bool:
+        # Returns whether any file was added or removed
+        if self.__use_glob:
+            files = glob.iglob(self.__pattern)  # type: Iterable[str]
+        else:
+            try:
+                stat = os.stat(self.__folder)
+            except OSError:
+                stat = None
+            if stat is not None and stat.st_mtime_ns == self.__folder_mtime:
+                return False
+            files = (entry.path for entry in self.__entries())
+            if stat is not None and time.time() - stat.st_mtime >= _MTIME_RESOLUTION:
+                self.__folder_mtime = stat.st_mtime_ns
+            else:
+                self.__folder_mtime = None
+        added, removed = self.__ignored.sync(files)
+        checkpoint = self.__checkpoint
+        for file in added:
             self.__f_queue.put(file)
-        self.__ignored = files
+            if checkpoint is not None:
+                checkpoint.add(path_key(file))
+        if checkpoint is not None:
+            for key in removed:
+                checkpoint.discard(key)
+        return bool(added or removed)
+
+    def __wait_for_events(self) -> None:
+        # Blocks until events are pending, a control event interrupts or
+        # buffered checkpoint changes are due to be written
+        watcher, pipe = self.__inotify, self.__wake_up
+        if watcher is None or pipe is None:
+            return
+        timeout = self.__checkpoint.due_in() if self.__checkpoint is not None else None
+        wake_up = pipe[0]
+        if wake_up in watcher.wait([wake_up], timeout):
+            try:
+                os.read(wake_up, 1024)
+            except BlockingIOError:
+                pass
+
+    def __read_events(self) -> None:
+        watcher = self.__inotify
+        if watcher is None:
+            return
+        for event in watcher.read():
+            if event.mask & inotify.IN_Q_OVERFLOW:
+                self.__rescan = True
+                self.__folder_mtime = None
+            elif event.mask & _WATCH_LOST:
+                self.__folder_mtime = None
+                self.__close_inotify()
+                return
+            elif self.__rescan or not self.__matches(event.name):
+                continue
+            elif event.mask & (inotify.IN_DELETE | inotify.IN_MOVED_FROM):
+                file = os.path.join(self.__folder, event.name)
+                if self.__ignored.discard(file) and self.__checkpoint is not None:
+                    self.__checkpoint.discard(path_key(file))
+            else:
+                file = os.path.join(self.__folder, event.name)
+                if not event.mask & (inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO) and \
+                        not event.mask & inotify.IN_ISDIR and not self.__is_complete(file):
+                    # Plain files are reported once they are completely written
+                    continue
+                if self.__ignored.add(file):
+                    self.__f_queue.put(file)
+                    if self.__checkpoint is not None:
+                        self.__checkpoint.add(path_key(file))
+
+    @staticmethod
+    def __is_complete(file: str) -> bool:
+        # Links and special files are not written after their creation, so no
+        # IN_CLOSE_WRITE follows their IN_CREATE unlike for new plain files
+        try:
+            info = os.lstat(file)
+        except OSError:
+            return False
+        return not S_ISREG(info.st_mode) or info.st_nlink > 1
+
+    def __entries(self) -> Iterator[os.DirEntry]:
+        # Yields the entries one by one, so huge folders are never held in memory
+        try:
+            with os.scandir(self.__folder) as entries:
+                for entry in entries:
+                    if self.__matches(entry.name):
+                        yield entry
+        except OSError:
+            return
+
+    def __matches(self, name: str) -> bool:
+        return (self.__hidden or not name.startswith(".")) and \
+            self.__match(name) is not None
+
+    def __open_inotify(self) -> None:
+        try:
+            watcher = Inotify()
+        except OSError:
+            return
+        try:
+            watcher.add_watch(self.__folder, _WATCH_MASK)
+        except OSError:
+            watcher.close()
+            return
+        wake_up = os.pipe()
+        os.set_blocking(wake_up[0], False)
+        os.set_blocking(wake_up[1], False)
+        with self.__wake_up_lock:
+            self.__inotify = watcher
+            self.__wake_up = wake_up
+
+    def __close_inotify(self) -> None:
+        with self.__wake_up_lock:
+            if self.__inotify is not None:
+                self.__inotify.close()
+                self.__inotify = None
+            if self.__wake_up is not None:
+                for fd in self.__wake_up:
+                    os.close(fd)
+                self.__wake_up = None
+
+    def __interrupt(self) -> None:
+        with self.__wake_up_lock:
+            if self.__wake_up is not None:
+                try:
+                    os.write(self.__wake_up[1], b"\0")
+                except BlockingIOError:
+                    # The pipe is full, the tracker gets woken up anyway
+                    pass
+
+
+def _compile(patterns: Sequence[str]) -> Optional[Callable[[str], Any]]:
+    # Combines all patterns into one precompiled expression
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns)).match
+
+
+class _DirectoryState:
+    __slots__ = ("mtime", "files", "subdirs")
+
+    def __init__(self) -> None:
+        self.mtime = None      # type: Optional[int]
+        self.files = set()     # type: Set[str]
+        self.subdirs = set()   # type: Set[str]
+
+
+class _ScanWorker(TaskWorkerThread):
+    """
+    Scans the directories handed out by a RecursiveFileTracker.
+    """
+    def __init__(self, tracker: "RecursiveFileTracker", jobs: queue.Queue) -> None:
+        super().__init__(jobs, daemon=True, idle_timeout=math.inf)
+        self._tracker = tracker
+
+    def run_task(self, task: Tuple[str, int]) -> None:
+        # pylint: disable=protected-access
+        self._tracker._scan_directory(*task)
+
+
+class RecursiveFileTracker(CycleWorkerThread):
+    """
+    This class checks periodically if new files are created anywhere below
+    the given root folders. File names must match one of the `include` and
+    none of the `exclude` patterns, directories matching an `exclude` pattern
+    are skipped as a whole. All new files are put into one `new_files` queue.
+
+    Directories are scanned in parallel by a pool of `workers` threads. Each
+    cycle costs one stat() call per known directory, only directories whose
+    mtime changed are listed again. Files, which already exist when the
+    tracker starts, are not reported.
+    """
+    def __init__(
+            self,
+            roots: Sequence[str],
+            include: Sequence[str] = ("*",),
+            exclude: Sequence[str] = (),
+            max_depth: Optional[int] = None,
+            workers: int = 4,
+            scan_interval: float = 0.0
+    ) -> None:
+        """
+        Initializes the recursive file tracker.
+        """
+        if workers < 1:
+            raise ValueError("Workers must be positive")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("Max depth must be non-negative")
+        super().__init__(delay=scan_interval, daemon=True)
+        self.__f_queue = queue.Queue()  # type: queue.Queue
+        self.__roots = list(roots)
+        self.__include = _compile(include)
+        self.__exclude = _compile(exclude)
+        self.__max_depth = max_depth
+        self.__jobs = queue.Queue()     # type: queue.Queue
+        self.__workers = [_ScanWorker(self, self.__jobs) for _ in range(workers)]
+        self.__directories = {}         # type: Dict[str, _DirectoryState]
+        self.__lock = threading.Lock()
+        self.__errors = []              # type: List[Exception]
+        self.__baseline = True
+
+    @property
+    def new_files(self) -> queue.Queue:
+        """
+        Returns all newly detected files.
+
+        Returns
+        -------
+        queue.Queue
+            Object containing all new files found.
+        """
+        return self.__f_queue
+
+    @property
+    def directories(self) -> int:
+        """
+        Returns the number of directories currently tracked.
+        """
+        return len(self.__directories)
+
+    def preparation(self) -> None:
+        """
+        Called once at the beginning. Takes a snapshot of all trees, as a
+        reference to distinguish new from old files.
+        """
+        for worker in self.__workers:
+            worker.start()
+        self.__baseline = True
+        self.__scan_trees()
+        self.__baseline = False
+
+    def run_routine(self) -> None:
+        """
+        Called periodically as soon as `scan_interval` has expired. Checks if
+        new files are created below any root folder.
+        """
+        self.__scan_trees()
+
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            # Also runs, if a scan error ended the tracker
+            for worker in self.__workers:
+                if not worker.is_initial():
+                    worker.stop()
+            for worker in self.__workers:
+                if not worker.is_initial():
+                    worker.join()
+
+    def _scan_directory(self, path: str, depth: int) -> None:
+        try:
+            self.__scan_directory(path, depth)
+        except Exception as error:  # pylint: disable=broad-except
+            # Reported by the tracker, workers must keep the pass going
+            with self.__lock:
+                self.__errors.append(error)
+
+    def __scan_trees(self) -> None:
+        for root in self.__roots:
+            self.__jobs.put((root, 0))
+        self.__jobs.join()
+        with self.__lock:
+            errors, self.__errors = self.__errors, []
+        if errors:
+            raise errors[0]
+
+    def __scan_directory(self, path: str, depth: int) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self.__lock:
+                self.__forget(path)
+            return
+        state = self.__directories.get(path)
+        if state is None:
+            state = _DirectoryState()
+            with self.__lock:
+                self.__directories[path] = state
+        if stat.st_mtime_ns != state.mtime:
+            # Recently modified directories may change again within the same
+            # timestamp granule, so they are listed again on the next cycle
+            if self.__list_directory(path, depth, state) and \
+                    time.time() - stat.st_mtime >= _MTIME_RESOLUTION:
+                state.mtime = stat.st_mtime_ns
+        for name in state.subdirs:
+            self.__jobs.put((os.path.join(path, name), depth + 1))
+
+    def __list_directory(self, path: str, depth: int, state: _DirectoryState) -> bool:
+        include, exclude = self.__include, self.__exclude
+        descend = self.__max_depth is None or depth < self.__max_depth
+        files = set()    # type: Set[str]
+        subdirs = set()  # type: Set[str]
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if exclude is not None and exclude(name):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if descend:
+                            subdirs.add(name)
+                    elif include is not None and include(name):
+                        files.add(name)
+        except OSError:
+            # Keeps the previous listing, the directory is retried next cycle
+            return False
+        if not self.__baseline:
+            for name in files.difference(state.files):
+                self.__f_queue.put(os.path.join(path, name))
+        with self.__lock:
+            for name in state.subdirs.difference(subdirs):
+                self.__forget(os.path.join(path, name))
+        state.files = files
+        state.subdirs = subdirs
+        return True
+
+    def __forget(self, path: str) -> None:
+        state = self.__directories.pop(path, None)
+        if state is not None:
+            for name in state.subdirs:
+                self.__forget(os.path.join(path, name))
@@ -3,10 +3,64 @@ Thread-based handler.
 """
 from src.worker_threads.version import __version__
 from src.worker_threads.control import ThreadControlMixin
+from src.worker_threads.aio import (
+    AsyncControlMixin,
+    AsyncCycleWorker,
+    AsyncTaskWorker,
+    put_async,
+    put_threadsafe,
+    submit_threadsafe
+)
 from src.worker_threads.core import (
+    CycleStats,
     CycleWorkerThread,
     TaskWorkerThread
 )
+from src.worker_threads.errors import (
+    DeadLetter,
+    ErrorPolicy,
+    ErrorStats
+)
+from src.worker_threads.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    as_completed,
+    submit,
+    wait
+)
+from src.worker_threads.metrics import (
+    MetricsRegistry,
+    MetricsSnapshot,
+    WorkerMetrics,
+    registry
+)
+from src.worker_threads.group import (
+    GroupStatus,
+    WorkerGroup
+)
+from src.worker_threads.pipeline import (
+    Pipeline,
+    PipelineStage
+)
+from src.worker_threads.pool import TaskWorkerPool
+from src.worker_threads.process import (
+    CycleWorkerProcess,
+    ProcessControlMixin,
+    TaskWorkerProcess
+)
+from src.worker_threads.profiler import SamplingProfiler
+from src.worker_threads.queues import (
+    PriorityTaskQueue,
+    WaitStats
+)
+from src.worker_threads.ratelimit import TokenBucket
+from src.worker_threads.scheduler import (
+    CycleScheduler,
+    ScheduledRoutine
+)
+from src.worker_threads.stealing import WorkStealingExecutor
 
 
 __copyright__ = "Copyright (c) 2022 bauerch"
@@ -0,0 +1,395 @@
+"""
+Asyncio based handlers.
+"""
+import abc
+import asyncio
+import concurrent.futures
+import math
+import queue
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Set
+)
+from src.worker_threads.control import ThreadControlMixin
+
+
+# Returned instead of a task, if a control event interrupted a blocking get
+_WAKE_UP = object()
+
+
+class AsyncControlMixin(ThreadControlMixin):
+    """
+    This class extends the ThreadControlMixin for coroutines. The state
+    transitions remain thread-safe, while waiting for the running state is
+    done on the event loop the worker runs on.
+    """
+    def __init__(self) -> None:
+        ThreadControlMixin.__init__(self)
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        # Events bind to the loop on first use, they are renewed per run
+        self._resumed = asyncio.Event()
+        self._finished = asyncio.Event()
+        # Set on every state change to interrupt delays
+        self._changed = asyncio.Event()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:  # type: ignore[override]
+        """
+        Waits until the object is in running state. Returns False if the
+        timeout expired or the object was stopped in the meantime.
+        """
+        try:
+            await asyncio.wait_for(self._resumed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return not self.is_stopped()
+
+    async def sleep(self, seconds: float) -> bool:  # type: ignore[override]
+        """
+        Sleeps for the given number of seconds while the object is running.
+        Returns False as soon as a control event changed the state, so delays
+        never hold off a pause or stop.
+        """
+        if seconds <= 0.0:
+            # Still gives other coroutines a turn
+            await asyncio.sleep(0)
+            return self.is_running()
+        changed = self._changed
+        changed.clear()
+        if not self.is_running():
+            return False
+        try:
+            await asyncio.wait_for(changed.wait(), seconds)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    async def join(self) -> None:
+        """
+        Waits until the worker finished its post processing.
+        """
+        await self._finished.wait()
+
+    def _bind_loop(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._resumed = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._changed = asyncio.Event()
+
+    def _after_stopped_state(self) -> None:
+        super()._after_stopped_state()
+        self._notify_loop()
+
+    def _before_running_state(self) -> None:
+        super()._before_running_state()
+        self._notify_loop()
+
+    def _before_paused_state(self) -> None:
+        super()._before_paused_state()
+        self._notify_loop()
+
+    def _notify_loop(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            # Deferred, so the callback sees the state after the transition
+            self._loop.call_soon_threadsafe(self._on_state_changed)
+
+    def _on_state_changed(self) -> None:
+        self._changed.set()
+        if self.is_paused():
+            self._resumed.clear()
+        else:
+            # Stopped objects release all waiters as well
+            self._resumed.set()
+
+
+class AsyncCycleWorker(AsyncControlMixin):
+    """
+    This class represents a coroutine based worker, which executes a predefined
+    routine cyclically on an event loop until a stop event is triggered.
+    """
+    def __init__(
+            self,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            target: Optional[Callable[..., Awaitable]] = None,
+            args: tuple = (),
+            kwargs=None
+    ) -> None:
+        """
+        Initializes AsyncCycleWorker class.
+        """
+        AsyncControlMixin.__init__(self)
+        self.delay = delay
+        self.timeout = timeout
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs if kwargs is not None else {}
+        self._working = False
+
+    def start(self) -> asyncio.Task:
+        """
+        Schedules the worker on the running event loop.
+        """
+        return asyncio.get_running_loop().create_task(self.run())
+
+    async def run(self) -> None:
+        """
+        Defines the worker's concrete workflow.
+        """
+        self._bind_loop()
+        self.running()
+        try:
+            await self.preparation()
+            while not self.is_stopped():
+                if not await self.wait(self._timeout):
+                    break
+                self._working = True
+                try:
+                    await self.run_routine()
+                finally:
+                    self._working = False
+                await self.sleep(self._delay)
+            await self.post_processing()
+        finally:
+            self.stop()
+            self._finished.set()
+
+    async def run_routine(self) -> None:
+        """
+        Representing the worker's activity on each cycle.
+
+        You may override this method in a subclass. The run_routine() method
+        awaits the coroutine function passed to the object's constructor as the
+        target argument, if any, with sequential and keyword arguments taken
+        from the args and kwargs arguments, respectively.
+        """
+        if self._target:
+            await self._target(*self._args, **self._kwargs)
+        else:
+            self.stop()
+
+    def is_working(self) -> bool:
+        return self._working
+
+    @property
+    def delay(self) -> float:
+        """
+        Indicates how much time shall pass before the worker continues with
+        the next cycle.
+        """
+        return self._delay
+
+    @delay.setter
+    def delay(self, delay: float) -> None:
+        if delay < 0.0:
+            raise ValueError("Delay must be non-negative")
+        self._delay = delay
+
+    @property
+    def timeout(self) -> float:
+        """
+        Indicates how much time the worker is allowed to pause before the
+        worker is automatically forced to stop.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        if timeout < 0.0:
+            raise ValueError("Timeout must be non-negative")
+        self._timeout = timeout
+
+    async def preparation(self) -> None:
+        """
+        Optional preparatory steps for the worker to perform before starting.
+        """
+
+    async def post_processing(self) -> None:
+        """
+        Optional follow-up steps for the worker to perform after stoppage.
+        """
+
+
+class AsyncTaskWorker(AsyncControlMixin):
+    """
+    This class represents a coroutine based worker, which processes the tasks
+    of an asyncio.Queue with up to `concurrency` tasks in flight.
+    """
+    def __init__(
+            self,
+            tasks: asyncio.Queue,
+            concurrency: int = 1,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            idle_timeout: Optional[float] = None
+    ) -> None:
+        """
+        Initializes AsyncTaskWorker class.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be positive")
+        AsyncControlMixin.__init__(self)
+        self.delay = delay
+        self.timeout = timeout
+        self._queue = tasks
+        self._concurrency = concurrency
+        self._idle_timeout = idle_timeout
+        self._in_flight = 0
+        self._getters = set()  # type: Set[asyncio.Future]
+
+    def start(self) -> asyncio.Task:
+        """
+        Schedules the worker on the running event loop.
+        """
+        return asyncio.get_running_loop().create_task(self.run())
+
+    async def run(self) -> None:
+        """
+        Defines the worker's concrete workflow.
+        """
+        self._bind_loop()
+        self.running()
+        try:
+            await self.preparation()
+            await asyncio.gather(*(self._consume() for _ in range(self._concurrency)))
+            await self.post_processing()
+        finally:
+            self.stop()
+            self._finished.set()
+
+    @abc.abstractmethod
+    async def run_task(self, task: Any) -> None:
+        """
+        Abstract coroutine representing the worker's activity on all task.
+        """
+
+    def is_working(self) -> bool:
+        return self._in_flight > 0
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns the number of tasks currently processed.
+        """
+        return self._in_flight
+
+    @property
+    def delay(self) -> float:
+        """
+        Indicates how much time shall pass before a consumer continues with
+        the next task.
+        """
+        return self._delay
+
+    @delay.setter
+    def delay(self, delay: float) -> None:
+        if delay < 0.0:
+            raise ValueError("Delay must be non-negative")
+        self._delay = delay
+
+    @property
+    def timeout(self) -> float:
+        """
+        Indicates how much time the worker is allowed to pause before the
+        worker is automatically forced to stop.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        if timeout < 0.0:
+            raise ValueError("Timeout must be non-negative")
+        self._timeout = timeout
+
+    async def preparation(self) -> None:
+        """
+        Optional preparatory steps for the worker to perform before starting.
+        """
+
+    async def post_processing(self) -> None:
+        """
+        Optional follow-up steps for the worker to perform after stoppage.
+        """
+
+    async def _consume(self) -> None:
+        while not self.is_stopped():
+            if not await self.wait(self._timeout):
+                # Stop all consumers, once the pause timed out
+                self.stop()
+                break
+            try:
+                task = await self._next_task()
+            except asyncio.QueueEmpty:
+                break
+            if task is _WAKE_UP:
+                continue
+            self._in_flight += 1
+            try:
+                await self.run_task(task)
+                self._queue.task_done()
+            finally:
+                self._in_flight -= 1
+            await self.sleep(self._delay)
+
+    async def _next_task(self) -> Any:
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._idle_timeout is None:
+                raise
+        getter = asyncio.ensure_future(self._queue.get())
+        self._getters.add(getter)
+        try:
+            timeout = None if math.isinf(self._idle_timeout) else self._idle_timeout
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+        finally:
+            self._getters.discard(getter)
+            if not getter.done():
+                getter.cancel()
+        if not done:
+            raise asyncio.QueueEmpty
+        if getter.cancelled():
+            return _WAKE_UP
+        return getter.result()
+
+    def _on_state_changed(self) -> None:
+        super()._on_state_changed()
+        if not self.is_running():
+            for getter in self._getters:
+                getter.cancel()
+
+
+def submit_threadsafe(
+        coro: Awaitable,
+        loop: asyncio.AbstractEventLoop
+) -> concurrent.futures.Future:
+    """
+    Submits a coroutine from any thread, e.g. a TaskWorkerThread, to the given
+    event loop and returns a future for its result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+
+
+def put_threadsafe(
+        tasks: asyncio.Queue,
+        item: Any,
+        loop: asyncio.AbstractEventLoop
+) -> concurrent.futures.Future:
+    """
+    Puts an item from any thread into an asyncio.Queue served by the given
+    event loop. The returned future completes once the item was queued.
+    """
+    return asyncio.run_coroutine_threadsafe(tasks.put(item), loop)
+
+
+async def put_async(tasks: queue.Queue, item: Any) -> None:
+    """
+    Puts an item from a coroutine into a queue.Queue served by worker threads
+    without blocking the event loop.
+    """
+    try:
+        tasks.put_nowait(item)
+    except queue.Full:
+        await asyncio.get_running_loop().run_in_executor(None, tasks.put, item)
@@ -1,75 +1,165 @@
 """
 Thread-control extensions.
 """
-from threading import Event
-from typing import Optional
-from transitions import Machine, State
+from threading import Event, RLock
+from typing import Any, Dict, Optional, Tuple
+from transitions import State
+from transitions.core import MachineError
+from src.worker_threads.metrics import (
+    MetricsRegistry,
+    WorkerMetrics,
+    registry as default_registry,
+    worker_name
+)
 
 
-class ThreadControlMixin(Machine):
+# Maps (trigger, source state) onto (destination state, before hook, after hook)
+TransitionTable = Dict[Tuple[str, str], Tuple[str, Optional[str], Optional[str]]]
+
+
+class ThreadControlMixin:
     """
     This class implements a state machine allowing thread objects to make use of
     additional control states to enable pause, resume and stop events at runtime.
     """
+    __slots__ = (
+        "_running", "_wake", "_state", "_state_lock", "_metrics", "_group", "__weakref__"
+    )
+
     INITIAL = State("initial")
     RUNNING = State("running")
     STOPPED = State("stopped")
     PAUSED = State("paused")
 
+    # One transition table shared by all instances of the class
+    _TRANSITIONS: TransitionTable = {
+        ("running", INITIAL.name): (RUNNING.name, "_before_running_state", None),
+        ("pause", PAUSED.name): (PAUSED.name, None, None),
+        ("pause", RUNNING.name): (PAUSED.name, "_before_paused_state", None),
+        ("resume", RUNNING.name): (RUNNING.name, None, None),
+        ("resume", PAUSED.name): (RUNNING.name, "_before_running_state", None),
+        ("stop", STOPPED.name): (STOPPED.name, None, None),
+        ("stop", RUNNING.name): (STOPPED.name, None, "_after_stopped_state"),
+        ("stop", PAUSED.name): (STOPPED.name, None, "_after_stopped_state"),
+    }
+
     def __init__(self) -> None:
         self._running = Event()
-        Machine.__init__(
-            self,
-            states=[
-                self.INITIAL,
-                self.RUNNING,
-                self.STOPPED,
-                self.PAUSED
-            ],
-            initial=self.INITIAL.name
-        )
-        self.add_transition(
-            trigger="running",
-            source=self.INITIAL.name,
-            dest=self.RUNNING.name,
-            before="_before_running_state"
-        )
-        self.add_transition(
-            trigger="pause",
-            source=self.PAUSED.name,
-            dest="="
-        )
-        self.add_transition(
-            trigger="pause",
-            source=self.RUNNING.name,
-            dest=self.PAUSED.name,
-            before="_before_paused_state"
-        )
-        self.add_transition(
-            trigger="resume",
-            source=self.RUNNING.name,
-            dest="="
-        )
-        self.add_transition(
-            trigger="resume",
-            source=self.PAUSED.name,
-            dest=self.RUNNING.name,
-            before="_before_running_state"
-        )
-        self.add_transition(
-            trigger="stop",
-            source=self.STOPPED.name,
-            dest="="
-        )
-        self.add_transition(
-            trigger="stop",
-            source=[self.RUNNING.name, self.PAUSED.name],
-            dest=self.STOPPED.name,
-            after="_after_stopped_state"
+        self._wake = Event()
+        self._state = self.INITIAL.name
+        self._state_lock = RLock()
+        self._metrics = None  # type: Optional[WorkerMetrics]
+        # Worker group, whose control states apply on top of the own ones
+        self._group = None  # type: Optional[Any]
+
+    @property
+    def state(self) -> str:
+        """
+        Returns the name of the current state. A running member of a paused
+        or stopped worker group is paused or stopped as well.
+        """
+        state = self._state
+        group = self._group
+        if group is None or state == "initial" or state == "stopped":
+            return state
+        return "stopped" if group._state == "stopped" else \
+            "paused" if group._state == "paused" else state
+
+    def is_initial(self) -> bool:
+        return self._state == "initial"
+
+    def is_running(self) -> bool:
+        group = self._group
+        return self._state == "running" and (group is None or group._state == "running")
+
+    def is_paused(self) -> bool:
+        return self.state == "paused"
+
+    def is_stopped(self) -> bool:
+        group = self._group
+        return self._state == "stopped" or (
+            group is not None and group._state == "stopped" and self._state != "initial"
         )
 
+    def running(self) -> bool:
+        return self._trigger("running")
+
+    def pause(self) -> bool:
+        return self._trigger("pause")
+
+    def resume(self) -> bool:
+        return self._trigger("resume")
+
+    def stop(self) -> bool:
+        return self._trigger("stop")
+
     def wait(self, timeout: Optional[float] = None) -> bool:
-        return self._running.wait(timeout=timeout)
+        group = self._group
+        if group is None:
+            return self._running.wait(timeout=timeout)
+        return group._wait(self, timeout)
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Sleeps for the given number of seconds while the object is running.
+        Returns False as soon as a control event changed the state, so delays
+        never hold off a pause or stop.
+        """
+        if seconds <= 0.0:
+            # Even a zero sleep costs tens of microseconds due to timer slack
+            return self.is_running()
+        self._wake.clear()
+        # A state change after clearing the flag sets it again
+        if not self.is_running():
+            return False
+        return not self._wake.wait(timeout=seconds)
+
+    @property
+    def metrics(self) -> Optional[WorkerMetrics]:
+        """
+        Returns the object's metrics or None if metrics are disabled.
+        """
+        return self._metrics
+
+    def enable_metrics(self, registry: Optional[MetricsRegistry] = None) -> WorkerMetrics:
+        """
+        Starts collecting metrics and adds the object to the given registry,
+        by default the package-wide one.
+        """
+        with self._state_lock:
+            if self._metrics is None:
+                self._metrics = WorkerMetrics(worker_name(self), self._state)
+        (registry if registry is not None else default_registry).register(self)
+        return self._metrics
+
+    def disable_metrics(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """
+        Stops collecting metrics and removes the object from the given registry,
+        by default the package-wide one.
+        """
+        with self._state_lock:
+            self._metrics = None
+        (registry if registry is not None else default_registry).unregister(self)
+
+    def _trigger(self, trigger: str) -> bool:
+        with self._state_lock:
+            try:
+                dest, before, after = self._TRANSITIONS[(trigger, self._state)]
+            except KeyError:
+                raise MachineError(
+                    f"Can't trigger event {trigger} from state {self._state}!"
+                ) from None
+            if before is not None:
+                getattr(self, before)()
+            if self._metrics is not None and dest != self._state:
+                self._metrics.enter_state(dest)
+            changed = dest != self._state
+            self._state = dest
+            if changed:
+                self._wake.set()
+            if after is not None:
+                getattr(self, after)()
+        return True
 
     def _after_stopped_state(self) -> None:
         if not self._running.is_set():
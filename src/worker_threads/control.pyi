@@ -1,14 +1,23 @@
-from transitions import Machine, State
-from threading import Event
-from typing import Optional
+from transitions import State
+from threading import Event, RLock
+from typing import Any, Dict, Optional, Tuple
+from src.worker_threads.metrics import MetricsRegistry, WorkerMetrics
 
+TransitionTable = Dict[Tuple[str, str], Tuple[str, Optional[str], Optional[str]]]
 
-class ThreadControlMixin(Machine):
+
+class ThreadControlMixin:
     INITIAL: State
-    RUNNING = State
-    STOPPED = State
-    PAUSED = State
+    RUNNING: State
+    STOPPED: State
+    PAUSED: State
+    _TRANSITIONS: TransitionTable
     _running: Event
+    _wake: Event
+    _state: str
+    _state_lock: RLock
+    _metrics: Optional[WorkerMetrics]
+    _group: Optional[Any]
     def __init__(self) -> None: ...
     @property
     def state(self) -> str: ...
@@ -16,11 +25,17 @@ class ThreadControlMixin(Machine):
     def is_running(self) -> bool: ...
     def is_paused(self) -> bool: ...
     def is_stopped(self) -> bool: ...
-    def running(self) -> None: ...
-    def pause(self) -> None: ...
-    def resume(self) -> None: ...
-    def stop(self) -> None: ...
+    def running(self) -> bool: ...
+    def pause(self) -> bool: ...
+    def resume(self) -> bool: ...
+    def stop(self) -> bool: ...
     def wait(self, timeout: Optional[float] = None) -> bool: ...
+    def sleep(self, seconds: float) -> bool: ...
+    @property
+    def metrics(self) -> Optional[WorkerMetrics]: ...
+    def enable_metrics(self, registry: Optional[MetricsRegistry] = None) -> WorkerMetrics: ...
+    def disable_metrics(self, registry: Optional[MetricsRegistry] = None) -> None: ...
+    def _trigger(self, trigger: str) -> bool: ...
     def _after_stopped_state(self) -> None: ...
     def _before_running_state(self) -> None: ...
     def _before_paused_state(self) -> None: ...
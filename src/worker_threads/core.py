@@ -2,15 +2,86 @@
 Thread based handlers.
 """
 import abc
+import heapq
+import itertools
+import math
 import queue
 import time
-from threading import Thread, Event
+from dataclasses import dataclass, replace
+from threading import Thread, Event, current_thread
 from typing import (
     Any,
     Callable,
-    Optional
+    List,
+    Optional,
+    Tuple
 )
 from src.worker_threads.control import ThreadControlMixin
+from src.worker_threads.errors import DeadLetter, ErrorPolicy, ErrorStats
+from src.worker_threads.futures import Future, _FutureTask, submit
+from src.worker_threads.queues import PriorityTaskQueue, _Retry
+from src.worker_threads.ratelimit import TokenBucket
+
+
+# Returned instead of a task, if a control event interrupted a blocking get
+_WAKE_UP = object()
+
+# First step of an adaptive cadence backing off from a delay of zero
+_MIN_ADAPTIVE_DELAY = 0.001
+
+
+def _await_stopped(worker: Thread, timeout: float) -> bool:
+    # Waits for a stopped worker to end, unless the worker stops itself
+    if worker is current_thread():
+        return False
+    worker.join(timeout)
+    return not worker.is_alive()
+
+
+def _take_tokens(worker: Any, tokens: int) -> bool:
+    # Waits until the worker's rate limit grants the tokens, interrupted by
+    # control events and changes of the limit. Returns False once stopped.
+    limit = worker._rate_limit  # pylint: disable=protected-access
+    wake_up = worker._wake      # pylint: disable=protected-access
+    metrics = worker.metrics
+    started = time.perf_counter_ns() if metrics is not None else 0
+    try:
+        while True:
+            wake_up.clear()
+            if worker.is_stopped():
+                return False
+            if not worker.is_running():
+                if not worker.wait(worker.timeout):
+                    # Paused for too long
+                    return False
+                continue
+            # pylint: disable=protected-access
+            wait = limit._wait(wake_up, tokens)
+            if wait == 0.0:
+                return True
+            wake_up.wait(wait)
+    finally:
+        limit._done_waiting(wake_up)  # pylint: disable=protected-access
+        if metrics is not None:
+            metrics.sleep_ns += time.perf_counter_ns() - started
+
+
+@dataclass
+class CycleStats:
+    """
+    Scheduling statistics of a cycle worker. Jitter is the time between the
+    scheduled and the actual start of a cycle.
+    """
+    cycles: int = 0
+    overruns: int = 0
+    missed_ticks: int = 0
+    last_jitter: float = 0.0
+    max_jitter: float = 0.0
+    total_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.cycles if self.cycles else 0.0
 
 
 class CycleWorkerThread(Thread, ThreadControlMixin):
@@ -18,6 +89,13 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
     This class represents a special thread type, which executes a predefined
     routine cyclically until a stop event is triggered.
     """
+    FIXED_DELAY = "fixed_delay"
+    FIXED_RATE = "fixed_rate"
+
+    SKIP = "skip"
+    CATCH_UP = "catch_up"
+    COALESCE = "coalesce"
+
     def __init__(
             self,
             delay: float = 0.0,
@@ -25,7 +103,13 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
             target: Optional[Callable] = None,
             args: tuple = (),
             kwargs=None,
-            daemon: Optional[bool] = None
+            daemon: Optional[bool] = None,
+            schedule: str = FIXED_DELAY,
+            missed_tick_policy: str = SKIP,
+            error_policy: Optional[ErrorPolicy] = None,
+            rate_limit: Optional[TokenBucket] = None,
+            max_delay: Optional[float] = None,
+            delay_factor: float = 2.0
     ) -> None:
         """
         Initializes CycleWorkerThread class.
@@ -34,11 +118,23 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
         ThreadControlMixin.__init__(self)
         self._timeout = timeout
         self._delay = delay
+        self.max_delay = max_delay
+        self.delay_factor = delay_factor
+        self._current_delay = delay
+        self.schedule = schedule
+        self.missed_tick_policy = missed_tick_policy
         self._target = target
         self._args = args
         self._kwargs = kwargs if kwargs is not None else {}
         self._task_done = Event()
         self._task_done.set()
+        self._stats = CycleStats()
+        self._next_tick = time.monotonic()
+        self.error_policy = error_policy
+        self.rate_limit = rate_limit
+        self._error_stats = ErrorStats()
+        self._failures_in_row = 0
+        self._backoff = 0.0
 
     def __repr__(self) -> str:
         string: str = super().__repr__()
@@ -56,12 +152,35 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
             while not self.is_stopped():
                 if not self.wait(self._timeout):
                     break
+                if self._rate_limit is not None and not _take_tokens(self, 1):
+                    break
                 self._task_done.clear()
+                metrics = self._metrics
+                started = time.perf_counter_ns() if metrics is not None else 0
                 try:
-                    self.run_routine()
+                    self._record_cycle()
+                    found_work = self.run_routine()
+                except BaseException as error:
+                    if metrics is not None:
+                        metrics.record_failure(time.perf_counter_ns() - started)
+                    self._error_stats.failures += 1
+                    if self._error_policy is None or not isinstance(error, Exception):
+                        raise
+                    self._handle_failure(self._error_policy, error)
+                else:
+                    self._failures_in_row = 0
+                    if self._max_delay is not None:
+                        self._adapt(self._max_delay, found_work)
+                    if metrics is not None:
+                        metrics.record(time.perf_counter_ns() - started)
                 finally:
                     self._task_done.set()
-                time.sleep(self._delay)
+                if metrics is not None:
+                    started = time.perf_counter_ns()
+                    self._sleep_until_next_tick()
+                    metrics.sleep_ns += time.perf_counter_ns() - started
+                else:
+                    self._sleep_until_next_tick()
             self.post_processing()
         finally:
             self.stop()
@@ -69,9 +188,10 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
             # an argument that has a member that points to the thread.
             del self._target, self._args, self._kwargs
 
-    def run_routine(self) -> None:
+    def run_routine(self) -> Optional[bool]:
         """
-        Representing the worker's activity on each cycle.
+        Representing the worker's activity on each cycle. With an adaptive
+        cadence, returning False reports a cycle without any work.
 
         You may override this method in a subclass. The run_routine() method
         invokes the callable object passed to the object's constructor as the
@@ -79,18 +199,135 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
         from the args and kwargs arguments, respectively.
         """
         if self._target:
-            self._target(*self._args, **self._kwargs)
-        else:
-            self.stop()
+            found_work = self._target(*self._args, **self._kwargs)  # type: Optional[bool]
+            return found_work
+        self.stop()
+        return None
 
     def is_working(self) -> bool:
         return not self._task_done.is_set()
 
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops the worker, interrupting its delay. With a `timeout`, waits up to
+        `timeout` seconds for the current cycle to finish and returns whether
+        the worker ended.
+        """
+        result = super().stop()
+        if timeout is None:
+            return result
+        return self._await_stopped(timeout)
+
+    def _await_stopped(self, timeout: float) -> bool:
+        return _await_stopped(self, timeout)
+
+    def _before_running_state(self) -> None:
+        # Realign the schedule, a pause is not a missed tick
+        self._next_tick = time.monotonic()
+        super()._before_running_state()
+
+    def _record_cycle(self) -> None:
+        stats = self._stats
+        jitter = max(0.0, time.monotonic() - self._next_tick)
+        stats.cycles += 1
+        stats.last_jitter = jitter
+        stats.total_jitter += jitter
+        stats.max_jitter = max(stats.max_jitter, jitter)
+
+    def _handle_failure(self, policy: ErrorPolicy, error: Exception) -> None:
+        self._failures_in_row += 1
+        if policy.retries(error, self._failures_in_row):
+            # The next cycle is delayed by the backoff instead of the delay
+            self._error_stats.retries += 1
+            self._backoff = policy.backoff_for(self._failures_in_row)
+            return
+        self._error_stats.dead_letters += 1
+        if policy.dead_letters is not None:
+            policy.dead_letters.put(DeadLetter(None, error, self._failures_in_row))
+        self._failures_in_row = 0
+
+    def _adapt(self, max_delay: float, found_work: Optional[bool]) -> None:
+        if found_work is False:
+            # Back off exponentially while idle
+            current = max(self._current_delay, _MIN_ADAPTIVE_DELAY) * self._delay_factor
+            self._current_delay = max(self._delay, min(max_delay, current))
+        else:
+            self._current_delay = self._delay
+
+    def _sleep_until_next_tick(self) -> None:
+        if self._backoff > 0.0:
+            backoff, self._backoff = self._backoff, 0.0
+            self._next_tick = time.monotonic() + backoff
+            self.sleep(backoff)
+            return
+        period = self._delay if self._max_delay is None else self._current_delay
+        if self._schedule == self.FIXED_DELAY or period <= 0.0:
+            self._next_tick = time.monotonic() + period
+            self.sleep(period)
+            return
+        self._next_tick += period
+        now = time.monotonic()
+        if now > self._next_tick:
+            self._stats.overruns += 1
+            behind = int((now - self._next_tick) // period)
+            if self._missed_tick_policy == self.SKIP:
+                # Continue with the next tick in the future
+                self._stats.missed_ticks += behind + 1
+                self._next_tick += (behind + 1) * period
+            elif self._missed_tick_policy == self.COALESCE:
+                # Run once right now for all ticks passed
+                self._stats.missed_ticks += behind
+                self._next_tick += behind * period
+        remaining = self._next_tick - time.monotonic()
+        if remaining > 0.0:
+            self.sleep(remaining)
+
+    @property
+    def error_stats(self) -> ErrorStats:
+        """
+        Returns a snapshot of the worker's error statistics.
+        """
+        return replace(self._error_stats)
+
+    @property
+    def error_policy(self) -> Optional[ErrorPolicy]:
+        """
+        Indicates how the worker deals with a failing routine. Without a
+        policy, an exception of the routine ends the worker. With a policy,
+        the routine is retried after a backoff, until it failed `max_attempts`
+        times in a row, and then continues on its regular schedule.
+        """
+        return self._error_policy
+
+    @error_policy.setter
+    def error_policy(self, error_policy: Optional[ErrorPolicy]) -> None:
+        self._error_policy = error_policy
+
+    @property
+    def rate_limit(self) -> Optional[TokenBucket]:
+        """
+        Indicates the token bucket limiting the rate of cycles, which may be
+        shared with other workers. Each cycle takes one token.
+        """
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, rate_limit: Optional[TokenBucket]) -> None:
+        self._rate_limit = rate_limit
+
+    @property
+    def cycle_stats(self) -> CycleStats:
+        """
+        Returns a snapshot of the worker's scheduling statistics.
+        """
+        return replace(self._stats)
+
     @property
     def delay(self) -> float:
         """
         Indicates how much time shall pass before the worker continues with
-        the next cycle.
+        the next cycle. With a fixed rate schedule the delay is the period
+        between the starts of two cycles.
         """
         return self._delay
 
@@ -99,6 +336,72 @@ class CycleWorkerThread(Thread, ThreadControlMixin):
         if delay < 0.0:
             raise ValueError("Delay must be non-negative")
         self._delay = delay
+        self._current_delay = delay
+
+    @property
+    def max_delay(self) -> Optional[float]:
+        """
+        Indicates the longest delay of an adaptive cadence. While cycles
+        report no work, the delay grows by `delay_factor` per cycle up to this
+        bound and drops back to `delay` as soon as a cycle finds work. None
+        keeps the delay constant.
+        """
+        return self._max_delay
+
+    @max_delay.setter
+    def max_delay(self, max_delay: Optional[float]) -> None:
+        if max_delay is not None and max_delay < 0.0:
+            raise ValueError("Max delay must be non-negative")
+        self._max_delay = max_delay
+
+    @property
+    def delay_factor(self) -> float:
+        """
+        Indicates by which factor an adaptive cadence grows per idle cycle.
+        """
+        return self._delay_factor
+
+    @delay_factor.setter
+    def delay_factor(self, delay_factor: float) -> None:
+        if delay_factor < 1.0:
+            raise ValueError("Delay factor must be at least one")
+        self._delay_factor = delay_factor
+
+    @property
+    def current_delay(self) -> float:
+        """
+        Returns the delay applied after the last cycle, which differs from
+        `delay` with an adaptive cadence only.
+        """
+        return self._delay if self._max_delay is None else self._current_delay
+
+    @property
+    def schedule(self) -> str:
+        """
+        Indicates whether the delay is applied after each cycle (fixed_delay)
+        or between the starts of two cycles (fixed_rate).
+        """
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, schedule: str) -> None:
+        if schedule not in (self.FIXED_DELAY, self.FIXED_RATE):
+            raise ValueError(f"Unknown schedule {schedule!r}")
+        self._schedule = schedule
+
+    @property
+    def missed_tick_policy(self) -> str:
+        """
+        Indicates how a fixed rate worker deals with ticks missed due to an
+        overrun: skip them, catch up in a burst or coalesce them into one cycle.
+        """
+        return self._missed_tick_policy
+
+    @missed_tick_policy.setter
+    def missed_tick_policy(self, policy: str) -> None:
+        if policy not in (self.SKIP, self.CATCH_UP, self.COALESCE):
+            raise ValueError(f"Unknown missed tick policy {policy!r}")
+        self._missed_tick_policy = policy
 
     @property
     def timeout(self) -> float:
@@ -135,7 +438,12 @@ class TaskWorkerThread(Thread, ThreadControlMixin):
             tasks: queue.Queue,
             delay: float = 0.0,
             timeout: float = 1000.0,
-            daemon: Optional[bool] = None
+            daemon: Optional[bool] = None,
+            max_batch_size: int = 1,
+            max_batch_latency: float = 0.0,
+            idle_timeout: Optional[float] = None,
+            error_policy: Optional[ErrorPolicy] = None,
+            rate_limit: Optional[TokenBucket] = None
     ) -> None:
         """
         Initializes TaskWorkerThread class.
@@ -145,6 +453,19 @@ class TaskWorkerThread(Thread, ThreadControlMixin):
         self._timeout = timeout
         self._delay = delay
         self._queue = tasks
+        # Tasks of a priority queue keep their priority and deadline for retries
+        self._priority_queue = tasks if isinstance(tasks, PriorityTaskQueue) \
+            else None  # type: Optional[PriorityTaskQueue]
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency = max_batch_latency
+        self.idle_timeout = idle_timeout
+        self.error_policy = error_policy
+        self.rate_limit = rate_limit
+        self._error_stats = ErrorStats()
+        # Heap of (due time, sequence number, retry) of failed tasks
+        self._retries = []  # type: List[Tuple[float, int, _Retry]]
+        self._retry_sequence = itertools.count()
+        self._draining = False
         self._task_done = Event()
         self._task_done.set()
 
@@ -162,32 +483,307 @@ class TaskWorkerThread(Thread, ThreadControlMixin):
         try:
             self.preparation()
             while not self.is_stopped():
-                if self._queue.empty() or not self.wait(self._timeout):
+                if ((self._idle_timeout is None or self._draining) and
+                        self._queue.empty() and not self._retries) or \
+                        not self.wait(self._timeout):
                     break
-                self._task_done.clear()
                 try:
-                    task = self._queue.get()
-                    self.run_task(task)
+                    task = self._next_task()
                 except queue.Empty:
                     break
+                if task is _WAKE_UP:
+                    continue
+                tasks = self._collect_batch(task) if self._max_batch_size > 1 else [task]
+                if self._rate_limit is not None and not _take_tokens(self, len(tasks)):
+                    self._hand_back(tasks)
+                    break
+                self._task_done.clear()
+                metrics = self._metrics
+                started = time.perf_counter_ns() if metrics is not None else 0
+                try:
+                    done, failed = self._execute(tasks)
+                except BaseException:
+                    if metrics is not None:
+                        metrics.record_failure(time.perf_counter_ns() - started, len(tasks))
+                    raise
                 else:
-                    self._queue.task_done()
+                    if metrics is not None:
+                        if failed:
+                            metrics.record_failure(time.perf_counter_ns() - started, done)
+                        elif done:
+                            metrics.record(time.perf_counter_ns() - started, done)
                 finally:
                     self._task_done.set()
-                time.sleep(self._delay)
+                if metrics is not None:
+                    started = time.perf_counter_ns()
+                    self.sleep(self._delay)
+                    metrics.sleep_ns += time.perf_counter_ns() - started
+                else:
+                    self.sleep(self._delay)
             self.post_processing()
         finally:
+            self._release_retries()
             self.stop()
 
+    def pause(self) -> bool:
+        result = super().pause()
+        self._wake_up()
+        return result
+
+    def stop(self, timeout: Optional[float] = None, drain: bool = False) -> bool:
+        """
+        Stops the worker, interrupting its delay or a blocking wait for tasks.
+        With `drain`, the worker first processes all tasks left in its queue,
+        including pending retries, and ends as soon as the queue is empty; a
+        paused worker is resumed for that. With a `timeout`, waits up to
+        `timeout` seconds for the worker to end and returns whether it did. A
+        draining worker, which is still busy by then, is stopped right away and
+        abandons the remaining tasks.
+        """
+        if drain and self.is_alive() and not self.is_stopped() and \
+                current_thread() is not self:
+            self._draining = True
+            if self.is_paused():
+                self.resume()
+            self._wake_up()
+            if timeout is None or self._await_stopped(timeout):
+                return True
+            timeout = 0.0
+        result = super().stop()
+        self._wake_up()
+        if timeout is None:
+            return result
+        return self._await_stopped(timeout)
+
+    def submit(self, task: Any, **kwargs: Any) -> Future:
+        """
+        Puts the task into the worker's queue and returns a future, which
+        receives the return value of run_task() or the exception raised.
+        """
+        if self.is_stopped():
+            raise RuntimeError("Cannot submit tasks to a stopped worker")
+        return submit(self._queue, task, **kwargs)
+
     @abc.abstractmethod
-    def run_task(self, task: Any) -> None:
+    def run_task(self, task: Any) -> Any:
+        """
+        Abstract method representing the worker's activity on all task. The
+        return value is the result of a submitted task.
         """
-        Abstract method representing the worker's activity on all task.
+
+    def run_batch(self, tasks: List[Any]) -> Optional[List[Any]]:
+        """
+        Representing the worker's activity on a batch of tasks, if batch mode
+        is enabled by a `max_batch_size` greater than one. Returns the results
+        of all tasks in order or None.
+
+        You may override this method in a subclass. By default run_task() is
+        called for each task of the batch.
         """
+        return [self.run_task(task) for task in tasks]
 
     def is_working(self) -> bool:
         return not self._task_done.is_set()
 
+    @property
+    def draining(self) -> bool:
+        """
+        Indicates whether the worker ends as soon as its queue is empty.
+        """
+        return self._draining
+
+    def _await_stopped(self, timeout: float) -> bool:
+        return _await_stopped(self, timeout)
+
+    def _next_task(self) -> Any:
+        retry = self._due_retry()
+        if retry is not None:
+            return retry
+        if (self._idle_timeout is None or self._draining) and not self._retries:
+            return self._get_task(False)
+        deadline = None if self._idle_timeout is None or math.isinf(self._idle_timeout) \
+            else time.monotonic() + self._idle_timeout
+        not_empty = self._queue.not_empty
+        while True:
+            with not_empty:
+                while True:
+                    if not self.is_running():
+                        return _WAKE_UP
+                    # pylint: disable=protected-access
+                    if self._queue._qsize():
+                        break
+                    if self._draining and not self._retries:
+                        raise queue.Empty
+                    # Waits at most until the next retry is due
+                    wake_up = deadline
+                    if self._retries:
+                        due = self._retries[0][0]
+                        wake_up = due if wake_up is None else min(wake_up, due)
+                    if wake_up is None:
+                        not_empty.wait()
+                        continue
+                    remaining = wake_up - time.monotonic()
+                    if remaining <= 0.0:
+                        retry = self._due_retry()
+                        if retry is not None:
+                            return retry
+                        raise queue.Empty
+                    not_empty.wait(remaining)
+            try:
+                return self._get_task(False)
+            except queue.Empty:
+                # Another consumer was faster, keep on waiting
+                continue
+
+    def _execute(self, tasks: List[Any]) -> Tuple[int, bool]:
+        # Returns the number of tasks processed and whether they failed.
+        # Exceptions of submitted tasks are passed to their futures instead of
+        # being raised, cancelled ones are skipped.
+        entries = []  # type: List[_Retry]
+        futures = []  # type: List[Optional[Future]]
+        items = []    # type: List[Any]
+        now = None  # type: Optional[float]
+        for task in tasks:
+            entry = task if isinstance(task, _Retry) else _Retry(task, 0)
+            task = entry.item
+            if entry.deadline is not None:
+                if now is None:
+                    now = time.monotonic()
+                if entry.deadline <= now and self._priority_queue is not None:
+                    # pylint: disable=protected-access
+                    self._priority_queue._expire(entry.item, entry.priority)
+                    continue
+            if entry.attempts == 0 and isinstance(task, _FutureTask) and \
+                    not task.future.set_running_or_notify_cancel():
+                self._queue.task_done()
+                continue
+            entries.append(entry)
+            if isinstance(task, _FutureTask):
+                futures.append(task.future)
+                items.append(task.task)
+            else:
+                futures.append(None)
+                items.append(task)
+        if not items:
+            return 0, False
+        try:
+            if self._max_batch_size > 1:
+                results = self.run_batch(items)
+            else:
+                results = [self.run_task(items[0])]
+        except Exception as error:  # pylint: disable=broad-except
+            self._error_stats.failures += len(items)
+            if self._error_policy is not None:
+                for entry, future, item in zip(entries, futures, items):
+                    self._handle_failure(self._error_policy, entry, future, item, error)
+                return len(items), True
+            for future in futures:
+                if future is not None:
+                    future.set_exception(error)
+            for _ in items:
+                self._queue.task_done()
+            if None in futures:
+                raise
+            return len(items), True
+        if results is None or len(results) != len(items):
+            results = [None] * len(items)
+        for future, result in zip(futures, results):
+            if future is not None:
+                future.set_result(result)
+        for _ in items:
+            self._queue.task_done()
+        return len(items), False
+
+    def _handle_failure(
+            self,
+            policy: ErrorPolicy,
+            entry: _Retry,
+            future: Optional[Future],
+            task: Any,
+            error: Exception
+    ) -> None:
+        entry.attempts += 1
+        if policy.retries(error, entry.attempts):
+            # The task stays unfinished until its last attempt
+            self._error_stats.retries += 1
+            due = time.monotonic() + policy.backoff_for(entry.attempts)
+            heapq.heappush(self._retries, (due, next(self._retry_sequence), entry))
+            return
+        self._error_stats.dead_letters += 1
+        if future is not None:
+            future.set_exception(error)
+        if policy.dead_letters is not None:
+            policy.dead_letters.put(DeadLetter(task, error, entry.attempts))
+        self._queue.task_done()
+
+    def _due_retry(self) -> Optional[_Retry]:
+        if self._retries and self._retries[0][0] <= time.monotonic():
+            return heapq.heappop(self._retries)[2]
+        return None
+
+    def _get_task(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        if self._priority_queue is None:
+            return self._queue.get(block, timeout)
+        entry = self._priority_queue._get_entry(block, timeout)  # pylint: disable=protected-access
+        task = entry.item
+        if not isinstance(task, _Retry):
+            task = _Retry(task, 0)
+        task.priority = entry.priority
+        task.deadline = entry.deadline
+        return task
+
+    def _hand_back(self, tasks: List[Any]) -> None:
+        # Tasks, which were taken but not run, are due at once and returned to
+        # the queue together with pending retries once the worker ends
+        now = time.monotonic()
+        for task in tasks:
+            entry = task if isinstance(task, _Retry) else _Retry(task, 0)
+            heapq.heappush(self._retries, (now, next(self._retry_sequence), entry))
+
+    def _release_retries(self) -> None:
+        # Hands pending retries back to the queue, so other workers take over.
+        # Retries, which do not fit into a full queue, stay with the worker
+        # instead of blocking its end.
+        while self._retries:
+            entry = self._retries[0][2]
+            # Tasks handed back before their first attempt go back unwrapped
+            item = entry if entry.attempts else entry.item
+            try:
+                if self._priority_queue is not None:
+                    self._priority_queue.put(item, False, priority=entry.priority,
+                                             deadline=entry.deadline)
+                else:
+                    self._queue.put(item, False)
+            except queue.Full:
+                break
+            heapq.heappop(self._retries)
+            self._queue.task_done()
+
+    def _wake_up(self) -> None:
+        with self._queue.not_empty:
+            self._queue.not_empty.notify_all()
+
+    def _collect_batch(self, task: Any) -> List[Any]:
+        # Waits for further tasks until the batch latency passed or a control
+        # event interrupts, the tasks collected so far are run in any case
+        tasks = [task]
+        deadline = time.monotonic() + self._max_batch_latency
+        not_empty = self._queue.not_empty
+        while len(tasks) < self._max_batch_size:
+            try:
+                tasks.append(self._get_task(False))
+                continue
+            except queue.Empty:
+                pass
+            with not_empty:
+                # pylint: disable=protected-access
+                while not self._queue._qsize():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0 or not self.is_running():
+                        return tasks
+                    not_empty.wait(remaining)
+        return tasks
+
     @property
     def delay(self) -> float:
         """
@@ -202,6 +798,80 @@ class TaskWorkerThread(Thread, ThreadControlMixin):
             raise ValueError("Delay must be non-negative")
         self._delay = delay
 
+    @property
+    def error_stats(self) -> ErrorStats:
+        """
+        Returns a snapshot of the worker's error statistics.
+        """
+        return replace(self._error_stats)
+
+    @property
+    def error_policy(self) -> Optional[ErrorPolicy]:
+        """
+        Indicates how the worker deals with failing tasks. Without a policy,
+        an exception of a task, which was not submitted, ends the worker.
+        """
+        return self._error_policy
+
+    @error_policy.setter
+    def error_policy(self, error_policy: Optional[ErrorPolicy]) -> None:
+        self._error_policy = error_policy
+
+    @property
+    def rate_limit(self) -> Optional[TokenBucket]:
+        """
+        Indicates the token bucket limiting the rate of tasks, which may be
+        shared with other workers. Each task takes one token.
+        """
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, rate_limit: Optional[TokenBucket]) -> None:
+        self._rate_limit = rate_limit
+
+    @property
+    def idle_timeout(self) -> Optional[float]:
+        """
+        Indicates how much time the worker blocks on an empty queue before it
+        retires. None makes the worker retire as soon as the queue is empty,
+        math.inf keeps it alive until it is stopped.
+        """
+        return self._idle_timeout
+
+    @idle_timeout.setter
+    def idle_timeout(self, idle_timeout: Optional[float]) -> None:
+        if idle_timeout is not None and idle_timeout < 0.0:
+            raise ValueError("Idle timeout must be non-negative")
+        self._idle_timeout = idle_timeout
+
+    @property
+    def max_batch_size(self) -> int:
+        """
+        Indicates how many tasks are passed to run_batch() at most. A value of
+        one disables batch mode.
+        """
+        return self._max_batch_size
+
+    @max_batch_size.setter
+    def max_batch_size(self, max_batch_size: int) -> None:
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be positive")
+        self._max_batch_size = max_batch_size
+
+    @property
+    def max_batch_latency(self) -> float:
+        """
+        Indicates how much time the worker waits at most for a batch to fill
+        up, starting with its first task.
+        """
+        return self._max_batch_latency
+
+    @max_batch_latency.setter
+    def max_batch_latency(self, max_batch_latency: float) -> None:
+        if max_batch_latency < 0.0:
+            raise ValueError("Max batch latency must be non-negative")
+        self._max_batch_latency = max_batch_latency
+
     @property
     def timeout(self) -> float:
         """
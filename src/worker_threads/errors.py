@@ -0,0 +1,67 @@
+"""
+Error handling policies for workers.
+"""
+import queue
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple, Type
+
+
+@dataclass
+class ErrorPolicy:
+    """
+    Describes how a worker deals with exceptions of its routine or tasks. A
+    failing task is attempted up to `max_attempts` times in total, waiting
+    `backoff` seconds before the first retry, multiplied by `backoff_factor`
+    for each further retry. Tasks failing for good or with an exception not
+    in `retry_on` are put into `dead_letters` as DeadLetter, if given.
+    """
+    max_attempts: int = 1
+    backoff: float = 0.1
+    backoff_factor: float = 2.0
+    max_backoff: float = 60.0
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    dead_letters: Optional[queue.Queue] = None
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("Max attempts must be positive")
+        if self.backoff < 0.0 or self.max_backoff < 0.0:
+            raise ValueError("Backoff must be non-negative")
+        if self.backoff_factor < 1.0:
+            raise ValueError("Backoff factor must be at least one")
+
+    def retries(self, error: BaseException, attempts: int) -> bool:
+        """
+        Indicates whether a task, which failed `attempts` times, is retried.
+        """
+        return attempts < self.max_attempts and isinstance(error, self.retry_on)
+
+    def backoff_for(self, attempts: int) -> float:
+        """
+        Returns the time to wait before retrying a task, which failed
+        `attempts` times.
+        """
+        return min(self.max_backoff, self.backoff * self.backoff_factor ** (attempts - 1))
+
+
+@dataclass
+class DeadLetter:
+    """
+    A task, which failed for good, together with its last exception. The task
+    of a cycle worker is None.
+    """
+    task: Any
+    error: BaseException
+    attempts: int
+
+
+@dataclass
+class ErrorStats:
+    """
+    Error statistics of a worker. Every failed attempt counts as failure.
+    With an error policy, each failure is either retried or put aside as
+    dead letter.
+    """
+    failures: int = 0
+    retries: int = 0
+    dead_letters: int = 0
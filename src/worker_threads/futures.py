@@ -0,0 +1,47 @@
+"""
+Result collection of tasks submitted to task workers.
+"""
+import queue
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    as_completed,
+    wait
+)
+from typing import Any
+
+
+__all__ = [
+    "ALL_COMPLETED",
+    "FIRST_COMPLETED",
+    "FIRST_EXCEPTION",
+    "Future",
+    "as_completed",
+    "submit",
+    "wait"
+]
+
+
+class _FutureTask:
+    """
+    Queue entry carrying a task together with the future of its result.
+    """
+    __slots__ = ("task", "future")
+
+    def __init__(self, task: Any, future: Future) -> None:
+        self.task = task
+        self.future = future
+
+
+def submit(tasks: queue.Queue, task: Any, **kwargs: Any) -> Future:
+    """
+    Puts the task into the given queue of task workers and returns a future,
+    which receives the return value of run_task() or the exception raised.
+    Further keyword arguments are passed to the queue's put() method, e.g. the
+    priority of a PriorityTaskQueue.
+    """
+    future = Future()  # type: Future
+    tasks.put(_FutureTask(task, future), **kwargs)
+    return future
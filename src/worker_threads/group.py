@@ -0,0 +1,172 @@
+"""
+Group control of workers.
+"""
+import time
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional
+)
+from src.worker_threads.control import ThreadControlMixin
+from src.worker_threads.process import ProcessControlMixin
+
+
+@dataclass
+class GroupStatus:
+    """
+    Number of members of a worker group per state. Working members are
+    running a routine or task at the moment, in any state.
+    """
+    total: int = 0
+    initial: int = 0
+    running: int = 0
+    paused: int = 0
+    stopped: int = 0
+    working: int = 0
+
+
+class WorkerGroup(ThreadControlMixin):
+    """
+    This class controls any number of worker threads at once. Members check
+    the group's state on top of their own one, so pausing, resuming or
+    stopping the group is a single state change, which all members see at
+    the same time, instead of one transition per member. Each member can
+    still be paused, resumed and stopped on its own: a member only runs if
+    both the group and the member itself are running.
+
+    Members sleeping through a delay or waiting for tokens of a rate limit
+    are woken up on every change of the group's state, which takes one call
+    per member.
+    """
+    def __init__(self, workers: Iterable[Any] = ()) -> None:
+        """
+        Initializes WorkerGroup class.
+        """
+        ThreadControlMixin.__init__(self)
+        self._members = []  # type: List[Any]
+        self._members_lock = Lock()
+        self.running()
+        for worker in workers:
+            self.add(worker)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({len(self)} members, {self.state!r})>"
+
+    def __len__(self) -> int:
+        with self._members_lock:
+            return len(self._members)
+
+    @property
+    def members(self) -> List[Any]:
+        """
+        Returns a snapshot of all members.
+        """
+        with self._members_lock:
+            return list(self._members)
+
+    def add(self, worker: Any) -> Any:
+        """
+        Adds the given worker thread to the group and returns it. A worker
+        added while sleeping follows the group from its next sleep on.
+        """
+        if not isinstance(worker, Thread) or not isinstance(worker, ThreadControlMixin) or \
+                isinstance(worker, ProcessControlMixin):
+            raise TypeError("Only worker threads can join a worker group")
+        if self.is_stopped():
+            raise RuntimeError("Cannot add workers to a stopped group")
+        with self._members_lock:
+            if worker._group is not None:
+                raise ValueError("Worker is already member of a group")
+            worker._group = self
+            self._members.append(worker)
+        return worker
+
+    def discard(self, worker: Any) -> None:
+        """
+        Removes the given worker from the group, so only its own state applies.
+        """
+        with self._members_lock:
+            if worker._group is not self:
+                return
+            self._members.remove(worker)
+            worker._group = None
+        # The worker may be sleeping while the group is paused
+        worker._wake.set()
+
+    def start(self) -> None:
+        """
+        Starts all members, which are not started yet.
+        """
+        for worker in self.members:
+            if worker.is_initial() and not worker.is_alive():
+                worker.start()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all started members terminated. Returns False, if the
+        timeout expired before.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self.members:
+            if worker.ident is not None:
+                worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(worker.is_alive() for worker in self.members)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops the group and thereby all members. Members blocked on a queue
+        or other event source are woken up, which takes one call per member.
+        With a `timeout`, waits up to `timeout` seconds for all members to end
+        and returns whether they did.
+        """
+        result = super().stop()
+        for worker in self.members:
+            wake_up = getattr(worker, "_wake_up", None)
+            if wake_up is not None:
+                wake_up()
+        if timeout is None:
+            return result
+        return self.join(timeout)
+
+    def status(self) -> GroupStatus:
+        """
+        Returns the number of members per state.
+        """
+        status = GroupStatus()
+        for worker in self.members:
+            status.total += 1
+            setattr(status, worker.state, getattr(status, worker.state) + 1)
+            if worker.is_working():
+                status.working += 1
+        return status
+
+    def _trigger(self, trigger: str) -> bool:
+        with self._state_lock:
+            state = self._state
+            result = super()._trigger(trigger)
+            changed = self._state != state
+        if changed:
+            # Interrupts delays and waits for tokens of all members
+            for worker in self.members:
+                worker._wake.set()
+        return result
+
+    def _after_stopped_state(self) -> None:
+        # Keep the gate open, so members waiting on it see the stop
+        self._running.set()
+
+    def _wait(self, worker: ThreadControlMixin, timeout: Optional[float]) -> bool:
+        # Waits until both the member and the group are running or stopped
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not worker._running.wait(remaining):
+                return False
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._running.wait(remaining):
+                return False
+            if worker._running.is_set():
+                return True
@@ -0,0 +1,177 @@
+"""
+Worker instrumentation.
+"""
+import time
+import weakref
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+
+# Latency bucket i holds durations below 2**i * 1024 ns, the last one is open-ended
+HISTOGRAM_BUCKETS = 32
+
+
+@dataclass
+class MetricsSnapshot:
+    """
+    Point-in-time copy of a worker's metrics. Times are given in seconds,
+    histogram keys are the upper bounds of the latency buckets in seconds.
+    Executed and failed cycles or tasks are counted one by one, while the
+    latencies refer to calls, which handle a whole batch of tasks at once.
+    """
+    name: str
+    state: str
+    executed: int = 0
+    failures: int = 0
+    calls: int = 0
+    busy_time: float = 0.0
+    sleep_time: float = 0.0
+    state_times: Dict[str, float] = field(default_factory=dict)
+    histogram: Dict[float, int] = field(default_factory=dict)
+
+    @property
+    def mean_latency(self) -> float:
+        return self.busy_time / self.calls if self.calls else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """
+        Share of the time in running state spent on routines or tasks.
+        """
+        running = self.state_times.get("running", 0.0)
+        return min(1.0, self.busy_time / running) if running else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Returns the upper bound of the latency bucket containing the given
+        fraction of all calls.
+        """
+        total = sum(self.histogram.values())
+        if not total:
+            return 0.0
+        count = 0
+        for bound, hits in sorted(self.histogram.items()):
+            count += hits
+            if count >= fraction * total:
+                return bound
+        return float("inf")
+
+
+class WorkerMetrics:
+    """
+    This class collects the metrics of one worker. Durations are recorded in
+    integer nanoseconds to keep the overhead per call small.
+    """
+    __slots__ = (
+        "name", "executed", "failures", "calls", "busy_ns", "sleep_ns",
+        "histogram", "_state", "_state_since", "_state_times"
+    )
+
+    def __init__(self, name: str, state: str) -> None:
+        self.name = name
+        self.executed = 0
+        self.failures = 0
+        self.calls = 0
+        self.busy_ns = 0
+        self.sleep_ns = 0
+        self.histogram = [0] * (HISTOGRAM_BUCKETS + 1)  # type: List[int]
+        self._state = state
+        self._state_since = time.monotonic()
+        self._state_times = {}  # type: Dict[str, float]
+
+    def record(self, duration_ns: int, count: int = 1) -> None:
+        """
+        Records one successful call of a routine or task handler, which
+        executed `count` cycles or tasks.
+        """
+        self.executed += count
+        self.calls += 1
+        self.busy_ns += duration_ns
+        bucket = (duration_ns >> 10).bit_length()
+        self.histogram[bucket if bucket < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS] += 1
+
+    def record_failure(self, duration_ns: int, count: int = 1) -> None:
+        """
+        Records one call of a routine or task handler, which raised an
+        exception for `count` cycles or tasks.
+        """
+        self.failures += count
+        self.calls += 1
+        self.busy_ns += duration_ns
+        bucket = (duration_ns >> 10).bit_length()
+        self.histogram[bucket if bucket < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS] += 1
+
+    def enter_state(self, state: str) -> None:
+        now = time.monotonic()
+        self._state_times[self._state] = \
+            self._state_times.get(self._state, 0.0) + now - self._state_since
+        self._state = state
+        self._state_since = now
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Returns a point-in-time copy of the metrics.
+        """
+        state_times = dict(self._state_times)
+        state_times[self._state] = \
+            state_times.get(self._state, 0.0) + time.monotonic() - self._state_since
+        histogram = {
+            (2 ** index * 1024 / 1e9 if index < HISTOGRAM_BUCKETS else float("inf")): hits
+            for index, hits in enumerate(self.histogram) if hits
+        }
+        return MetricsSnapshot(
+            name=self.name,
+            state=self._state,
+            executed=self.executed,
+            failures=self.failures,
+            calls=self.calls,
+            busy_time=self.busy_ns / 1e9,
+            sleep_time=self.sleep_ns / 1e9,
+            state_times=state_times,
+            histogram=histogram
+        )
+
+
+class MetricsRegistry:
+    """
+    This class keeps track of all workers with enabled metrics. Workers are
+    referenced weakly, so the registry does not keep them alive.
+    """
+    def __init__(self) -> None:
+        self._workers = weakref.WeakSet()  # type: weakref.WeakSet
+        self._lock = Lock()
+
+    def register(self, worker: Any) -> None:
+        with self._lock:
+            self._workers.add(worker)
+
+    def unregister(self, worker: Any) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+
+    def snapshot(self) -> List[MetricsSnapshot]:
+        """
+        Returns a snapshot of all registered workers with enabled metrics.
+        """
+        with self._lock:
+            workers = list(self._workers)
+        metrics = (worker.metrics for worker in workers)
+        return [item.snapshot() for item in metrics if item is not None]
+
+
+# Registry used by all workers, unless another one is given
+registry = MetricsRegistry()
+
+
+def worker_name(worker: Any) -> str:
+    """
+    Returns a name identifying the worker within a registry.
+    """
+    name: Optional[str] = getattr(worker, "name", None)
+    return name if name else f"{worker.__class__.__name__}-{id(worker):x}"
@@ -0,0 +1,315 @@
+"""
+Staged pipeline handlers.
+"""
+import math
+import queue
+import time
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+from transitions.core import MachineError
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+from src.worker_threads.errors import ErrorPolicy
+
+
+class PipelineStage:
+    """
+    One stage of a pipeline, consisting of a bounded input queue and a number
+    of workers applying the same function to each item.
+    """
+    def __init__(
+            self,
+            name: str,
+            function: Callable[[Any], Any],
+            workers: int,
+            maxsize: int,
+            tasks: queue.Queue,
+            error_policy: Optional[ErrorPolicy] = None
+    ) -> None:
+        """
+        Initializes PipelineStage class.
+        """
+        self._name = name
+        self._function = function
+        self._error_policy = error_policy
+        self._parallelism = workers
+        self._maxsize = maxsize
+        self._queue = tasks
+        self._output = None   # type: Optional[queue.Queue]
+        self._workers = []    # type: List[_StageWorker]
+        self._dropped = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def parallelism(self) -> int:
+        """
+        Returns the number of workers of the stage.
+        """
+        return self._parallelism
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Returns the number of items the stage's input queue holds at most.
+        """
+        return self._maxsize
+
+    @property
+    def tasks(self) -> queue.Queue:
+        """
+        Returns the input queue of the stage.
+        """
+        return self._queue
+
+    @property
+    def workers(self) -> List[TaskWorkerThread]:
+        return list(self._workers)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns the number of results, which could not be handed on to the
+        full next stage before the workers were stopped.
+        """
+        return self._dropped
+
+    def depth(self) -> int:
+        """
+        Returns the number of items waiting for the stage.
+        """
+        return self._queue.qsize()
+
+
+class _StageWorker(TaskWorkerThread):
+    """
+    Task worker of one stage, forwarding the results to the next stage.
+    """
+    def __init__(self, stage: PipelineStage, daemon: Optional[bool]) -> None:
+        # pylint: disable=protected-access
+        super().__init__(stage.tasks, daemon=daemon, idle_timeout=math.inf,
+                         error_policy=stage._error_policy)
+        self._stage = stage
+
+    def run_task(self, task: Any) -> None:
+        # pylint: disable=protected-access
+        result = self._stage._function(task)
+        output = self._stage._output
+        if result is None or output is None:
+            return
+        # Blocks while the next stage is full, which propagates upstream
+        not_full = output.not_full
+        with not_full:
+            # pylint: disable=protected-access
+            while 0 < output.maxsize <= output._qsize():
+                if self.is_stopped():
+                    # Counted under the lock shared by all workers of the stage
+                    self._stage._dropped += 1
+                    return
+                not_full.wait()
+            output._put(result)
+            output.unfinished_tasks += 1
+            output.not_empty.notify()
+
+    def _wake_up(self) -> None:
+        super()._wake_up()
+        output = self._stage._output  # pylint: disable=protected-access
+        if output is not None:
+            with output.not_full:
+                output.not_full.notify_all()
+
+
+class Pipeline(CycleWorkerThread):
+    """
+    This class represents a supervisor thread, which chains a source, e.g. a
+    file tracker, into one or more stages of task workers. Each stage consumes
+    the results of the previous one, results of None are dropped.
+
+    Every stage's input queue is bounded. A full stage blocks the workers of
+    the previous stage, until the source's output queue fills up and the
+    source is paused. The source is resumed once its backlog dropped to half
+    of the first stage's bound. As the backlog is checked every
+    `check_interval` seconds, the source's queue may exceed the bound by what
+    the source produces within one interval. Stopping does not drain the
+    queues, results stuck in front of a full stage are counted as dropped.
+    """
+    def __init__(
+            self,
+            source: CycleWorkerThread,
+            output: queue.Queue,
+            check_interval: float = 0.01,
+            timeout: float = 1000.0,
+            daemon: Optional[bool] = None
+    ) -> None:
+        """
+        Initializes Pipeline class.
+        """
+        super().__init__(delay=check_interval, timeout=timeout, daemon=daemon)
+        self._source = source
+        self._output = output
+        self._stages = []  # type: List[PipelineStage]
+        self._throttled = False
+        self._control_lock = Lock()
+        self._stop_deadline = None  # type: Optional[float]
+
+    def add_stage(
+            self,
+            name: str,
+            function: Callable[[Any], Any],
+            workers: int = 1,
+            maxsize: int = 1000,
+            error_policy: Optional[ErrorPolicy] = None
+    ) -> PipelineStage:
+        """
+        Appends a stage of `workers` threads applying `function` to each item.
+        At most `maxsize` items are waiting for the stage. Without an
+        `error_policy`, a failing item ends the worker processing it.
+        """
+        if not self.is_initial():
+            raise RuntimeError("Stages must be added before the pipeline is started")
+        if workers < 1:
+            raise ValueError("Workers must be positive")
+        if maxsize < 1:
+            raise ValueError("Max size must be positive")
+        if any(stage.name == name for stage in self._stages):
+            raise ValueError(f"Duplicate stage name {name!r}")
+        if self._stages:
+            tasks = queue.Queue(maxsize)  # type: queue.Queue
+            self._stages[-1]._output = tasks  # pylint: disable=protected-access
+        else:
+            # The source's queue is bounded by pausing the source
+            tasks = self._output
+        stage = PipelineStage(name, function, workers, maxsize, tasks, error_policy)
+        self._stages.append(stage)
+        return stage
+
+    @property
+    def source(self) -> CycleWorkerThread:
+        return self._source
+
+    @property
+    def stages(self) -> List[PipelineStage]:
+        return list(self._stages)
+
+    @property
+    def throttled(self) -> bool:
+        """
+        Indicates whether the source is paused due to backpressure.
+        """
+        return self._throttled
+
+    def depths(self) -> Dict[str, int]:
+        """
+        Returns the number of items waiting for each stage, the stage with the
+        fullest queue relative to its bound is the bottleneck.
+        """
+        return {stage.name: stage.depth() for stage in self._stages}
+
+    def is_working(self) -> bool:
+        return self._source.is_working() or any(
+            worker.is_working() for stage in self._stages for worker in stage.workers
+        )
+
+    def pause(self) -> bool:
+        result = super().pause()
+        self._forward("pause")
+        return result
+
+    def resume(self) -> bool:
+        result = super().resume()
+        with self._control_lock:
+            self._throttled = False
+        self._forward("resume")
+        return result
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops the pipeline, its source and all stage workers. With a
+        `timeout`, waits up to `timeout` seconds for all of them to end and
+        returns whether they did.
+        """
+        if timeout is not None:
+            # Also bounds how long the pipeline waits for its workers
+            self._stop_deadline = time.monotonic() + timeout
+        result = super().stop()
+        self._forward("stop")
+        if timeout is None:
+            return result
+        return self._await_stopped(timeout) and not self._source.is_alive() and not any(
+            worker.is_alive() for stage in self._stages for worker in stage.workers
+        )
+
+    def preparation(self) -> None:
+        """
+        Starts all stage workers and the source.
+        """
+        if not self._stages:
+            raise RuntimeError("Pipeline has no stages")
+        with self._control_lock:
+            for stage in self._stages:
+                # pylint: disable=protected-access
+                stage._workers = [_StageWorker(stage, self.daemon)
+                                  for _ in range(stage.parallelism)]
+                for worker in stage._workers:
+                    self._start(worker)
+            self._start(self._source)
+
+    def run_routine(self) -> None:
+        """
+        Called periodically as soon as `check_interval` has expired. Pauses or
+        resumes the source depending on the first stage's backlog.
+        """
+        stage = self._stages[0]
+        backlog = stage.depth()
+        with self._control_lock:
+            if not self.is_running():
+                return
+            if not self._throttled and backlog >= stage.maxsize:
+                self._throttled = True
+                self._control(self._source, "pause")
+            elif self._throttled and backlog <= stage.maxsize // 2:
+                self._throttled = False
+                self._control(self._source, "resume")
+
+    def post_processing(self) -> None:
+        """
+        Waits for the source and all stage workers to finish, at most until
+        the timeout passed to stop() expired.
+        """
+        self._forward("stop")
+        deadline = self._stop_deadline
+        workers = [self._source] + [worker for stage in self._stages for worker in stage.workers]
+        for worker in workers:
+            if worker.is_alive():
+                worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def _forward(self, trigger: str) -> None:
+        with self._control_lock:
+            self._control(self._source, trigger)
+            for stage in self._stages:
+                for worker in stage.workers:
+                    self._control(worker, trigger)
+
+    @staticmethod
+    def _start(worker: Any) -> None:
+        worker.start()
+        # Make sure control events forwarded later on find the worker started
+        while worker.is_initial() and worker.is_alive():
+            worker.wait(0.0001)
+
+    @staticmethod
+    def _control(worker: Any, trigger: str) -> None:
+        if worker.is_stopped() or worker.is_initial():
+            return
+        try:
+            getattr(worker, trigger)()
+        except MachineError:
+            # The worker ended on its own in the meantime
+            pass
@@ -0,0 +1,208 @@
+"""
+Thread pool handlers.
+"""
+import math
+import queue
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Type
+)
+from transitions.core import MachineError
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+from src.worker_threads.futures import Future, submit
+
+
+class _CallableTaskWorker(TaskWorkerThread):
+    """
+    Task worker delegating each task to a plain callable.
+    """
+    def __init__(
+            self,
+            tasks: queue.Queue,
+            run_task: Callable[[Any], Any],
+            **kwargs: Any
+    ) -> None:
+        super().__init__(tasks, **kwargs)
+        self._run_task = run_task
+
+    def run_task(self, task: Any) -> Any:
+        return self._run_task(task)
+
+
+class TaskWorkerPool(CycleWorkerThread):
+    """
+    This class represents a supervisor thread, which keeps a varying number of
+    task workers consuming one shared queue. The number of workers grows with
+    the queue depth and shrinks as soon as workers become idle, but never
+    below `min_workers`, which block on the empty queue instead of retiring.
+    """
+    def __init__(
+            self,
+            tasks: Optional[queue.Queue] = None,
+            run_task: Optional[Callable[[Any], Any]] = None,
+            worker_class: Optional[Type[TaskWorkerThread]] = None,
+            min_workers: int = 1,
+            max_workers: int = 4,
+            tasks_per_worker: int = 1,
+            scale_interval: float = 0.05,
+            timeout: float = 1000.0,
+            daemon: Optional[bool] = None,
+            **worker_kwargs: Any
+    ) -> None:
+        """
+        Initializes TaskWorkerPool class.
+        """
+        if (run_task is None) == (worker_class is None):
+            raise ValueError("Either run_task or worker_class must be given")
+        if not 0 < min_workers <= max_workers:
+            raise ValueError("Worker bounds must satisfy 0 < min_workers <= max_workers")
+        if tasks_per_worker < 1:
+            raise ValueError("Tasks per worker must be positive")
+        super().__init__(delay=scale_interval, timeout=timeout, daemon=daemon)
+        self._queue = tasks if tasks is not None else queue.Queue()
+        if worker_class is None:
+            # Plain callables are wrapped by a task worker of their own
+            worker_class = _CallableTaskWorker
+            worker_kwargs = dict(worker_kwargs, run_task=run_task)
+        self._worker_class = worker_class  # type: Type[TaskWorkerThread]
+        self._worker_kwargs = worker_kwargs
+        self._min_workers = min_workers
+        self._max_workers = max_workers
+        self._tasks_per_worker = tasks_per_worker
+        self._workers = []  # type: List[TaskWorkerThread]
+        self._workers_lock = Lock()
+
+    @property
+    def tasks(self) -> queue.Queue:
+        """
+        Returns the queue shared by all workers of the pool.
+        """
+        return self._queue
+
+    def submit(self, task: Any, **kwargs: Any) -> Future:
+        """
+        Puts the task into the shared queue and returns a future, which
+        receives the result of the worker processing it.
+        """
+        if self.is_stopped():
+            raise RuntimeError("Cannot submit tasks to a stopped pool")
+        return submit(self._queue, task, **kwargs)
+
+    @property
+    def workers(self) -> List[TaskWorkerThread]:
+        """
+        Returns a snapshot of all workers currently alive.
+        """
+        with self._workers_lock:
+            return [worker for worker in self._workers if worker.is_alive()]
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of workers currently alive.
+        """
+        return len(self.workers)
+
+    @property
+    def utilization(self) -> float:
+        """
+        Returns the share of alive workers, which are processing a task.
+        """
+        workers = self.workers
+        if not workers:
+            return 0.0
+        return sum(worker.is_working() for worker in workers) / len(workers)
+
+    def is_working(self) -> bool:
+        return any(worker.is_working() for worker in self.workers)
+
+    def pause(self) -> bool:
+        result = super().pause()
+        self._forward("pause")
+        return result
+
+    def resume(self) -> bool:
+        result = super().resume()
+        self._forward("resume")
+        return result
+
+    def stop(self, timeout: Optional[float] = None, drain: bool = False) -> bool:
+        """
+        Stops the pool and its workers. With `drain`, the workers alive at
+        that moment process all tasks left in the queue first, the pool no
+        longer scales up though. With a `timeout`, waits up to `timeout`
+        seconds for the pool and its workers to end and returns whether they
+        did. Workers still draining by then are stopped right away.
+        """
+        result = super().stop()
+        self._forward("stop", drain=drain)
+        if timeout is None or self._await_stopped(timeout):
+            return result if timeout is None else True
+        if drain:
+            self._forward("stop")
+        return False
+
+    def run_routine(self) -> None:
+        """
+        Called periodically as soon as `scale_interval` has expired. Adjusts the
+        number of workers to the current queue depth and worker utilization.
+        """
+        with self._workers_lock:
+            if not self.is_running():
+                return
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            alive = len(self._workers)
+            desired = math.ceil(self._queue.qsize() / self._tasks_per_worker)
+            desired = max(self._min_workers, min(self._max_workers, desired))
+            if alive > desired:
+                # Retire one idle worker per cycle to avoid oscillation
+                for worker in self._workers:
+                    if worker.is_running() and not worker.is_working():
+                        self._control(worker, "stop")
+                        break
+            elif alive < desired and (alive < self._min_workers or
+                                      all(worker.is_working() for worker in self._workers)):
+                for i in range(alive, desired):
+                    self._spawn(long_lived=i < self._min_workers)
+
+    def post_processing(self) -> None:
+        """
+        Waits for all workers to finish their current task.
+        """
+        with self._workers_lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.join()
+
+    def _spawn(self, long_lived: bool = False) -> None:
+        kwargs = self._worker_kwargs
+        if long_lived:
+            # Workers keeping up the lower bound must not retire on an empty queue
+            kwargs = dict(kwargs, idle_timeout=math.inf)
+        worker = self._worker_class(self._queue, **kwargs)
+        worker.daemon = self.daemon
+        worker.timeout = self.timeout
+        worker.start()
+        # Make sure control events forwarded later on find the worker started
+        while worker.is_initial() and worker.is_alive():
+            worker.wait(0.0001)
+        self._workers.append(worker)
+
+    def _forward(self, trigger: str, **kwargs: Any) -> None:
+        with self._workers_lock:
+            for worker in self._workers:
+                self._control(worker, trigger, **kwargs)
+
+    @staticmethod
+    def _control(worker: TaskWorkerThread, trigger: str, **kwargs: Any) -> None:
+        if worker.is_stopped() or worker.is_initial():
+            return
+        try:
+            getattr(worker, trigger)(**kwargs)
+        except MachineError:
+            # The worker retired on its own in the meantime
+            pass
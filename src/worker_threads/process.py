@@ -0,0 +1,257 @@
+"""
+Process based handlers.
+"""
+import abc
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import Process
+from typing import (
+    Any,
+    Callable,
+    Optional
+)
+from src.worker_threads.control import ThreadControlMixin
+
+
+class ProcessControlMixin(ThreadControlMixin):
+    """
+    This class implements the control states of the ThreadControlMixin on top
+    of process-shared primitives, so a worker process can be paused, resumed
+    and stopped from its parent process and vice versa.
+    """
+    _STATES = (
+        ThreadControlMixin.INITIAL.name,
+        ThreadControlMixin.RUNNING.name,
+        ThreadControlMixin.STOPPED.name,
+        ThreadControlMixin.PAUSED.name
+    )
+
+    def __init__(self) -> None:
+        # pylint: disable=super-init-not-called
+        self._shared_state = multiprocessing.Value("b", 0, lock=False)
+        # Process-shared counterparts with the interface of the thread ones
+        self._running = multiprocessing.Event()  # type: ignore[assignment]
+        self._wake = multiprocessing.Event()  # type: ignore[assignment]
+        self._state_lock = multiprocessing.RLock()  # type: ignore[assignment]
+        # Metrics are collected per process and are not shared
+        self._metrics = None
+        # Worker groups are limited to threads
+        self._group = None
+
+    @property
+    def _state(self) -> str:  # type: ignore[override]
+        return self._STATES[self._shared_state.value]
+
+    @_state.setter
+    def _state(self, state: str) -> None:
+        self._shared_state.value = self._STATES.index(state)
+
+
+class _ProcessWorkerBase(Process, ProcessControlMixin):
+    """
+    Shared attributes of all worker processes.
+    """
+    def __init__(
+            self,
+            delay: float,
+            timeout: float,
+            daemon: Optional[bool]
+    ) -> None:
+        Process.__init__(self, daemon=daemon)
+        ProcessControlMixin.__init__(self)
+        self._shared_delay = multiprocessing.Value("d", 0.0, lock=False)
+        self._shared_timeout = multiprocessing.Value("d", 0.0, lock=False)
+        self.delay = delay
+        self.timeout = timeout
+        self._task_done = multiprocessing.Event()
+        self._task_done.set()
+
+    def __repr__(self) -> str:
+        string: str = super().__repr__()
+        if self.is_alive():
+            string = string[:-1] + f" {self.state}>"
+        return string
+
+    def is_working(self) -> bool:
+        return not self._task_done.is_set()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops the worker, interrupting its delay. With a `timeout`, the parent
+        process waits up to `timeout` seconds for the worker to end and gets
+        to know whether it did.
+        """
+        result = super().stop()
+        if timeout is None or self.pid == os.getpid():
+            return result
+        self.join(timeout)
+        return not self.is_alive()
+
+    @property
+    def delay(self) -> float:
+        """
+        Indicates how much time shall pass before the worker continues with
+        the next cycle or task.
+        """
+        return float(self._shared_delay.value)
+
+    @delay.setter
+    def delay(self, delay: float) -> None:
+        if delay < 0.0:
+            raise ValueError("Delay must be non-negative")
+        self._shared_delay.value = delay
+
+    @property
+    def timeout(self) -> float:
+        """
+        Indicates how much time the worker is allowed to pause before the
+        worker is automatically forced to stop.
+        """
+        return float(self._shared_timeout.value)
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        if timeout < 0.0:
+            raise ValueError("Timeout must be non-negative")
+        self._shared_timeout.value = timeout
+
+    def preparation(self) -> None:
+        """
+        Optional preparatory steps for the worker to perform before starting.
+        """
+
+    def post_processing(self) -> None:
+        """
+        Optional follow-up steps for the worker to perform after stoppage.
+        """
+
+
+class CycleWorkerProcess(_ProcessWorkerBase):
+    """
+    This class represents a special process type, which executes a predefined
+    routine cyclically until a stop event is triggered.
+    """
+    def __init__(
+            self,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            target: Optional[Callable] = None,
+            args: tuple = (),
+            kwargs=None,
+            daemon: Optional[bool] = None
+    ) -> None:
+        """
+        Initializes CycleWorkerProcess class.
+        """
+        super().__init__(delay, timeout, daemon)
+        self._routine_target = target
+        self._routine_args = args
+        self._routine_kwargs = kwargs if kwargs is not None else {}
+
+    def run(self) -> None:
+        """
+        Defines the worker's concrete workflow.
+        """
+        self.running()
+        try:
+            self.preparation()
+            while not self.is_stopped():
+                if not self.wait(self.timeout):
+                    break
+                self._task_done.clear()
+                try:
+                    self.run_routine()
+                finally:
+                    self._task_done.set()
+                self.sleep(self.delay)
+            self.post_processing()
+        finally:
+            self.stop()
+
+    def run_routine(self) -> None:
+        """
+        Representing the worker's activity on each cycle.
+
+        You may override this method in a subclass. The run_routine() method
+        invokes the callable object passed to the object's constructor as the
+        target argument, if any, with sequential and keyword arguments taken
+        from the args and kwargs arguments, respectively.
+        """
+        if self._routine_target:
+            self._routine_target(*self._routine_args, **self._routine_kwargs)
+        else:
+            self.stop()
+
+
+class TaskWorkerProcess(_ProcessWorkerBase):
+    """
+    This class represents a special process type, which processes a stack of
+    similar tasks one after the other.
+    """
+    def __init__(
+            self,
+            tasks: Any,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            daemon: Optional[bool] = None,
+            idle_timeout: Optional[float] = None,
+            poll_interval: float = 0.05
+    ) -> None:
+        """
+        Initializes TaskWorkerProcess class.
+        """
+        super().__init__(delay, timeout, daemon)
+        self._queue = tasks
+        self._idle_timeout = idle_timeout
+        self._poll_interval = poll_interval
+
+    def run(self) -> None:
+        """
+        Defines the worker's concrete workflow.
+        """
+        self.running()
+        try:
+            self.preparation()
+            while not self.is_stopped():
+                if not self.wait(self.timeout):
+                    break
+                try:
+                    task = self._next_task()
+                except queue.Empty:
+                    break
+                if task is None:
+                    continue
+                self._task_done.clear()
+                try:
+                    self.run_task(task[0])
+                    if hasattr(self._queue, "task_done"):
+                        self._queue.task_done()
+                finally:
+                    self._task_done.set()
+                self.sleep(self.delay)
+            self.post_processing()
+        finally:
+            self.stop()
+
+    @abc.abstractmethod
+    def run_task(self, task: Any) -> None:
+        """
+        Abstract method representing the worker's activity on all task.
+        """
+
+    def _next_task(self) -> Optional[tuple]:
+        # Returns the task wrapped in a tuple or None if a control event occurred
+        if self._idle_timeout is None:
+            return (self._queue.get_nowait(),)
+        deadline = time.monotonic() + self._idle_timeout
+        while self.is_running():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                raise queue.Empty
+            try:
+                return (self._queue.get(timeout=min(remaining, self._poll_interval)),)
+            except queue.Empty:
+                continue
+        return None
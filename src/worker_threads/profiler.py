@@ -0,0 +1,237 @@
+"""
+Sampling profiler for worker threads.
+"""
+import sys
+import threading
+import weakref
+from threading import Lock, Thread
+from types import CodeType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+from src.worker_threads.core import CycleWorkerThread
+from src.worker_threads.metrics import worker_name
+
+
+# Frames of the thread bootstrap are the same for every worker and left out
+_THREADING = threading.__file__
+
+# Frames from root to leaf, each given by its code and line
+_Stack = Tuple[Tuple[CodeType, int], ...]
+
+
+class _Profile:
+    """
+    Samples of one profiled thread, which is referenced weakly, so ended
+    threads are freed while their samples are kept.
+    """
+    __slots__ = ("thread", "name", "stacks", "ended")
+
+    def __init__(self, thread: Thread) -> None:
+        self.thread = weakref.ref(thread)
+        self.name = worker_name(thread)
+        # Number of samples per stack
+        self.stacks = {}  # type: Dict[_Stack, int]
+        self.ended = False
+
+
+class SamplingProfiler(CycleWorkerThread):
+    """
+    This class shows where the routines or tasks of chosen worker threads
+    spend their time. Every `interval` seconds it takes the current stack of
+    each worker by means of sys._current_frames() and counts how often each
+    stack was seen. Unlike a deterministic profiler, nothing is added to the
+    calls of the workers themselves; the costs are one sample per interval,
+    growing with the number of threads and the depth of their stacks.
+
+    The profiler is a cycle worker: sampling begins with start() and can be
+    switched off and on at runtime by pause() and resume(). Unlike other
+    workers, a paused profiler waits until it is resumed or stopped. Samples
+    are kept until clear() is called, also after the profiler or the workers
+    stopped. Workers are referenced weakly and not sampled anymore once they
+    ended.
+    By default, workers are only sampled while working, so idle time spent
+    waiting for tasks or sleeping is left out. With `lines`, frames are
+    distinguished by the line executed instead of the function.
+    """
+    def __init__(
+            self,
+            workers: Iterable[Thread] = (),
+            interval: float = 0.01,
+            working_only: bool = True,
+            lines: bool = False,
+            daemon: Optional[bool] = True
+    ) -> None:
+        """
+        Initializes SamplingProfiler class.
+        """
+        super().__init__(delay=interval, daemon=daemon, schedule=self.FIXED_RATE)
+        self.working_only = working_only
+        self.lines = lines
+        self._lock = Lock()
+        self._profiles = []  # type: List[_Profile]
+        self._samples = 0
+        for worker in workers:
+            self.add(worker)
+
+    @property
+    def interval(self) -> float:
+        """
+        Indicates how many seconds pass between two samples.
+        """
+        return self.delay
+
+    @interval.setter
+    def interval(self, interval: float) -> None:
+        self.delay = interval
+
+    @property
+    def workers(self) -> List[Thread]:
+        """
+        Returns all profiled workers, which were not freed yet.
+        """
+        with self._lock:
+            threads = [profile.thread() for profile in self._profiles]
+        return [thread for thread in threads if thread is not None]
+
+    def add(self, worker: Thread) -> Thread:
+        """
+        Adds the given thread to the profiled workers and returns it. Threads
+        may be added before and after they were started.
+        """
+        if not isinstance(worker, Thread):
+            raise TypeError("Only threads of this process can be profiled")
+        if worker is self:
+            raise ValueError("The profiler cannot profile itself")
+        with self._lock:
+            if self._find(worker) is None:
+                self._profiles.append(_Profile(worker))
+        return worker
+
+    def discard(self, worker: Thread) -> None:
+        """
+        Removes the given worker and its samples from the profiler.
+        """
+        with self._lock:
+            profile = self._find(worker)
+            if profile is not None:
+                self._profiles.remove(profile)
+
+    def clear(self) -> None:
+        """
+        Removes all samples taken so far, keeping the profiled workers.
+        """
+        with self._lock:
+            for profile in self._profiles:
+                profile.stacks.clear()
+            self._samples = 0
+
+    def samples(self, worker: Optional[Thread] = None) -> int:
+        """
+        Returns the number of stacks sampled from the given worker or, by
+        default, from all workers.
+        """
+        with self._lock:
+            if worker is None:
+                return self._samples
+            profile = self._find(worker)
+            return sum(profile.stacks.values()) if profile is not None else 0
+
+    def collapsed(self, worker: Optional[Thread] = None) -> str:
+        """
+        Returns the samples in the collapsed stack format read by flame graph
+        tools: one line per stack, with its frames from root to leaf separated
+        by semicolons, followed by the number of samples. Without a worker,
+        the stacks of all workers are returned, each rooted at the name of
+        its worker.
+        """
+        items = []  # type: List[Tuple[Optional[str], Dict[_Stack, int]]]
+        with self._lock:
+            if worker is None:
+                items.extend((profile.name, dict(profile.stacks)) for profile in self._profiles)
+            else:
+                profile = self._find(worker)
+                items.append((None, dict(profile.stacks) if profile is not None else {}))
+        lines = []
+        for root, stacks in items:
+            for stack, count in stacks.items():
+                frames = [_frame_name(frame) for frame in stack]
+                if root is not None:
+                    frames.insert(0, root.replace(";", ":"))
+                lines.append(f"{';'.join(frames)} {count}")
+        lines.sort()
+        return "".join(line + "\n" for line in lines)
+
+    def dump(self, path: str, worker: Optional[Thread] = None) -> None:
+        """
+        Writes the samples in the collapsed stack format to the given file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.collapsed(worker))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        # Sampling may be paused for any time, so the timeout does not apply
+        return super().wait(None)
+
+    def run_routine(self) -> None:
+        """
+        Takes one sample of each profiled worker.
+        """
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        try:
+            with self._lock:
+                for profile in self._profiles:
+                    if profile.ended:
+                        continue
+                    worker = profile.thread()
+                    if worker is None or worker.ident is not None and not worker.is_alive():
+                        # Idents of ended threads are reused by new ones
+                        profile.ended = True
+                        continue
+                    if worker.ident is None:
+                        # Not started yet
+                        continue
+                    frame = frames.get(worker.ident)
+                    if frame is None:
+                        continue
+                    profile.name = worker_name(worker)
+                    if self.working_only:
+                        is_working = getattr(worker, "is_working", None)
+                        if is_working is not None and not is_working():
+                            continue
+                    stack = self._stack(frame)
+                    profile.stacks[stack] = profile.stacks.get(stack, 0) + 1
+                    self._samples += 1
+        finally:
+            # Frames keep their locals alive
+            del frames
+
+    def _find(self, worker: Thread) -> Optional[_Profile]:
+        for profile in self._profiles:
+            if profile.thread() is worker:
+                return profile
+        return None
+
+    def _stack(self, frame: Any) -> _Stack:
+        stack = []
+        lines = self.lines
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code, frame.f_lineno if lines else code.co_firstlineno))
+            frame = frame.f_back
+        # The bootstrap frames form the root of the stack
+        root = len(stack)
+        while root > 1 and stack[root - 1][0].co_filename == _THREADING:
+            root -= 1
+        return tuple(reversed(stack[:root]))
+
+
+def _frame_name(frame: Tuple[CodeType, int]) -> str:
+    code, line = frame
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({code.co_filename}:{line})".replace(";", ":")
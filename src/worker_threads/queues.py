@@ -0,0 +1,204 @@
+"""
+Task queues for worker threads.
+"""
+import collections
+import queue
+import time
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional
+)
+from src.worker_threads.futures import _FutureTask
+
+
+@dataclass
+class WaitStats:
+    """
+    Queue statistics of one priority class. Wait time is the time between
+    putting a task into the queue and handing it out to a worker.
+    """
+    count: int = 0
+    expired: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.count if self.count else 0.0
+
+
+class _Retry:
+    """
+    Queue item of a task taken by a task worker together with the number of
+    its attempts so far. Priority and deadline are kept for tasks of a
+    PriorityTaskQueue, so retries are queued with them again.
+    """
+    __slots__ = ("item", "attempts", "priority", "deadline")
+
+    def __init__(
+            self,
+            item: Any,
+            attempts: int,
+            priority: Optional[int] = None,
+            deadline: Optional[float] = None
+    ) -> None:
+        self.item = item
+        self.attempts = attempts
+        self.priority = priority
+        self.deadline = deadline
+
+
+class _Entry:
+    __slots__ = ("item", "priority", "deadline", "enqueued")
+
+    def __init__(self, item: Any, priority: int, deadline: Optional[float]) -> None:
+        self.item = item
+        self.priority = priority
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+
+
+class PriorityTaskQueue(queue.Queue):
+    """
+    This class represents a task queue with priority classes and per-task
+    deadlines. Lower numbers are served first, tasks of the same priority in
+    FIFO order. Tasks waiting longer than `max_starvation` seconds are served
+    first regardless of their priority. Tasks past their deadline are never
+    handed out, but passed to `on_expired` if given.
+    """
+    def __init__(
+            self,
+            maxsize: int = 0,
+            default_priority: int = 0,
+            max_starvation: Optional[float] = 1.0,
+            on_expired: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Initializes PriorityTaskQueue class.
+        """
+        self._default_priority = default_priority
+        self._max_starvation = max_starvation
+        self._on_expired = on_expired
+        self._stats = {}  # type: Dict[int, WaitStats]
+        super().__init__(maxsize)
+
+    def put(
+            self,
+            item: Any,
+            block: bool = True,
+            timeout: Optional[float] = None,
+            priority: Optional[int] = None,
+            deadline: Optional[float] = None
+    ) -> None:
+        """
+        Puts an item into the queue. The optional deadline is an absolute
+        time.monotonic() value after which the task must not be executed.
+        """
+        if priority is None:
+            priority = self._default_priority
+        super().put(_Entry(item, priority, deadline), block, timeout)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns the most urgent task, which is not expired yet.
+        """
+        return self._get_entry(block, timeout).item
+
+    def wait_stats(self) -> Dict[int, WaitStats]:
+        """
+        Returns a snapshot of the queue statistics per priority class.
+        """
+        with self.mutex:
+            return {priority: replace(stats) for priority, stats in self._stats.items()}
+
+    def _get_entry(self, block: bool = True, timeout: Optional[float] = None) -> _Entry:
+        # Task workers keep priority and deadline of a task for its retries
+        endtime = None if timeout is None else time.monotonic() + timeout
+        while True:
+            entry = super().get(block, timeout)  # type: _Entry
+            now = time.monotonic()
+            if entry.deadline is None or entry.deadline > now:
+                self._record_wait(entry, now)
+                return entry
+            self._expire(entry.item, entry.priority)
+            if endtime is not None:
+                timeout = max(0.0, endtime - time.monotonic())
+
+    def _expire(self, item: Any, priority: Optional[int]) -> None:
+        if priority is None:
+            priority = self._default_priority
+        with self.mutex:
+            self._stats_for(priority).expired += 1
+        if isinstance(item, _Retry):
+            item = item.item
+        if isinstance(item, _FutureTask):
+            # Submitted tasks past their deadline are cancelled, those already
+            # tried before fail instead
+            if not item.future.cancel():
+                item.future.set_exception(TimeoutError("Task expired before its retry"))
+            item = item.task
+        try:
+            if self._on_expired is not None:
+                self._on_expired(item)
+        finally:
+            self.task_done()
+
+    def _record_wait(self, entry: _Entry, now: float) -> None:
+        # Expired entries are diverted and never count as handed out
+        wait = now - entry.enqueued
+        with self.mutex:
+            stats = self._stats_for(entry.priority)
+            stats.count += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+
+    def _stats_for(self, priority: int) -> WaitStats:
+        stats = self._stats.get(priority)
+        if stats is None:
+            stats = self._stats[priority] = WaitStats()
+        return stats
+
+    # Override these methods to implement other queue organizations, see queue.Queue
+
+    def _init(self, maxsize: int) -> None:
+        self._classes = {}  # type: Dict[int, Deque[_Entry]]
+        self._priorities = []  # type: List[int]
+        self._size = 0
+
+    def _qsize(self) -> int:
+        return self._size
+
+    def _put(self, item: _Entry) -> None:
+        fifo = self._classes.get(item.priority)
+        if fifo is None:
+            fifo = self._classes[item.priority] = collections.deque()
+            self._priorities = sorted(self._classes)
+        fifo.append(item)
+        self._size += 1
+
+    def _get(self) -> _Entry:
+        now = time.monotonic()
+        chosen = None  # type: Optional[Deque[_Entry]]
+        oldest = None  # type: Optional[Deque[_Entry]]
+        for priority in self._priorities:
+            fifo = self._classes[priority]
+            if not fifo:
+                continue
+            if chosen is None:
+                chosen = fifo
+            if oldest is None or fifo[0].enqueued < oldest[0].enqueued:
+                oldest = fifo
+        if chosen is None or oldest is None:
+            raise IndexError("pop from an empty queue")
+        if self._max_starvation is not None and \
+                now - oldest[0].enqueued >= self._max_starvation:
+            # Starvation protection: serve the longest waiting task first
+            chosen = oldest
+        entry = chosen.popleft()
+        self._size -= 1
+        return entry
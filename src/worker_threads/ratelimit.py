@@ -0,0 +1,144 @@
+"""
+Rate limiting of workers.
+"""
+import math
+import time
+from threading import Event, Lock
+from typing import Optional, Set
+
+
+class TokenBucket:
+    """
+    This class limits the rate of tasks or cycles of any number of workers
+    sharing it. The bucket holds up to `burst` tokens and is refilled with
+    `rate` tokens per second. Each task or cycle takes one token, a batch one
+    per task. Workers run at full speed as long as tokens are left and only
+    wait for the next token otherwise.
+
+    A batch larger than the burst waits for a full bucket and leaves a debt,
+    which later takers wait for, so the average rate is kept.
+    """
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        """
+        Initializes TokenBucket class.
+        """
+        self._lock = Lock()
+        # Wake-up events of all workers waiting for tokens
+        self._waiters = set()  # type: Set[Event]
+        self._rate = 0.0
+        self._burst = 0.0
+        self.rate = rate
+        self.burst = burst
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(rate={self._rate}, burst={self._burst})>"
+
+    @property
+    def rate(self) -> float:
+        """
+        Indicates how many tokens are added per second. Waiting workers are
+        woken up on changes to take the new rate into account.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        if not rate > 0.0:
+            raise ValueError("Rate must be positive")
+        with self._lock:
+            if self._rate:
+                self._refill(time.monotonic())
+            self._rate = rate
+            self._wake_waiters()
+
+    @property
+    def burst(self) -> float:
+        """
+        Indicates how many tokens the bucket holds at most.
+        """
+        return self._burst
+
+    @burst.setter
+    def burst(self, burst: float) -> None:
+        if burst < 1.0:
+            raise ValueError("Burst must be at least one")
+        with self._lock:
+            if self._burst:
+                self._refill(time.monotonic())
+                self._tokens = min(self._tokens, burst)
+            self._burst = burst
+            self._wake_waiters()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Returns the number of tokens currently available, negative for a debt.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def take(self, tokens: int = 1) -> float:
+        """
+        Takes the given number of tokens and returns zero, if they are
+        available. Otherwise nothing is taken and the time until they will be
+        available is returned.
+        """
+        with self._lock:
+            return self._take(tokens)
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the given number of tokens is taken. Returns False, if the
+        timeout expired before.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wake_up = Event()
+        try:
+            while True:
+                wake_up.clear()
+                wait = self._wait(wake_up, tokens)
+                if wait == 0.0:
+                    return True
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0:
+                        return False
+                    wait = min(wait, remaining)
+                wake_up.wait(wait)
+        finally:
+            self._done_waiting(wake_up)
+
+    def _wait(self, wake_up: Event, tokens: int) -> float:
+        # Takes the tokens or registers the event to be set on changes of the
+        # limits, before the caller waits on it for the returned time
+        with self._lock:
+            wait = self._take(tokens)
+            if wait > 0.0:
+                self._waiters.add(wake_up)
+            return wait
+
+    def _done_waiting(self, wake_up: Event) -> None:
+        with self._lock:
+            self._waiters.discard(wake_up)
+
+    def _take(self, tokens: int) -> float:
+        self._refill(time.monotonic())
+        needed = min(tokens, self._burst)
+        if self._tokens >= needed:
+            self._tokens -= tokens
+            return 0.0
+        return (needed - self._tokens) / self._rate
+
+    def _refill(self, now: float) -> None:
+        if math.isinf(self._rate):
+            self._tokens = self._burst
+        else:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _wake_waiters(self) -> None:
+        for wake_up in self._waiters:
+            wake_up.set()
@@ -0,0 +1,303 @@
+"""
+Thread multiplexing handlers.
+"""
+import heapq
+import itertools
+import sys
+import threading
+import time
+from threading import Condition, Event, RLock, Thread
+from typing import (
+    Callable,
+    List,
+    Optional,
+    Tuple
+)
+from src.worker_threads.control import ThreadControlMixin
+
+
+class ScheduledRoutine(ThreadControlMixin):
+    """
+    This class represents a routine, which is executed cyclically by a
+    CycleScheduler until a stop event is triggered. It offers the same control
+    states as a CycleWorkerThread without occupying a thread of its own.
+    """
+    def __init__(
+            self,
+            target: Optional[Callable] = None,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            args: tuple = (),
+            kwargs=None
+    ) -> None:
+        """
+        Initializes ScheduledRoutine class.
+        """
+        ThreadControlMixin.__init__(self)
+        self.delay = delay
+        self.timeout = timeout
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs if kwargs is not None else {}
+        self._scheduler = None  # type: Optional[CycleScheduler]
+        self._generation = 0
+        self._paused_since = 0.0
+        self._task_done = Event()
+        self._task_done.set()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self._target!r}, {self.state!r})>"
+
+    def run_routine(self) -> None:
+        """
+        Representing the routine's activity on each cycle.
+
+        You may override this method in a subclass. The run_routine() method
+        invokes the callable object passed to the object's constructor as the
+        target argument, if any, with sequential and keyword arguments taken
+        from the args and kwargs arguments, respectively.
+        """
+        if self._target:
+            self._target(*self._args, **self._kwargs)
+        else:
+            self.stop()
+
+    def is_working(self) -> bool:
+        return not self._task_done.is_set()
+
+    @property
+    def delay(self) -> float:
+        """
+        Indicates how much time shall pass before the routine continues with
+        the next cycle.
+        """
+        return self._delay
+
+    @delay.setter
+    def delay(self, delay: float) -> None:
+        if delay < 0.0:
+            raise ValueError("Delay must be non-negative")
+        self._delay = delay
+
+    @property
+    def timeout(self) -> float:
+        """
+        Indicates how much time the routine is allowed to pause before the
+        routine is automatically forced to stop.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        if timeout < 0.0:
+            raise ValueError("Timeout must be non-negative")
+        self._timeout = timeout
+
+    def _before_paused_state(self) -> None:
+        self._paused_since = time.monotonic()
+        super()._before_paused_state()
+        if self._scheduler is not None:
+            # Check back as soon as the pause times out
+            self._scheduler._push(self, self._paused_since + self._timeout)
+
+    def _before_running_state(self) -> None:
+        super()._before_running_state()
+        if self._scheduler is not None:
+            # Either the first cycle or the first one after a pause is due now
+            self._scheduler._push(self, time.monotonic())
+
+
+class CycleScheduler(ThreadControlMixin):
+    """
+    This class executes many cyclic routines, each with its own delay, on a
+    fixed number of threads. Due routines are taken from a heap ordered by
+    their next deadline.
+    """
+    def __init__(
+            self,
+            threads: int = 1,
+            timeout: float = 1000.0,
+            daemon: Optional[bool] = None
+    ) -> None:
+        """
+        Initializes CycleScheduler class.
+        """
+        if threads < 1:
+            raise ValueError("Number of threads must be positive")
+        ThreadControlMixin.__init__(self)
+        self._timeout = timeout
+        self._condition = Condition(RLock())
+        self._heap = []  # type: List[Tuple[float, int, int, ScheduledRoutine]]
+        self._sequence = itertools.count()
+        self._routines = []  # type: List[ScheduledRoutine]
+        self._threads = [
+            Thread(target=self._work, daemon=daemon, name=f"CycleScheduler-{i}")
+            for i in range(threads)
+        ]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({len(self._threads)} threads, {self.state!r})>"
+
+    def start(self) -> None:
+        """
+        Starts all threads of the scheduler.
+        """
+        self.running()
+        for thread in self._threads:
+            thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until all threads of the scheduler terminated.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def is_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def add(self, routine: ScheduledRoutine) -> ScheduledRoutine:
+        """
+        Adds the given routine to the scheduler. Its first cycle is due at once.
+        """
+        if routine._scheduler is not None:
+            raise ValueError("Routine is already scheduled")
+        with self._condition:
+            routine._scheduler = self
+            self._routines = [r for r in self._routines if not r.is_stopped()]
+            self._routines.append(routine)
+        routine.running()
+        return routine
+
+    def schedule(
+            self,
+            target: Callable,
+            delay: float = 0.0,
+            timeout: float = 1000.0,
+            args: tuple = (),
+            kwargs=None
+    ) -> ScheduledRoutine:
+        """
+        Creates a new routine for the given callable and adds it to the scheduler.
+        """
+        return self.add(ScheduledRoutine(target, delay, timeout, args, kwargs))
+
+    @property
+    def routines(self) -> List[ScheduledRoutine]:
+        """
+        Returns all routines, which are not stopped yet.
+        """
+        with self._condition:
+            return [routine for routine in self._routines if not routine.is_stopped()]
+
+    @property
+    def timeout(self) -> float:
+        """
+        Indicates how much time the scheduler is allowed to pause before the
+        scheduler is automatically forced to stop.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        if timeout < 0.0:
+            raise ValueError("Timeout must be non-negative")
+        self._timeout = timeout
+
+    def pause(self) -> bool:
+        result = super().pause()
+        self._wake_up()
+        return result
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stops the scheduler and all of its routines. With a `timeout`, waits
+        up to `timeout` seconds for the threads of the scheduler to end and
+        returns whether they did.
+        """
+        result = super().stop()
+        for routine in self.routines:
+            if not routine.is_stopped():
+                routine.stop()
+        self._wake_up()
+        if timeout is None:
+            return result
+        if threading.current_thread() in self._threads:
+            # A routine stopping its own scheduler cannot wait for it
+            return False
+        self.join(timeout)
+        return not self.is_alive()
+
+    def _work(self) -> None:
+        while not self.is_stopped():
+            if not self.wait(self._timeout):
+                self.stop()
+                break
+            routine = self._next_due()
+            if routine is None:
+                continue
+            try:
+                routine.run_routine()
+            except Exception:  # pylint: disable=broad-except
+                # A failing routine stops like a failing CycleWorkerThread
+                routine.stop()
+                threading.excepthook(threading.ExceptHookArgs(
+                    (*sys.exc_info(), threading.current_thread())
+                ))
+            finally:
+                with self._condition:
+                    routine._task_done.set()
+                    if routine.is_running():
+                        self._push(routine, time.monotonic() + routine.delay)
+                    elif routine.is_paused():
+                        self._push(routine, routine._paused_since + routine.timeout)
+
+    def _next_due(self) -> Optional[ScheduledRoutine]:
+        expired = []  # type: List[ScheduledRoutine]
+        try:
+            return self._pop_due(expired)
+        finally:
+            # Stopped outside of the heap's lock to keep a consistent lock order
+            for routine in expired:
+                routine.stop()
+
+    def _pop_due(self, expired: List[ScheduledRoutine]) -> Optional[ScheduledRoutine]:
+        with self._condition:
+            while True:
+                if not self.is_running():
+                    return None
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due, _, generation, routine = self._heap[0]
+                if generation != routine._generation or routine.is_stopped() or \
+                        routine.is_working():
+                    # Outdated entry, a newer one exists or will be pushed
+                    heapq.heappop(self._heap)
+                    continue
+                now = time.monotonic()
+                if due > now:
+                    self._condition.wait(due - now)
+                    continue
+                heapq.heappop(self._heap)
+                if routine.is_paused():
+                    if now - routine._paused_since >= routine.timeout:
+                        expired.append(routine)
+                        return None
+                    self._push(routine, routine._paused_since + routine.timeout)
+                    continue
+                routine._task_done.clear()
+                return routine
+
+    def _push(self, routine: ScheduledRoutine, due: float) -> None:
+        with self._condition:
+            routine._generation += 1
+            heapq.heappush(
+                self._heap, (due, next(self._sequence), routine._generation, routine)
+            )
+            self._condition.notify()
+
+    def _wake_up(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
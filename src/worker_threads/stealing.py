@@ -0,0 +1,355 @@
+"""
+Work-stealing handlers.
+"""
+import itertools
+import math
+import queue
+import time
+from collections import deque
+from threading import Condition, Event, Lock, current_thread
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    List,
+    Optional
+)
+from transitions.core import MachineError
+from src.worker_threads.control import ThreadControlMixin
+from src.worker_threads.core import TaskWorkerThread, _WAKE_UP
+from src.worker_threads.futures import Future, submit
+
+
+# Returned instead of a task, if neither the own deque nor others hold one
+_NO_TASK = object()
+
+
+class _LocalQueue(queue.Queue):
+    """
+    Task deque of one worker, overriding the part of the queue interface used
+    by task workers. Appending and popping single items of a deque are atomic,
+    so neither the owner nor thieves take a lock as long as there are tasks.
+    """
+    def __init__(self, executor: "WorkStealingExecutor") -> None:
+        super().__init__()
+        self.tasks = deque()  # type: Deque[Any]
+        self.not_empty = executor._condition  # pylint: disable=protected-access
+        self._executor = executor
+
+    def qsize(self) -> int:
+        return len(self.tasks)
+
+    def _qsize(self) -> int:
+        return len(self.tasks)
+
+    def empty(self) -> bool:
+        # A worker is out of tasks only if there is nothing left to steal
+        return self._executor.qsize() == 0
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        # pylint: disable=unused-argument
+        self.tasks.append(item)
+        self._executor._notify()  # pylint: disable=protected-access
+
+    def get_nowait(self) -> Any:
+        try:
+            return self.tasks.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def task_done(self) -> None:
+        pass
+
+
+class _StealingWorker(TaskWorkerThread):
+    """
+    Task worker taking tasks from its own deque first and stealing half of the
+    tasks of another worker once its deque ran empty.
+    """
+    def __init__(
+            self,
+            executor: "WorkStealingExecutor",
+            index: int,
+            run_task: Callable[[Any], Any],
+            **kwargs: Any
+    ) -> None:
+        local = _LocalQueue(executor)
+        super().__init__(local, **dict(kwargs, idle_timeout=math.inf))
+        self._local = local
+        self._executor = executor
+        self._index = index
+        self._run_task = run_task
+        self._idle = False
+        self._steals = 0
+
+    def run_task(self, task: Any) -> Any:
+        return self._run_task(task)
+
+    @property
+    def steals(self) -> int:
+        """
+        Returns how often the worker stole tasks from another worker.
+        """
+        return self._steals
+
+    def _next_task(self) -> Any:
+        retry = self._due_retry()
+        if retry is not None:
+            return retry
+        task = self._take()
+        if task is not _NO_TASK:
+            return task
+        return self._wait_for_task()
+
+    def _take(self) -> Any:
+        # Returns a task of the own deque, refilled by stealing if it is empty
+        own = self._local.tasks
+        while True:
+            try:
+                return own.popleft()
+            except IndexError:
+                if not self._steal():
+                    return _NO_TASK
+
+    def _steal(self) -> bool:
+        # pylint: disable=protected-access
+        queues = self._executor._queues
+        own = self._local.tasks
+        for offset in range(1, len(queues)):
+            victim = queues[(self._index + offset) % len(queues)].tasks
+            # Take half of the victim's tasks to steal less often
+            stolen = 0
+            for _ in range(max(1, len(victim) // 2)):
+                try:
+                    own.append(victim.pop())
+                except IndexError:
+                    break
+                stolen += 1
+            if stolen:
+                self._steals += 1
+                return True
+        return False
+
+    def _wait_for_task(self) -> Any:
+        executor = self._executor
+        condition = executor._condition  # pylint: disable=protected-access
+        with condition:
+            executor._idle += 1  # pylint: disable=protected-access
+            try:
+                while True:
+                    if not self.is_running():
+                        return _WAKE_UP
+                    # Submitters only notify once they saw an idle worker,
+                    # so look for tasks again after announcing to be idle
+                    task = self._take()
+                    if task is not _NO_TASK:
+                        return task
+                    retry = self._due_retry()
+                    if retry is not None:
+                        return retry
+                    if self._draining and not self._retries:
+                        raise queue.Empty
+                    if not self._idle:
+                        self._idle = True
+                        executor._notify_done()  # pylint: disable=protected-access
+                    if self._retries:
+                        condition.wait(max(0.0, self._retries[0][0] - time.monotonic()))
+                    else:
+                        condition.wait()
+            finally:
+                self._idle = False
+                executor._idle -= 1  # pylint: disable=protected-access
+
+    def _collect_batch(self, task: Any) -> List[Any]:
+        # Batches are filled from the worker's own deque without waiting
+        tasks = [task]
+        while len(tasks) < self._max_batch_size:
+            try:
+                tasks.append(self._local.tasks.popleft())
+            except IndexError:
+                break
+        return tasks
+
+    def _release_retries(self) -> None:
+        super()._release_retries()
+        # Tasks left in the deque of an ended worker are stolen by the others
+        # pylint: disable=protected-access
+        self._executor._notify()
+        self._executor._notify_done()
+
+
+class WorkStealingExecutor(ThreadControlMixin):
+    """
+    This class executes tasks on a fixed number of task workers, each with a
+    deque of its own instead of one shared queue. Tasks are spread across the
+    deques round-robin, tasks submitted by a worker go to its own deque. A
+    worker, which ran out of tasks, steals half of the tasks of another one.
+    The order in which tasks are processed is not defined.
+    """
+    def __init__(
+            self,
+            run_task: Callable[[Any], Any],
+            workers: int = 4,
+            timeout: float = 1000.0,
+            daemon: Optional[bool] = None,
+            **worker_kwargs: Any
+    ) -> None:
+        """
+        Initializes WorkStealingExecutor class.
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be positive")
+        ThreadControlMixin.__init__(self)
+        self._condition = Condition(Lock())
+        self._all_idle = Event()
+        self._idle = 0
+        self._next_queue = itertools.count()
+        self._workers = [
+            _StealingWorker(self, i, run_task, timeout=timeout, daemon=daemon, **worker_kwargs)
+            for i in range(workers)
+        ]
+        # pylint: disable=protected-access
+        self._queues = [worker._local for worker in self._workers]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({len(self._workers)} workers, {self.state!r})>"
+
+    def start(self) -> None:
+        """
+        Starts all workers of the executor.
+        """
+        self.running()
+        for worker in self._workers:
+            worker.start()
+            # Make sure control events forwarded later on find the worker started
+            while worker.is_initial() and worker.is_alive():
+                worker.wait(0.0001)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until all workers of the executor terminated.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def is_alive(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    def is_working(self) -> bool:
+        return any(worker.is_working() for worker in self._workers)
+
+    @property
+    def workers(self) -> List[TaskWorkerThread]:
+        return list(self._workers)
+
+    @property
+    def steals(self) -> int:
+        """
+        Returns how often workers stole tasks from each other.
+        """
+        return sum(worker.steals for worker in self._workers)
+
+    def qsize(self) -> int:
+        """
+        Returns the number of tasks waiting in all deques.
+        """
+        return sum(local.qsize() for local in self._queues)
+
+    def put(self, task: Any) -> None:
+        """
+        Adds the task to the deque of the next worker or, if called by a
+        worker of the executor, to the caller's own deque.
+        """
+        if self.is_stopped():
+            raise RuntimeError("Cannot put tasks into a stopped executor")
+        self._queue_for_caller().put(task)
+
+    def submit(self, task: Any) -> Future:
+        """
+        Adds the task like put() and returns a future, which receives the
+        return value of `run_task` or the exception raised.
+        """
+        if self.is_stopped():
+            raise RuntimeError("Cannot submit tasks to a stopped executor")
+        return submit(self._queue_for_caller(), task)
+
+    def join_tasks(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all tasks put so far are done, including pending retries,
+        or all workers are stopped. Returns False if the timeout expired before.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Idle workers only take tasks while holding the condition
+            with self._condition:
+                if self._all_done():
+                    return True
+                self._all_idle.clear()
+            if deadline is None:
+                self._all_idle.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                return False
+            self._all_idle.wait(remaining)
+
+    def pause(self) -> bool:
+        result = super().pause()
+        self._forward("pause")
+        return result
+
+    def resume(self) -> bool:
+        result = super().resume()
+        self._forward("resume")
+        return result
+
+    def stop(self, timeout: Optional[float] = None, drain: bool = False) -> bool:
+        """
+        Stops all workers. With `drain`, the workers process all tasks left
+        first. With a `timeout`, waits up to `timeout` seconds for the workers
+        to end and returns whether they did. Workers still draining by then
+        are stopped right away.
+        """
+        result = super().stop()
+        self._forward("stop", drain=drain)
+        if timeout is None:
+            return result
+        self.join(timeout)
+        if not self.is_alive():
+            return True
+        if drain:
+            self._forward("stop")
+        return False
+
+    def _queue_for_caller(self) -> _LocalQueue:
+        worker = current_thread()
+        if isinstance(worker, _StealingWorker) and worker._executor is self:
+            return worker._local
+        return self._queues[next(self._next_queue) % len(self._queues)]
+
+    def _all_done(self) -> bool:
+        # Workers search all deques before they announce to be idle and push
+        # a retry before they finish a task, so no task slips through
+        workers = [worker for worker in self._workers if not worker.is_stopped()]
+        if workers and self.qsize():
+            return False
+        return all(worker._idle and not worker._retries for worker in workers)
+
+    def _notify(self) -> None:
+        if self._idle:
+            with self._condition:
+                self._condition.notify()
+
+    def _notify_done(self) -> None:
+        self._all_idle.set()
+
+    def _forward(self, trigger: str, **kwargs: Any) -> None:
+        for worker in self._workers:
+            if worker.is_stopped() or worker.is_initial():
+                continue
+            try:
+                getattr(worker, trigger)(**kwargs)
+            except MachineError:
+                # The worker ended on its own in the meantime
+                pass
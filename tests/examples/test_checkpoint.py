@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from src.examples.checkpoint import TrackerCheckpoint
+
+
+class TrackerCheckpointClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    TrackerCheckpoint class within <src.examples.checkpoint>.
+    """
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self._path = os.path.join(folder.name, "checkpoint.db")
+
+    def test_checkpoint_persistence(self):
+        """
+        This test checks if a checkpoint:
+        1) reports whether it holds any state,
+        2) buffers changes until the flush interval expired,
+        3) restores all changes written before it was closed
+        """
+        # 1) ###################################################################
+        checkpoint = TrackerCheckpoint(self._path, flush_interval=1000.0)
+        self.assertFalse(checkpoint.open())
+        checkpoint.reset([1, 2])
+        self.assertEqual(set(checkpoint.load()), {1, 2})
+        # 2) ###################################################################
+        checkpoint.add(3)
+        checkpoint.discard(1)
+        checkpoint.add(4)
+        checkpoint.discard(4)
+        checkpoint.flush()
+        self.assertEqual(checkpoint.pending, 3)
+        self.assertEqual(set(checkpoint.load()), {1, 2})
+        checkpoint.flush(force=True)
+        self.assertEqual(checkpoint.pending, 0)
+        self.assertEqual(set(checkpoint.load()), {2, 3})
+        # 3) ###################################################################
+        checkpoint.add(5)
+        checkpoint.close()
+        checkpoint = TrackerCheckpoint(self._path)
+        self.assertTrue(checkpoint.open())
+        self.assertEqual(set(checkpoint.load()), {2, 3, 5})
+        checkpoint.close()
+
+    def test_checkpoint_source(self):
+        """
+        This test checks if a checkpoint written for another source is taken
+        as empty.
+        """
+        checkpoint = TrackerCheckpoint(self._path, source="first")
+        self.assertFalse(checkpoint.open())
+        checkpoint.reset([1])
+        checkpoint.close()
+        checkpoint = TrackerCheckpoint(self._path, source="second")
+        self.assertFalse(checkpoint.open())
+        checkpoint.close()
+        checkpoint = TrackerCheckpoint(self._path, source="first")
+        self.assertTrue(checkpoint.open())
+        self.assertEqual(set(checkpoint.load()), {1})
+        checkpoint.close()
+
+    def test_checkpoint_invalid_interval(self):
+        """
+        This test checks if a negative flush interval is rejected.
+        """
+        with self.assertRaises(ValueError):
+            TrackerCheckpoint(self._path, flush_interval=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
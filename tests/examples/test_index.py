@@ -0,0 +1,61 @@
+import unittest
+from src.examples.index import SeenIndex, path_key
+
+
+class SeenIndexClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    SeenIndex class within <src.examples.index>.
+    """
+    def test_index_incremental_changes(self):
+        """
+        This test checks if single files:
+        1) are inserted and removed exactly once,
+        2) are merged into the sorted keys once the overlay grew large enough
+        """
+        # 1) ###################################################################
+        index = SeenIndex(["a", "b"])
+        self.assertEqual(len(index), 2)
+        self.assertFalse(index.add("a"))
+        self.assertTrue(index.add("c"))
+        self.assertTrue(index.discard("a"))
+        self.assertFalse(index.discard("a"))
+        self.assertTrue(index.add("a"))
+        self.assertTrue(index.discard("c"))
+        self.assertNotIn("c", index)
+        self.assertEqual(len(index), 2)
+        # 2) ###################################################################
+        paths = [f"file{i}" for i in range(3000)]
+        for path in paths:
+            index.add(path)
+        for path in paths[::2]:
+            index.discard(path)
+        expected = {"a", "b"}.union(paths[1::2])
+        self.assertEqual(len(index), len(expected))
+        self.assertTrue(all(path in index for path in expected))
+        self.assertFalse(any(path in index for path in paths[::2]))
+        self.assertEqual(list(index.keys()), sorted(path_key(path) for path in expected))
+
+    def test_index_sync(self):
+        """
+        This test checks if synchronizing the index with a listing:
+        1) reports new files and the keys of removed files,
+        2) reports nothing for an unchanged listing,
+        3) restores the same content from the keys
+        """
+        index = SeenIndex(["a", "b", "c"])
+        index.add("d")
+        # 1) ###################################################################
+        added, removed = index.sync(iter(["b", "d", "e", "f", "e"]))
+        self.assertCountEqual(added, ["e", "f"])
+        self.assertCountEqual(removed, [path_key("a"), path_key("c")])
+        # 2) ###################################################################
+        self.assertEqual(index.sync(["f", "e", "d", "b"]), ([], []))
+        # 3) ###################################################################
+        restored = SeenIndex.from_keys(index.keys())
+        self.assertEqual(len(restored), 4)
+        self.assertEqual(restored.sync(["b", "d", "e", "f"]), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
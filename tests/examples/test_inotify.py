@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from src.examples import inotify
+from src.examples.inotify import Inotify
+
+
+@unittest.skipUnless(Inotify.available(), "inotify is not available")
+class InotifyClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    Inotify class within <src.examples.inotify>.
+    """
+    def setUp(self):
+        self._folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self._folder.cleanup)
+
+    def test_inotify_reports_events(self):
+        """
+        This test checks if inotify reports files, which are written and moved
+        into a watched folder, with their names and event masks.
+        """
+        with Inotify() as watcher:
+            watcher.add_watch(self._folder.name, inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO)
+            with open(os.path.join(self._folder.name, "file1.txt"), "w") as file:
+                file.write("content")
+            with tempfile.NamedTemporaryFile(delete=False) as file:
+                source = file.name
+            os.replace(source, os.path.join(self._folder.name, "file2.txt"))
+            self.assertEqual(watcher.wait(timeout=2.0), [watcher.fileno()])
+            events = [(event.name, event.mask) for event in watcher.read()]
+            self.assertEqual(events, [
+                ("file1.txt", inotify.IN_CLOSE_WRITE),
+                ("file2.txt", inotify.IN_MOVED_TO)
+            ])
+            self.assertEqual(watcher.read(), [])
+
+    def test_inotify_high_descriptor(self):
+        """
+        This test checks if waiting works for file descriptors beyond the
+        FD_SETSIZE limit of select().
+        """
+        import resource  # pylint: disable=import-outside-toplevel
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft <= 1100:
+            self.skipTest("file descriptor limit too low")
+        with Inotify() as watcher:
+            watcher.add_watch(self._folder.name, inotify.IN_CLOSE_WRITE)
+            high = os.dup2(watcher.fileno(), 1100)
+            self.addCleanup(os.close, high)
+            with open(os.path.join(self._folder.name, "file1.txt"), "w"):
+                pass
+            self.assertEqual(watcher.wait([high], timeout=2.0), [watcher.fileno(), high])
+
+    def test_inotify_errors(self):
+        """
+        This test checks if watching a missing folder raises an OSError and a
+        closed instance can no longer be used.
+        """
+        watcher = Inotify()
+        with self.assertRaises(OSError):
+            watcher.add_watch(os.path.join(self._folder.name, "missing"), inotify.IN_CREATE)
+        watcher.close()
+        self.assertTrue(watcher.closed)
+        with self.assertRaises(ValueError):
+            watcher.read()
+
+
+if __name__ == "__main__":
+    unittest.main()
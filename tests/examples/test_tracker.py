@@ -1,13 +1,16 @@
 import os
+import shutil
+import tempfile
+import threading
 import time
 import unittest
 import unittest.mock as mock
-from typing import Union
-from src.examples.tracker import NewFileTracker
-
-
-# As defined in os module
-AnyPath = Union[str, bytes, os.PathLike[str], os.PathLike[bytes]]
+from typing import List
+from src.examples import inotify
+from src.examples.checkpoint import TrackerCheckpoint
+from src.examples.index import path_key
+from src.examples.inotify import Inotify, InotifyEvent
+from src.examples.tracker import NewFileTracker, RecursiveFileTracker
 
 
 class NewFileTrackerClass(unittest.TestCase):
@@ -34,9 +37,9 @@ class NewFileTrackerClass(unittest.TestCase):
         is empty.
         """
         m = mock.Mock()
-        with mock.patch(f"{self._MODULE_PATH}.glob.glob", m, create=True):
-            m.return_value = []
-            my_tracker = NewFileTracker("dir_path")
+        with mock.patch(f"{self._MODULE_PATH}.os.scandir", m, create=True):
+            m.side_effect = lambda path: self._mock_scandir([])
+            my_tracker = NewFileTracker("dir_path", use_inotify=False)
             my_tracker.start()
             time.sleep(0.1)
             new_files = my_tracker.new_files
@@ -54,14 +57,12 @@ class NewFileTrackerClass(unittest.TestCase):
         2) storing newly created files,
         3) storing previously tracked files, which are deleted and recreated
         """
-        m1 = mock.Mock()
-        m2 = mock.Mock()
-        with mock.patch(f"{self._MODULE_PATH}.os.path.getctime", m1, create=True),\
-             mock.patch(f"{self._MODULE_PATH}.glob.glob", m2, create=True):
+        m = mock.Mock()
+        listing = list(self._FILES)
+        with mock.patch(f"{self._MODULE_PATH}.os.scandir", m, create=True):
             # 1) ###############################################################
-            m1.side_effect = self._mock_getctime
-            m2.return_value = self._FILES
-            my_tracker = NewFileTracker(self._ROOT)
+            m.side_effect = lambda path: self._mock_scandir(listing)
+            my_tracker = NewFileTracker(self._ROOT, use_inotify=False)
             my_tracker.start()
             time.sleep(0.1)
             new_files = my_tracker.new_files
@@ -72,7 +73,7 @@ class NewFileTrackerClass(unittest.TestCase):
             # 2) ###############################################################
             # Simulates the detection of previously tracked files
             # and one newly created file
-            m2.return_value = self._FILES + [rf"{self._ROOT}\file4.py"]
+            listing[:] = self._FILES + [rf"{self._ROOT}\file4.py"]
             time.sleep(0.1)
             result = []
             while not new_files.empty():
@@ -80,14 +81,14 @@ class NewFileTrackerClass(unittest.TestCase):
             self.assertEqual(result, [rf"{self._ROOT}\file4.py"])
             # 3) ###############################################################
             # Simulates the deletion of previously tracked files
-            m2.return_value = []
+            listing[:] = []
             time.sleep(0.1)
             result = []
             while not new_files.empty():
                 result.append(new_files.get())
             self.assertEqual(result, [])
             # Simulates the recreation of previously deleted files
-            m2.return_value = self._FILES
+            listing[:] = self._FILES
             time.sleep(0.1)
             result = []
             while not new_files.empty():
@@ -96,8 +97,353 @@ class NewFileTrackerClass(unittest.TestCase):
             my_tracker.stop()
             my_tracker.join(timeout=2.0)
 
-    def _mock_getctime(self, filename: AnyPath) -> float:
-        return time.time() + self._CTIME_DELTA[filename]
+    def test_file_tracker_unchanged_folder(self):
+        """
+        This test checks if the file tracker skips listing a folder, whose
+        mtime did not change, and lists it again once files are added.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            self._touch(folder, "old.txt")
+            past = time.time() - 60.0
+            os.utime(folder, (past, past))
+            my_tracker = NewFileTracker(folder, "*.txt", use_inotify=False)
+            with mock.patch(f"{self._MODULE_PATH}.os.scandir", wraps=os.scandir) as m:
+                my_tracker.start()
+                time.sleep(0.1)
+                # One listing for the snapshot, one for the first scan
+                self.assertEqual(m.call_count, 2)
+                path = self._touch(folder, "file1.txt")
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+                my_tracker.stop()
+                my_tracker.join(timeout=2.0)
+            self.assertTrue(my_tracker.new_files.empty())
+
+    def test_file_tracker_adaptive_scan_interval(self):
+        """
+        This test checks if a scanning file tracker:
+        1) backs off while the folder is unchanged,
+        2) returns to the scan interval as soon as files arrive
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            my_tracker = NewFileTracker(folder, "*.txt", scan_interval=0.01,
+                                        use_inotify=False, max_scan_interval=0.16)
+            my_tracker.start()
+            # 1) ###############################################################
+            time.sleep(0.6)
+            self.assertEqual(my_tracker.current_delay, 0.16)
+            self.assertLess(my_tracker.cycle_stats.cycles, 15)
+            # 2) ###############################################################
+            path = self._touch(folder, "file1.txt")
+            self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+            self.assertEqual(my_tracker.current_delay, 0.01)
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+
+    @unittest.skipUnless(Inotify.available(), "inotify is not available")
+    def test_file_tracker_inotify(self):
+        """
+        This test checks if the file tracker uses inotify to report:
+        1) files once they are completely written or moved into the folder,
+        2) matching files only,
+        3) previously reported files, which are deleted and recreated,
+        4) hard and symbolic links, which are never written
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            self._touch(folder, "old.txt")
+            my_tracker = NewFileTracker(folder, "*.txt")
+            my_tracker.start()
+            time.sleep(0.1)
+            self.assertTrue(my_tracker.uses_inotify)
+            # Waiting for events does not count as working
+            self.assertFalse(my_tracker.is_working())
+            new_files = my_tracker.new_files
+            # 1) ###############################################################
+            path = os.path.join(folder, "file1.txt")
+            with open(path, "w") as file:
+                file.write("partial")
+                time.sleep(0.1)
+                self.assertTrue(new_files.empty())
+            self.assertEqual(new_files.get(timeout=2.0), path)
+            # 2) ###############################################################
+            self._touch(folder, "file2.csv")
+            self._touch(folder, ".hidden.txt")
+            self._touch(folder, "file3.txt")
+            self.assertEqual(new_files.get(timeout=2.0), os.path.join(folder, "file3.txt"))
+            # 3) ###############################################################
+            os.remove(path)
+            self._touch(folder, "file1.txt")
+            self.assertEqual(new_files.get(timeout=2.0), path)
+            # 4) ###############################################################
+            link = os.path.join(folder, "link.txt")
+            os.link(path, link)
+            self.assertEqual(new_files.get(timeout=2.0), link)
+            link = os.path.join(folder, "symlink.txt")
+            os.symlink(path, link)
+            self.assertEqual(new_files.get(timeout=2.0), link)
+            self.assertTrue(my_tracker.uses_inotify)
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+            self.assertFalse(my_tracker.is_alive())
+            self.assertTrue(new_files.empty())
+
+    @unittest.skipUnless(Inotify.available(), "inotify is not available")
+    def test_file_tracker_inotify_overflow(self):
+        """
+        This test checks if the file tracker rescans the folder once, if the
+        event queue overflowed, and keeps using inotify afterwards.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            read = Inotify.read
+            overflow = [InotifyEvent(-1, inotify.IN_Q_OVERFLOW, 0, "")]
+            with mock.patch.object(Inotify, "read", side_effect=[overflow], autospec=True):
+                my_tracker = NewFileTracker(folder)
+                my_tracker.start()
+                time.sleep(0.1)
+                path = self._touch(folder, "file1.txt")
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+            with mock.patch.object(Inotify, "read", autospec=True, side_effect=read):
+                self.assertTrue(my_tracker.uses_inotify)
+                path = self._touch(folder, "file2.txt")
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+                my_tracker.stop()
+                my_tracker.join(timeout=2.0)
+
+    def test_file_tracker_fallback(self):
+        """
+        This test checks if the file tracker falls back to scanning, in case
+        inotify is disabled or the folder disappears.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            subfolder = os.path.join(folder, "sub")
+            os.mkdir(subfolder)
+            my_tracker = NewFileTracker(folder, use_inotify=False)
+            my_tracker.start()
+            time.sleep(0.1)
+            path = self._touch(folder, "file1.txt")
+            self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+            self.assertFalse(my_tracker.uses_inotify)
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+            my_tracker = NewFileTracker(subfolder)
+            my_tracker.start()
+            time.sleep(0.1)
+            self.assertEqual(my_tracker.uses_inotify, Inotify.available())
+            os.rmdir(subfolder)
+            self._wait_for(lambda: not my_tracker.uses_inotify)
+            self.assertTrue(my_tracker.is_alive())
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+
+    def test_file_tracker_checkpoint(self):
+        """
+        This test checks if a restarted file tracker with checkpoint reports
+        exactly the files, which arrived while it was down.
+        """
+        for use_inotify in (False, True):
+            with self.subTest(use_inotify=use_inotify), \
+                    tempfile.TemporaryDirectory() as folder:
+                checkpoint = os.path.join(folder, "checkpoint.db")
+                self._touch(folder, "old.txt")
+                my_tracker = NewFileTracker(folder, "*.txt", use_inotify=use_inotify,
+                                            checkpoint=checkpoint)
+                my_tracker.start()
+                time.sleep(0.1)
+                first = self._touch(folder, "file1.txt")
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), first)
+                my_tracker.stop()
+                my_tracker.join(timeout=2.0)
+                self.assertEqual(my_tracker.checkpoint.pending, 0)
+                # Arrives while no tracker is running
+                second = self._touch(folder, "file2.txt")
+                os.remove(first)
+                time.sleep(0.05)
+                my_tracker = NewFileTracker(folder, "*.txt", use_inotify=use_inotify,
+                                            checkpoint=checkpoint)
+                my_tracker.start()
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), second)
+                self._touch(folder, "file1.txt")
+                self.assertEqual(my_tracker.new_files.get(timeout=2.0), first)
+                my_tracker.stop()
+                my_tracker.join(timeout=2.0)
+                self.assertTrue(my_tracker.new_files.empty())
+
+    def test_file_tracker_checkpoint_on_error(self):
+        """
+        This test checks if buffered checkpoint changes are written, in case
+        the routine of the file tracker raises.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            checkpoint = os.path.join(folder, "checkpoint.db")
+            my_tracker = NewFileTracker(folder, "*.txt", use_inotify=False,
+                                        checkpoint=checkpoint, checkpoint_interval=1000.0)
+            my_tracker.start()
+            time.sleep(0.1)
+            path = self._touch(folder, "file1.txt")
+            self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+            with mock.patch.object(NewFileTracker, "run_routine", side_effect=RuntimeError), \
+                    mock.patch("threading.excepthook"):
+                my_tracker.join(timeout=2.0)
+            self.assertFalse(my_tracker.is_alive())
+            self.assertEqual(my_tracker.checkpoint.pending, 0)
+            restored = TrackerCheckpoint(checkpoint, source=my_tracker.checkpoint.source)
+            self.assertTrue(restored.open())
+            self.assertIn(path_key(path), set(restored.load()))
+            restored.close()
+
+    @unittest.skipUnless(Inotify.available(), "inotify is not available")
+    def test_file_tracker_inotify_idle_flush(self):
+        """
+        This test checks if an idle file tracker notified by inotify writes
+        buffered checkpoint changes once the checkpoint interval expired.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            my_tracker = NewFileTracker(folder, "*.txt", checkpoint_interval=0.2,
+                                        checkpoint=os.path.join(folder, "checkpoint.db"))
+            my_tracker.start()
+            time.sleep(0.1)
+            self.assertTrue(my_tracker.uses_inotify)
+            path = self._touch(folder, "file1.txt")
+            self.assertEqual(my_tracker.new_files.get(timeout=2.0), path)
+            self._wait_for(lambda: my_tracker.checkpoint.pending == 0)
+            self.assertTrue(my_tracker.is_alive())
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+            self.assertFalse(my_tracker.is_alive())
+
+    @staticmethod
+    def _touch(folder: str, name: str) -> str:
+        path = os.path.join(folder, name)
+        with open(path, "w"):
+            pass
+        return path
+
+    def _wait_for(self, condition, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def _mock_scandir(self, files: List[str]) -> mock.MagicMock:
+        entries = []
+        for file in files:
+            entry = mock.Mock()
+            entry.name = file.rsplit("\\", 1)[1]
+            entry.path = file
+            entry.stat.return_value.st_ctime = time.time() + self._CTIME_DELTA.get(file, 0.0)
+            entries.append(entry)
+        scandir = mock.MagicMock()
+        scandir.__enter__.return_value = entries
+        return scandir
+
+
+class RecursiveFileTrackerClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    RecursiveFileTracker class within <src.examples.tracker>.
+    """
+    _MODULE_PATH = "src.examples.tracker"
+
+    def setUp(self):
+        self._roots = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+        for root in self._roots:
+            self.addCleanup(shutil.rmtree, root, True)
+
+    def test_recursive_tracker_functionality(self):
+        """
+        This test checks if the recursive file tracker is working properly, by:
+        1) ignoring files, which exist before the tracker starts,
+        2) storing new files at any depth of all roots,
+        3) applying include and exclude patterns as well as the max depth,
+        4) storing files of deleted and recreated directories again
+        """
+        first, second = self._roots
+        self._create(first, "2024", "01", "old.csv")
+        my_tracker = RecursiveFileTracker(self._roots, include=["*.csv"], exclude=["tmp"],
+                                          max_depth=2, workers=2)
+        my_tracker.start()
+        time.sleep(0.1)
+        # 1) ###################################################################
+        self.assertTrue(my_tracker.new_files.empty())
+        # 2) ###################################################################
+        expected = [
+            self._create(first, "2024", "01", "new.csv"),
+            self._create(first, "2024", "02", "new.csv"),
+            self._create(second, "top.csv")
+        ]
+        self.assertCountEqual(self._collect(my_tracker, 3), expected)
+        # 3) ###################################################################
+        self._create(first, "2024", "01", "new.txt")
+        self._create(first, "tmp", "skipped.csv")
+        self._create(first, "2024", "01", "deep", "skipped.csv")
+        path = self._create(second, "last.csv")
+        self.assertEqual(self._collect(my_tracker, 1), [path])
+        time.sleep(0.1)
+        self.assertTrue(my_tracker.new_files.empty())
+        # 4) ###################################################################
+        shutil.rmtree(os.path.join(first, "2024"))
+        time.sleep(0.1)
+        self.assertTrue(my_tracker.new_files.empty())
+        expected = [
+            self._create(first, "2024", "01", "old.csv"),
+            self._create(first, "2024", "01", "new.csv")
+        ]
+        self.assertCountEqual(self._collect(my_tracker, 2), expected)
+        my_tracker.stop()
+        my_tracker.join(timeout=2.0)
+        self.assertFalse(my_tracker.is_alive())
+
+    def test_recursive_tracker_unchanged_directories(self):
+        """
+        This test checks if the recursive file tracker only lists directories
+        again, whose mtime changed.
+        """
+        first, _ = self._roots
+        self._create(first, "a", "b", "old.csv")
+        past = time.time() - 60.0
+        for folder in (first, os.path.join(first, "a"), os.path.join(first, "a", "b")):
+            os.utime(folder, (past, past))
+        my_tracker = RecursiveFileTracker(self._roots)
+        with mock.patch(f"{self._MODULE_PATH}.os.scandir", wraps=os.scandir) as m:
+            my_tracker.start()
+            time.sleep(0.1)
+            # Every directory is listed once for the snapshot, the empty
+            # second root is listed on every cycle due to its recent mtime
+            listed = [call.args[0] for call in m.call_args_list]
+            self.assertEqual(my_tracker.directories, 4)
+            self.assertEqual(listed.count(first), 1)
+            self.assertEqual(listed.count(os.path.join(first, "a", "b")), 1)
+            path = self._create(first, "a", "b", "new.csv")
+            self.assertEqual(self._collect(my_tracker, 1), [path])
+            my_tracker.stop()
+            my_tracker.join(timeout=2.0)
+        listed = [call.args[0] for call in m.call_args_list]
+        self.assertEqual(listed.count(os.path.join(first, "a")), 1)
+
+    def test_recursive_tracker_scan_error(self):
+        """
+        This test checks if the scan workers are stopped, in case a scan error
+        ends the recursive file tracker.
+        """
+        threads = threading.active_count()
+        my_tracker = RecursiveFileTracker(["bad\0root"], workers=4)
+        with mock.patch("threading.excepthook"):
+            my_tracker.start()
+            my_tracker.join(timeout=2.0)
+        self.assertFalse(my_tracker.is_alive())
+        self.assertTrue(my_tracker.is_stopped())
+        self.assertEqual(threading.active_count(), threads)
+
+    @staticmethod
+    def _create(*parts: str) -> str:
+        path = os.path.join(*parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w"):
+            pass
+        return path
+
+    @staticmethod
+    def _collect(tracker: RecursiveFileTracker, count: int) -> List[str]:
+        return [tracker.new_files.get(timeout=2.0) for _ in range(count)]
 
 
 if __name__ == "__main__":
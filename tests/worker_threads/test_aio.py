@@ -0,0 +1,205 @@
+import asyncio
+import queue
+import threading
+import time
+import unittest
+from src.worker_threads.aio import (
+    AsyncCycleWorker,
+    AsyncTaskWorker,
+    put_async,
+    put_threadsafe,
+    submit_threadsafe
+)
+
+
+class AsyncCycleWorkerClass(unittest.IsolatedAsyncioTestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    AsyncCycleWorker class within <src.worker_threads.aio>.
+    """
+    async def asyncSetUp(self):
+        self.__calls = []
+        self.__worker = AsyncCycleWorker(delay=0.01, target=self.run_routine)
+
+    async def run_routine(self) -> None:
+        """
+        Simulating a specific routine, that needs 10 ms to finish.
+        """
+        self.__calls.append(None)
+        await asyncio.sleep(0.01)
+
+    async def test_start_pause_resume_stop(self):
+        """
+        This test checks if a worker can transition into all states.
+        """
+        self.assertTrue(self.__worker.is_initial())
+        self.__worker.start()
+        await asyncio.sleep(0.05)
+        self.assertTrue(self.__worker.is_running())
+        self.__worker.pause()
+        self.assertTrue(self.__worker.is_paused())
+        await asyncio.sleep(0.03)
+        self.assertFalse(self.__worker.is_working())
+        count = len(self.__calls)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.__calls), count)
+        self.__worker.resume()
+        await asyncio.sleep(0.05)
+        self.assertGreater(len(self.__calls), count)
+        self.__worker.stop()
+        await asyncio.wait_for(self.__worker.join(), 1.0)
+        self.assertTrue(self.__worker.is_stopped())
+
+    async def test_start_pause_timeout(self):
+        """
+        This test checks if a worker automatically stops working once the maximum
+        pause time passed.
+        """
+        self.__worker.timeout = 0.1
+        self.__worker.start()
+        await asyncio.sleep(0.02)
+        self.__worker.pause()
+        await asyncio.wait_for(self.__worker.join(), 1.0)
+        self.assertTrue(self.__worker.is_stopped())
+
+    async def test_stop_interrupts_delay(self):
+        """
+        This test checks if pause and stop events interrupt a long delay.
+        """
+        self.__worker.delay = 100.0
+        self.__worker.start()
+        await asyncio.sleep(0.02)
+        self.__worker.pause()
+        await asyncio.sleep(0.02)
+        self.__worker.resume()
+        await asyncio.sleep(0.02)
+        self.assertEqual(len(self.__calls), 2)
+        self.__worker.stop()
+        await asyncio.wait_for(self.__worker.join(), 0.1)
+        self.assertTrue(self.__worker.is_stopped())
+
+    async def test_control_from_other_thread(self):
+        """
+        This test checks if a worker can be paused and stopped from another thread.
+        """
+        self.__worker.start()
+        await asyncio.sleep(0.02)
+        thread = threading.Thread(target=self.__worker.pause)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.03)
+        count = len(self.__calls)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.__calls), count)
+        thread = threading.Thread(target=self.__worker.stop)
+        thread.start()
+        thread.join()
+        await asyncio.wait_for(self.__worker.join(), 1.0)
+        self.assertTrue(self.__worker.is_stopped())
+
+
+class AsyncTaskWorkerClass(unittest.IsolatedAsyncioTestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    AsyncTaskWorker class within <src.worker_threads.aio>.
+    """
+    class SpecificTaskWorker(AsyncTaskWorker):
+        """
+        Simulating a specific worker, that needs 50 ms to finish one task.
+        """
+        def __init__(self, tasks, **kwargs) -> None:
+            super().__init__(tasks, **kwargs)
+            self.results = []
+            self.max_in_flight = 0
+
+        async def run_task(self, task: int) -> None:
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.results.append(task)
+
+    async def test_concurrency_limit(self):
+        """
+        This test checks if tasks are processed concurrently up to the limit and
+        the worker stops once the queue is empty.
+        """
+        with self.assertRaises(ValueError):
+            AsyncTaskWorker(asyncio.Queue(), concurrency=0)
+        tasks = asyncio.Queue()
+        for i in range(100):
+            tasks.put_nowait(i)
+        worker = self.SpecificTaskWorker(tasks, concurrency=20)
+        start = time.monotonic()
+        worker.start()
+        await asyncio.wait_for(worker.join(), 2.0)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(sorted(worker.results), list(range(100)))
+        self.assertEqual(worker.max_in_flight, 20)
+        self.assertTrue(worker.is_stopped())
+
+    async def test_blocking_worker_pause_resume_stop(self):
+        """
+        This test checks if a blocking worker survives an empty queue, is woken
+        up by control events and only processes tasks while running.
+        """
+        tasks = asyncio.Queue()
+        worker = self.SpecificTaskWorker(tasks, concurrency=2, idle_timeout=float("inf"))
+        worker.start()
+        await asyncio.sleep(0.02)
+        worker.pause()
+        await asyncio.sleep(0.01)
+        tasks.put_nowait(1)
+        await asyncio.sleep(0.1)
+        self.assertEqual(worker.results, [])
+        worker.resume()
+        await asyncio.wait_for(tasks.join(), 1.0)
+        self.assertEqual(worker.results, [1])
+        worker.stop()
+        await asyncio.wait_for(worker.join(), 0.1)
+        self.assertTrue(worker.is_stopped())
+
+    async def test_stop_interrupts_delay(self):
+        """
+        This test checks if a stop event interrupts the delays of all consumers.
+        """
+        tasks = asyncio.Queue()
+        for i in range(4):
+            tasks.put_nowait(i)
+        worker = self.SpecificTaskWorker(tasks, concurrency=2, delay=100.0)
+        worker.start()
+        await asyncio.sleep(0.1)
+        self.assertEqual(sorted(worker.results), [0, 1])
+        worker.stop()
+        await asyncio.wait_for(worker.join(), 0.1)
+        self.assertTrue(worker.is_stopped())
+
+    async def test_bridge(self):
+        """
+        This test checks if threads can submit into the event loop and
+        coroutines can submit into thread queues.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = asyncio.Queue()
+        worker = self.SpecificTaskWorker(tasks, idle_timeout=float("inf"))
+        worker.start()
+
+        def producer() -> None:
+            put_threadsafe(tasks, 7, loop).result(timeout=1.0)
+            self.assertEqual(submit_threadsafe(asyncio.sleep(0, 42), loop).result(), 42)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        await loop.run_in_executor(None, thread.join)
+        await asyncio.wait_for(tasks.join(), 1.0)
+        self.assertEqual(worker.results, [7])
+        worker.stop()
+        await worker.join()
+
+        sync_tasks = queue.Queue(maxsize=1)
+        await put_async(sync_tasks, 1)
+        loop.call_later(0.05, sync_tasks.get_nowait)
+        await asyncio.wait_for(put_async(sync_tasks, 2), 1.0)
+        self.assertEqual(sync_tasks.get_nowait(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
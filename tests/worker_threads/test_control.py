@@ -1,3 +1,4 @@
+import threading
 import unittest
 from timeit import default_timer as timer
 from transitions.core import MachineError
@@ -52,6 +53,22 @@ class ThreadControlMixinClass(unittest.TestCase):
         end = timer()
         self.assertTrue(1.0 <= (end - start) < 1.1)
 
+    def test_sleep_interrupted(self):
+        """
+        This test checks if sleep only lasts while running and is interrupted
+        by any state change.
+        """
+        self.assertFalse(self._mixin.sleep(1.0))
+        self._mixin.running()
+        self.assertTrue(self._mixin.sleep(0.01))
+        timer_thread = threading.Timer(0.05, self._mixin.pause)
+        timer_thread.start()
+        start = timer()
+        self.assertFalse(self._mixin.sleep(10.0))
+        self.assertLess(timer() - start, 1.0)
+        timer_thread.join()
+        self.assertFalse(self._mixin.sleep(0.0))
+
     def test_initial_state_triggers_exceptions(self):
         """
         This test checks all invalid triggers while the state machine is in INITIAL state.
@@ -114,3 +131,24 @@ class ThreadControlMixinClass(unittest.TestCase):
             self._mixin.resume()
         exception = "Can't trigger event resume from state stopped!"
         self.assertTrue(exception in str(context.exception))
+
+    def test_transition_table_shared(self):
+        """
+        This test checks if all instances share one class-level transition table
+        and only hold their own state.
+        """
+        other = ThreadControlMixin()
+        self.assertIs(self._mixin._TRANSITIONS, other._TRANSITIONS)
+        self.assertFalse(hasattr(self._mixin, "__dict__"))
+        self._mixin.running()
+        self.assertTrue(self._mixin.is_running())
+        self.assertTrue(other.is_initial())
+
+    def test_triggers_return_true(self):
+        """
+        This test checks if every successful trigger returns True.
+        """
+        self.assertTrue(self._mixin.running())
+        self.assertTrue(self._mixin.pause())
+        self.assertTrue(self._mixin.resume())
+        self.assertTrue(self._mixin.stop())
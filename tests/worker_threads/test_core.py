@@ -1,6 +1,8 @@
 import queue
+import threading
 import time
 import unittest
+from typing import Callable
 from unittest import mock
 from src.worker_threads.core import (
     CycleWorkerThread,
@@ -21,6 +23,33 @@ class CycleWorkerThreadClass(unittest.TestCase):
         """
         time.sleep(0.1)
 
+    @staticmethod
+    def short_routine() -> None:
+        """
+        Simulating a specific worker, that needs 50 ms to finish it's
+        work routine.
+        """
+        time.sleep(0.05)
+
+    @staticmethod
+    def slow_first_routine() -> Callable[[], None]:
+        """
+        Simulating a specific worker, whose first routine needs 250 ms and all
+        further routines no time at all.
+        """
+        durations = iter([0.25])
+        return lambda: time.sleep(next(durations, 0.0))
+
+    @staticmethod
+    def _run_for(duration: float, *workers: CycleWorkerThread) -> None:
+        for worker in workers:
+            worker.start()
+        time.sleep(duration)
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout=2.0)
+
     def setUp(self):
         self.__worker = CycleWorkerThread(target=self.run_routine)
 
@@ -96,6 +125,116 @@ class CycleWorkerThreadClass(unittest.TestCase):
         self.__worker.pause()
         self._verify_stopped_state()
 
+    def test_property_schedule(self):
+        """
+        This test checks if the properties schedule and missed_tick_policy are
+        set correctly.
+        """
+        self.assertEqual(self.__worker.schedule, CycleWorkerThread.FIXED_DELAY)
+        self.assertEqual(self.__worker.missed_tick_policy, CycleWorkerThread.SKIP)
+        self.__worker.schedule = CycleWorkerThread.FIXED_RATE
+        self.__worker.missed_tick_policy = CycleWorkerThread.COALESCE
+        self.assertEqual(self.__worker.schedule, CycleWorkerThread.FIXED_RATE)
+        self.assertEqual(self.__worker.missed_tick_policy, CycleWorkerThread.COALESCE)
+        with self.assertRaises(ValueError) as context:
+            self.__worker.schedule = "random"
+        self.assertTrue("Unknown schedule 'random'" in str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            self.__worker.missed_tick_policy = "ignore"
+        self.assertTrue("Unknown missed tick policy 'ignore'" in str(context.exception))
+
+    def test_fixed_rate_vs_fixed_delay(self):
+        """
+        This test checks if a fixed rate worker keeps its period regardless of
+        the routine's duration, while a fixed delay worker does not.
+        """
+        fixed_rate = CycleWorkerThread(delay=0.1, target=self.short_routine,
+                                       schedule=CycleWorkerThread.FIXED_RATE)
+        fixed_delay = CycleWorkerThread(delay=0.1, target=self.short_routine)
+        self._run_for(0.55, fixed_rate, fixed_delay)
+        self.assertEqual(fixed_rate.cycle_stats.cycles, 6)
+        self.assertEqual(fixed_rate.cycle_stats.overruns, 0)
+        self.assertLess(fixed_rate.cycle_stats.max_jitter, 0.02)
+        self.assertEqual(fixed_delay.cycle_stats.cycles, 4)
+
+    def test_missed_tick_policies(self):
+        """
+        This test checks how a fixed rate worker deals with missed ticks, once
+        its first cycle takes two and a half periods.
+        """
+        expected = {
+            CycleWorkerThread.SKIP: (3, 1, 2),
+            CycleWorkerThread.CATCH_UP: (5, 2, 0),
+            CycleWorkerThread.COALESCE: (4, 1, 1),
+        }
+        workers = {
+            policy: CycleWorkerThread(delay=0.1, target=self.slow_first_routine(),
+                                      schedule=CycleWorkerThread.FIXED_RATE,
+                                      missed_tick_policy=policy)
+            for policy in expected
+        }
+        self._run_for(0.45, *workers.values())
+        for policy, counters in expected.items():
+            stats = workers[policy].cycle_stats
+            self.assertEqual((stats.cycles, stats.overruns, stats.missed_ticks), counters, policy)
+
+    def test_adaptive_cadence(self):
+        """
+        This test checks if an adaptive cadence:
+        1) rejects invalid bounds,
+        2) backs off exponentially up to the max delay while cycles find no work,
+        3) drops back to the delay as soon as a cycle finds work
+        """
+        # 1) ###################################################################
+        with self.assertRaises(ValueError):
+            CycleWorkerThread(max_delay=-1.0)
+        with self.assertRaises(ValueError):
+            CycleWorkerThread(delay_factor=0.5)
+        # 2) ###################################################################
+        busy = threading.Event()
+        delays = []
+
+        def routine():
+            delays.append(worker.current_delay)
+            return busy.is_set()
+
+        worker = CycleWorkerThread(delay=0.01, target=routine, max_delay=0.08)
+        worker.start()
+        time.sleep(0.4)
+        self.assertEqual(delays[:5], [0.01, 0.02, 0.04, 0.08, 0.08])
+        # 3) ###################################################################
+        busy.set()
+        time.sleep(0.2)
+        worker.stop(timeout=2.0)
+        self.assertEqual(worker.current_delay, 0.01)
+        self.assertGreater(len(delays), 15)
+
+    def test_stop_interrupts_delay(self):
+        """
+        This test checks if stop and pause events interrupt a long delay and
+        stop waits for the worker to end, if a timeout is given.
+        """
+        for schedule in (CycleWorkerThread.FIXED_DELAY, CycleWorkerThread.FIXED_RATE):
+            worker = CycleWorkerThread(delay=100.0, target=lambda: None, schedule=schedule)
+            worker.start()
+            time.sleep(0.05)
+            worker.pause()
+            worker.resume()
+            start = time.monotonic()
+            self.assertTrue(worker.stop(timeout=2.0))
+            self.assertLess(time.monotonic() - start, 0.1, schedule)
+            self.assertFalse(worker.is_alive())
+
+    def test_stop_timeout_expired(self):
+        """
+        This test checks if stop returns False, if the current cycle does not
+        finish within the timeout.
+        """
+        self.__worker.start()
+        time.sleep(0.01)
+        self.assertFalse(self.__worker.stop(timeout=0.01))
+        self._verify_stopped_state()
+
     def test_target_None(self):
         """
         This test checks if a worker without a work routine is stopped immediately.
@@ -149,6 +288,21 @@ class TaskWorkerThreadClass(unittest.TestCase):
         def run_task(self, task: int) -> None:
             time.sleep(0.1)
 
+    class BatchTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, that records all tasks and batches it received.
+        """
+        def __init__(self, tasks, **kwargs) -> None:
+            super().__init__(tasks, **kwargs)
+            self.batches = []
+            self.tasks = []
+
+        def run_task(self, task: int) -> None:
+            self.tasks.append(task)
+
+        def run_batch(self, tasks: list) -> None:
+            self.batches.append(tasks)
+
     def setUp(self):
         tasks = queue.Queue()
         for i in range(5000):
@@ -254,6 +408,178 @@ class TaskWorkerThreadClass(unittest.TestCase):
             self.__worker.start()
             self._verify_stopped_state()
 
+    def test_property_batch(self):
+        """
+        This test checks if the batch properties are set correctly.
+        """
+        self.assertEqual(self.__worker.max_batch_size, 1)
+        self.assertEqual(self.__worker.max_batch_latency, 0.0)
+        self.__worker.max_batch_size = 10
+        self.__worker.max_batch_latency = 0.5
+        self.assertEqual(self.__worker.max_batch_size, 10)
+        self.assertEqual(self.__worker.max_batch_latency, 0.5)
+        with self.assertRaises(ValueError) as context:
+            self.__worker.max_batch_size = 0
+        self.assertTrue("Max batch size must be positive" in str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            self.__worker.max_batch_latency = -1.0
+        self.assertTrue("Max batch latency must be non-negative" in str(context.exception))
+
+    def test_batch_size_bound(self):
+        """
+        This test checks if batches are limited by the maximum batch size and all
+        tasks of a batch are marked as done.
+        """
+        tasks = queue.Queue()
+        for i in range(25):
+            tasks.put(i)
+        worker = self.BatchTaskWorker(tasks, max_batch_size=10, max_batch_latency=1.0)
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(worker.batches, [list(range(10)), list(range(10, 20)),
+                                          list(range(20, 25))])
+        self.assertEqual(tasks.unfinished_tasks, 0)
+
+    def test_batch_latency_bound(self):
+        """
+        This test checks if an incomplete batch is processed once the maximum
+        batch latency passed.
+        """
+        tasks = queue.Queue()
+        for i in range(3):
+            tasks.put(i)
+        worker = self.BatchTaskWorker(tasks, max_batch_size=10, max_batch_latency=0.2)
+        start = time.monotonic()
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertTrue(0.2 <= time.monotonic() - start < 0.4)
+        self.assertEqual(worker.batches, [[0, 1, 2]])
+        self.assertEqual(tasks.unfinished_tasks, 0)
+
+    def test_stop_interrupts_batch_latency(self):
+        """
+        This test checks if a stop event ends waiting for further tasks of a
+        batch right away and the tasks collected so far are processed.
+        """
+        tasks = queue.Queue()
+        tasks.put(1)
+        worker = self.BatchTaskWorker(tasks, max_batch_size=10, max_batch_latency=5.0,
+                                      idle_timeout=10.0)
+        worker.start()
+        time.sleep(0.05)
+        start = time.monotonic()
+        self.assertTrue(worker.stop(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(worker.batches, [[1]])
+        self.assertEqual(tasks.unfinished_tasks, 0)
+
+    def test_property_idle_timeout(self):
+        """
+        This test checks if the property idle_timeout is set correctly.
+        """
+        self.assertIsNone(self.__worker.idle_timeout)
+        self.__worker.idle_timeout = 5.0
+        self.assertEqual(self.__worker.idle_timeout, 5.0)
+        with self.assertRaises(ValueError) as context:
+            self.__worker.idle_timeout = -5.0
+        self.assertTrue("Idle timeout must be non-negative" in str(context.exception))
+
+    def test_blocking_worker_survives_gaps(self):
+        """
+        This test checks if a blocking worker stays alive while the queue is
+        empty and picks up tasks arriving later on.
+        """
+        tasks = queue.Queue()
+        worker = self.BatchTaskWorker(tasks, idle_timeout=float("inf"))
+        worker.start()
+        time.sleep(0.1)
+        self.assertTrue(worker.is_alive())
+        self.assertFalse(worker.is_working())
+        tasks.put(1)
+        tasks.join()
+        self.assertEqual(worker.tasks, [1])
+        worker.stop()
+        worker.join(timeout=0.1)
+        self.assertFalse(worker.is_alive())
+
+    def test_blocking_worker_idle_retirement(self):
+        """
+        This test checks if a blocking worker retires once the idle timeout passed.
+        """
+        tasks = queue.Queue()
+        tasks.put(1)
+        worker = self.BatchTaskWorker(tasks, idle_timeout=0.2)
+        start = time.monotonic()
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertTrue(0.2 <= time.monotonic() - start < 0.4)
+        self.assertTrue(worker.is_stopped())
+        self.assertEqual(worker.tasks, [1])
+
+    def test_blocking_worker_pause_resume(self):
+        """
+        This test checks if a blocking worker is woken up by pause events and
+        does not process tasks until it is resumed.
+        """
+        tasks = queue.Queue()
+        worker = self.BatchTaskWorker(tasks, idle_timeout=float("inf"))
+        worker.start()
+        time.sleep(0.05)
+        worker.pause()
+        tasks.put(1)
+        time.sleep(0.1)
+        self.assertEqual(worker.tasks, [])
+        worker.resume()
+        tasks.join()
+        self.assertEqual(worker.tasks, [1])
+        worker.stop()
+        worker.join(timeout=0.1)
+        self.assertFalse(worker.is_alive())
+
+    def test_stop_interrupts_delay(self):
+        """
+        This test checks if a stop event interrupts a long delay right away.
+        """
+        tasks = queue.Queue()
+        tasks.put(1)
+        tasks.put(2)
+        worker = self.BatchTaskWorker(tasks, delay=100.0)
+        worker.start()
+        time.sleep(0.05)
+        start = time.monotonic()
+        self.assertTrue(worker.stop(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(worker.tasks, [1])
+
+    def test_stop_drain(self):
+        """
+        This test checks if a draining worker processes all remaining tasks,
+        even if it was paused, and ends afterwards despite its idle timeout.
+        """
+        tasks = queue.Queue()
+        worker = self.BatchTaskWorker(tasks, idle_timeout=float("inf"))
+        worker.start()
+        time.sleep(0.05)
+        worker.pause()
+        for i in range(100):
+            tasks.put(i)
+        self.assertTrue(worker.stop(timeout=2.0, drain=True))
+        self.assertTrue(worker.draining)
+        self.assertTrue(worker.is_stopped())
+        self.assertEqual(worker.tasks, list(range(100)))
+
+    def test_stop_drain_timeout(self):
+        """
+        This test checks if a draining worker, which does not finish within the
+        timeout, is stopped and abandons the remaining tasks.
+        """
+        self.__worker.start()
+        time.sleep(0.05)
+        self.assertFalse(self.__worker.stop(timeout=0.15, drain=True))
+        self._verify_stopped_state()
+        self.assertGreater(self.__worker._queue.qsize(), 4990)
+
     def _verify_initial_state(self):
         self.assertFalse(self.__worker.is_alive())
         self.assertFalse(self.__worker.is_working())
@@ -282,5 +608,5 @@ class TaskWorkerThreadClass(unittest.TestCase):
         self.assertTrue(self.__worker.is_stopped())
         self.assertIn("stopped", repr(self.__worker))
 
-    def _mock_queue_get(self):
+    def _mock_queue_get(self, *args, **kwargs):
         raise queue.Empty
@@ -0,0 +1,215 @@
+import queue
+import time
+import unittest
+import unittest.mock as mock
+from typing import Dict, List
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+from src.worker_threads.errors import ErrorPolicy
+from src.worker_threads.queues import PriorityTaskQueue
+
+
+class ErrorPolicyClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    ErrorPolicy class within <src.worker_threads.errors>.
+    """
+    class FlakyTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, whose tasks fail as often as given by
+        the task itself.
+        """
+        def __init__(self, tasks: queue.Queue, **kwargs) -> None:
+            super().__init__(tasks, **kwargs)
+            self.attempts = {}  # type: Dict[str, int]
+            self.done = []      # type: List[str]
+
+        def run_task(self, task: tuple) -> str:
+            name, failures = task
+            self.attempts[name] = self.attempts.get(name, 0) + 1
+            if self.attempts[name] <= failures:
+                raise ValueError(name)
+            self.done.append(name)
+            return name
+
+    def setUp(self):
+        self.__tasks = queue.Queue()
+        self.__dead_letters = queue.Queue()
+
+    def test_invalid_policy(self):
+        """
+        This test checks if invalid policies are rejected and the backoff grows
+        exponentially up to its maximum.
+        """
+        with self.assertRaises(ValueError):
+            ErrorPolicy(max_attempts=0)
+        with self.assertRaises(ValueError):
+            ErrorPolicy(backoff=-1.0)
+        with self.assertRaises(ValueError):
+            ErrorPolicy(backoff_factor=0.5)
+        policy = ErrorPolicy(backoff=1.0, backoff_factor=3.0, max_backoff=5.0)
+        self.assertEqual([policy.backoff_for(i) for i in (1, 2, 3)], [1.0, 3.0, 5.0])
+
+    def test_task_retries(self):
+        """
+        This test checks if failing tasks:
+        1) are retried with backoff, while other tasks are processed,
+        2) are put into the dead-letter queue once they failed for good,
+        3) are counted in the error statistics
+        """
+        policy = ErrorPolicy(max_attempts=3, backoff=0.05, dead_letters=self.__dead_letters)
+        for task in (("poison", 10), ("flaky", 1), ("first", 0), ("second", 0)):
+            self.__tasks.put(task)
+        worker = self.FlakyTaskWorker(self.__tasks, error_policy=policy, daemon=True)
+        worker.start()
+        # 1) ###################################################################
+        self.__tasks.join()
+        self.assertEqual(worker.done, ["first", "second", "flaky"])
+        self.assertEqual(worker.attempts["poison"], 3)
+        # 2) ###################################################################
+        dead_letter = self.__dead_letters.get_nowait()
+        self.assertEqual(dead_letter.task, ("poison", 10))
+        self.assertIsInstance(dead_letter.error, ValueError)
+        self.assertEqual(dead_letter.attempts, 3)
+        self.assertTrue(self.__dead_letters.empty())
+        # 3) ###################################################################
+        stats = worker.error_stats
+        self.assertEqual((stats.failures, stats.retries, stats.dead_letters), (4, 3, 1))
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+
+    def test_task_submitted_retries(self):
+        """
+        This test checks if the future of a submitted task receives the result
+        of a successful retry or the exception of the last attempt.
+        """
+        policy = ErrorPolicy(max_attempts=2, backoff=0.01, retry_on=(ValueError,))
+        worker = self.FlakyTaskWorker(self.__tasks, idle_timeout=10.0, error_policy=policy,
+                                      daemon=True)
+        worker.start()
+        self.assertEqual(worker.submit(("flaky", 1)).result(timeout=2.0), "flaky")
+        self.assertIsInstance(worker.submit(("poison", 5)).exception(timeout=2.0), ValueError)
+        self.assertIsInstance(worker.submit(None).exception(timeout=2.0), TypeError)
+        self.assertEqual(worker.attempts, {"flaky": 2, "poison": 2})
+        worker.stop()
+        worker.join(timeout=2.0)
+
+    def test_task_without_policy(self):
+        """
+        This test checks if a failing task without error policy is marked as
+        done, before the exception ends the worker.
+        """
+        self.__tasks.put(("poison", 1))
+        self.__tasks.put(("other", 0))
+        worker = self.FlakyTaskWorker(self.__tasks)
+        with mock.patch("threading.excepthook"):
+            worker.start()
+            worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(self.__tasks.unfinished_tasks, 1)
+        self.assertEqual(worker.error_stats.failures, 1)
+
+    def test_task_retries_released(self):
+        """
+        This test checks if retries pending, when the worker is stopped, are
+        handed back to the queue for other workers.
+        """
+        policy = ErrorPolicy(max_attempts=2, backoff=10.0)
+        self.__tasks.put(("flaky", 1))
+        worker = self.FlakyTaskWorker(self.__tasks, idle_timeout=10.0, error_policy=policy)
+        worker.start()
+        time.sleep(0.1)
+        worker.stop()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(self.__tasks.unfinished_tasks, 1)
+        other = self.FlakyTaskWorker(self.__tasks, error_policy=policy)
+        other.attempts = dict(worker.attempts)
+        other.start()
+        other.join(timeout=2.0)
+        self.assertEqual(other.done, ["flaky"])
+        self.assertEqual(self.__tasks.unfinished_tasks, 0)
+
+    def test_task_retries_kept_on_full_queue(self):
+        """
+        This test checks if a worker with retries pending ends at once, if its
+        bounded queue is full, and keeps the retries instead of blocking.
+        """
+        tasks = queue.Queue(maxsize=1)
+        policy = ErrorPolicy(max_attempts=2, backoff=10.0)
+        tasks.put(("flaky", 1))
+        worker = self.FlakyTaskWorker(tasks, idle_timeout=10.0, error_policy=policy)
+        worker.start()
+        time.sleep(0.1)
+        tasks.put(("other", 0))
+        start = time.monotonic()
+        self.assertTrue(worker.stop(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(tasks.get_nowait(), ("other", 0))
+        self.assertEqual(len(worker._retries), 1)
+        self.assertEqual(tasks.unfinished_tasks, 2)
+
+    def test_task_retries_keep_priority_and_deadline(self):
+        """
+        This test checks if:
+        1) retries released to a PriorityTaskQueue keep their priority and deadline,
+        2) a retry past its deadline is expired instead of being run
+        """
+        expired = []
+        tasks = PriorityTaskQueue(on_expired=expired.append, max_starvation=None)
+        policy = ErrorPolicy(max_attempts=3, backoff=10.0)
+        tasks.put(("urgent", 1), priority=-1, deadline=time.monotonic() + 0.3)
+        worker = self.FlakyTaskWorker(tasks, idle_timeout=10.0, error_policy=policy)
+        worker.start()
+        time.sleep(0.1)
+        self.assertTrue(worker.stop(timeout=2.0))
+        # 1) ###################################################################
+        tasks.put(("normal", 0))
+        self.assertEqual(tasks.qsize(), 2)
+        self.assertEqual(tasks.wait_stats()[-1].count, 1)
+        entry = tasks._get_entry(False)
+        self.assertEqual((entry.item.item, entry.priority), (("urgent", 1), -1))
+        self.assertIsNotNone(entry.deadline)
+        tasks.put(entry.item, priority=entry.priority, deadline=entry.deadline)
+        tasks.task_done()
+        # 2) ###################################################################
+        other = self.FlakyTaskWorker(tasks, error_policy=ErrorPolicy(max_attempts=3,
+                                                                     backoff=0.5))
+        other.attempts = {"urgent": -10}
+        other.start()
+        other.join(timeout=2.0)
+        self.assertEqual(other.attempts, {"urgent": -9, "normal": 1})
+        self.assertEqual(other.done, ["normal"])
+        self.assertEqual(expired, [("urgent", 1)])
+        self.assertEqual(tasks.unfinished_tasks, 0)
+
+    def test_routine_retries(self):
+        """
+        This test checks if a cycle worker with error policy keeps running,
+        retries a failing routine with backoff and puts the error into the
+        dead-letter queue after too many failures in a row.
+        """
+        calls = []
+
+        def routine() -> None:
+            calls.append(time.monotonic())
+            raise RuntimeError("routine")
+
+        policy = ErrorPolicy(max_attempts=3, backoff=0.02, backoff_factor=1.0,
+                             dead_letters=self.__dead_letters)
+        worker = CycleWorkerThread(delay=0.2, target=routine, error_policy=policy, daemon=True)
+        worker.start()
+        dead_letter = self.__dead_letters.get(timeout=2.0)
+        self.assertIsNone(dead_letter.task)
+        self.assertEqual(dead_letter.attempts, 3)
+        self.assertEqual(len(calls), 3)
+        self.assertLess(calls[2] - calls[0], 0.15)
+        self.assertTrue(worker.is_alive())
+        stats = worker.error_stats
+        self.assertEqual((stats.failures, stats.retries, stats.dead_letters), (3, 2, 1))
+        worker.stop()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import queue
+import time
+import unittest
+from typing import Any, List
+from src.worker_threads.core import TaskWorkerThread
+from src.worker_threads.futures import FIRST_EXCEPTION, as_completed, submit, wait
+from src.worker_threads.pool import TaskWorkerPool
+from src.worker_threads.queues import PriorityTaskQueue
+
+
+class FuturesClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to
+    submitting tasks within <src.worker_threads.futures>.
+    """
+    class SquaringTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, which squares numbers and fails on all
+        other tasks.
+        """
+        def run_task(self, task: int) -> int:
+            if not isinstance(task, int):
+                raise TypeError(task)
+            return task * task
+
+    class BatchTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, which processes whole batches.
+        """
+        def __init__(self, tasks: queue.Queue) -> None:
+            super().__init__(tasks, max_batch_size=10, max_batch_latency=0.05,
+                             idle_timeout=1.0)
+            self.batches = []  # type: List[int]
+
+        def run_task(self, task: Any) -> None:
+            pass
+
+        def run_batch(self, tasks: List[int]) -> List[int]:
+            self.batches.append(len(tasks))
+            return [-task for task in tasks]
+
+    def test_submit_results(self):
+        """
+        This test checks if submitted tasks:
+        1) pass their results to their futures,
+        2) pass their exceptions to their futures without ending the worker,
+        3) are skipped, if their futures were cancelled
+        """
+        tasks = queue.Queue()
+        worker = self.SquaringTaskWorker(tasks, idle_timeout=10.0, daemon=True)
+        # 3) ###################################################################
+        cancelled = worker.submit(5)
+        self.assertTrue(cancelled.cancel())
+        worker.start()
+        # 1) ###################################################################
+        futures = [worker.submit(i) for i in range(10)]
+        results = sorted(future.result(timeout=2.0) for future in as_completed(futures))
+        self.assertEqual(results, [i * i for i in range(10)])
+        # 2) ###################################################################
+        failing = worker.submit("text")
+        self.assertIsInstance(failing.exception(timeout=2.0), TypeError)
+        self.assertEqual(worker.submit(3).result(timeout=2.0), 9)
+        self.assertTrue(worker.is_alive())
+        tasks.join()
+        self.assertTrue(cancelled.cancelled())
+        worker.stop()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        with self.assertRaises(RuntimeError):
+            worker.submit(1)
+
+    def test_submit_batch(self):
+        """
+        This test checks if the results of a batch are passed to the futures
+        of the tasks in order.
+        """
+        tasks = queue.Queue()
+        worker = self.BatchTaskWorker(tasks)
+        futures = [submit(tasks, i) for i in range(10)]
+        worker.start()
+        done, not_done = wait(futures, timeout=2.0)
+        self.assertEqual(len(done), 10)
+        self.assertFalse(not_done)
+        self.assertEqual([future.result() for future in futures], [-i for i in range(10)])
+        self.assertEqual(worker.batches, [10])
+        worker.stop()
+        worker.join(timeout=2.0)
+
+    def test_submit_pool(self):
+        """
+        This test checks if tasks submitted to a pool are spread over its
+        workers and the first exception can be awaited.
+        """
+        pool = TaskWorkerPool(run_task=lambda task: (time.sleep(0.01), 1 / task)[1],
+                              max_workers=4, daemon=True)
+        pool.start()
+        futures = [pool.submit(task) for task in (1, 2, 4, 0, 5)]
+        done, _ = wait(futures, timeout=2.0, return_when=FIRST_EXCEPTION)
+        self.assertIn(futures[3], done)
+        self.assertIsInstance(futures[3].exception(), ZeroDivisionError)
+        self.assertEqual(futures[2].result(timeout=2.0), 0.25)
+        pool.stop()
+        pool.join(timeout=2.0)
+        with self.assertRaises(RuntimeError):
+            pool.submit(1)
+
+    def test_submit_expired(self):
+        """
+        This test checks if the future of a task past its deadline is cancelled
+        and the task itself is passed to the expiry handler.
+        """
+        expired = []
+        tasks = PriorityTaskQueue(on_expired=expired.append)
+        future = submit(tasks, 2, deadline=time.monotonic() - 1.0)
+        valid = submit(tasks, 3, priority=1)
+        worker = self.SquaringTaskWorker(tasks)
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertTrue(future.cancelled())
+        self.assertEqual(expired, [2])
+        self.assertEqual(valid.result(timeout=2.0), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import queue
+import threading
+import time
+import unittest
+from src.worker_threads.core import CycleWorkerThread
+from src.worker_threads.group import GroupStatus, WorkerGroup
+from src.worker_threads.pool import _CallableTaskWorker
+from src.worker_threads.process import CycleWorkerProcess
+from src.worker_threads.ratelimit import TokenBucket
+
+
+class WorkerGroupClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    WorkerGroup class within <src.worker_threads.group>.
+    """
+    def setUp(self):
+        self.__cycles = {}
+        self.__lock = threading.Lock()
+
+    def __count(self, name: str) -> None:
+        with self.__lock:
+            self.__cycles[name] = self.__cycles.get(name, 0) + 1
+
+    def __snapshot(self) -> dict:
+        with self.__lock:
+            return dict(self.__cycles)
+
+    def __cycle_worker(self, name: str, delay: float = 0.01) -> CycleWorkerThread:
+        return CycleWorkerThread(target=self.__count, args=(name,), delay=delay, daemon=True)
+
+    def test_invalid_members(self):
+        """
+        This test checks if:
+        1) only worker threads can join a group,
+        2) a worker can only join one group,
+        3) a stopped group takes no new members
+        """
+        group = WorkerGroup()
+        # 1) ###################################################################
+        with self.assertRaises(TypeError):
+            group.add(threading.Thread())
+        with self.assertRaises(TypeError):
+            group.add(CycleWorkerProcess(target=print))
+        # 2) ###################################################################
+        worker = group.add(self.__cycle_worker("a"))
+        with self.assertRaises(ValueError):
+            WorkerGroup([worker])
+        group.discard(worker)
+        self.assertEqual(len(group), 0)
+        # 3) ###################################################################
+        group.stop()
+        with self.assertRaises(RuntimeError):
+            group.add(worker)
+
+    def test_group_pause_resume(self):
+        """
+        This test checks if:
+        1) pausing the group pauses all members without changing their own state,
+        2) a member paused on its own stays paused when the group is resumed,
+        3) resuming the member lets it run again
+        """
+        group = WorkerGroup(self.__cycle_worker(name) for name in "abc")
+        a, b, c = group.members
+        group.start()
+        time.sleep(0.05)
+        # 1) ###################################################################
+        group.pause()
+        time.sleep(0.03)
+        before = self.__snapshot()
+        time.sleep(0.1)
+        self.assertEqual(self.__snapshot(), before)
+        self.assertTrue(all(worker.is_paused() for worker in (a, b, c)))
+        self.assertEqual(a._state, "running")
+        # 2) ###################################################################
+        b.pause()
+        group.resume()
+        time.sleep(0.1)
+        after = self.__snapshot()
+        self.assertGreater(after["a"], before["a"])
+        self.assertGreater(after["c"], before["c"])
+        self.assertEqual(after["b"], before["b"])
+        self.assertTrue(b.is_paused())
+        # 3) ###################################################################
+        b.resume()
+        time.sleep(0.1)
+        self.assertGreater(self.__snapshot()["b"], after["b"])
+        self.assertTrue(group.stop(timeout=1.0))
+
+    def test_group_stop_interrupts_members(self):
+        """
+        This test checks if stopping the group ends sleeping, paused and
+        blocked members at once.
+        """
+        tasks = queue.Queue()
+        sleeping = self.__cycle_worker("a", delay=100.0)
+        paused = self.__cycle_worker("b", delay=100.0)
+        blocked = _CallableTaskWorker(tasks, print, idle_timeout=float("inf"), daemon=True)
+        group = WorkerGroup([sleeping, paused, blocked])
+        group.start()
+        time.sleep(0.05)
+        paused.pause()
+        start = time.monotonic()
+        self.assertTrue(group.stop(timeout=1.0))
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertTrue(all(worker.is_stopped() for worker in group.members))
+        self.assertEqual(tasks.qsize(), 0)
+
+    def test_group_stop_interrupts_rate_limited_members(self):
+        """
+        This test checks if:
+        1) stopping the group ends members waiting for tokens at once,
+        2) pausing the group holds members, which got tokens in the meantime
+        """
+        bucket = TokenBucket(0.1)
+        bucket.take()
+        tasks = queue.Queue()
+        tasks.put(1)
+        task = _CallableTaskWorker(tasks, print, rate_limit=bucket, daemon=True)
+        group = WorkerGroup([task])
+        group.start()
+        time.sleep(0.05)
+        # 1) ###################################################################
+        start = time.monotonic()
+        self.assertTrue(group.stop(timeout=1.0))
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(tasks.get_nowait(), 1)
+        # 2) ###################################################################
+        bucket.take()
+        cycle = CycleWorkerThread(target=self.__count, args=("a",), rate_limit=bucket,
+                                  daemon=True)
+        group = WorkerGroup([cycle])
+        group.start()
+        time.sleep(0.05)
+        group.pause()
+        bucket.rate = 1000.0
+        time.sleep(0.05)
+        self.assertEqual(self.__snapshot(), {})
+        group.resume()
+        time.sleep(0.05)
+        self.assertGreater(self.__snapshot()["a"], 0)
+        self.assertTrue(group.stop(timeout=1.0))
+
+    def test_group_pause_holds_tasks(self):
+        """
+        This test checks if task workers of a paused group leave tasks in the
+        queue and process them once the group is resumed.
+        """
+        tasks = queue.Queue()
+        processed = []
+        group = WorkerGroup(
+            _CallableTaskWorker(tasks, processed.append, idle_timeout=float("inf"), daemon=True)
+            for _ in range(2)
+        )
+        group.start()
+        time.sleep(0.02)
+        group.pause()
+        for i in range(10):
+            tasks.put(i)
+        time.sleep(0.05)
+        self.assertEqual(processed, [])
+        group.resume()
+        tasks.join()
+        self.assertEqual(sorted(processed), list(range(10)))
+        self.assertTrue(group.stop(timeout=1.0))
+
+    def test_status(self):
+        """
+        This test checks if the aggregate status counts members per state.
+        """
+        event = threading.Event()
+        busy = CycleWorkerThread(target=event.wait, args=(1.0,), daemon=True)
+        group = WorkerGroup([busy, self.__cycle_worker("a"), self.__cycle_worker("b"),
+                             self.__cycle_worker("c")])
+        idle = group.members[3]
+        group.discard(idle)
+        group.add(idle)
+        group.members[1].start()
+        group.members[2].start()
+        busy.start()
+        time.sleep(0.05)
+        group.members[2].pause()
+        self.assertEqual(group.status(),
+                         GroupStatus(total=4, initial=1, running=2, paused=1, working=1))
+        group.pause()
+        self.assertEqual(group.status(),
+                         GroupStatus(total=4, initial=1, paused=3, working=1))
+        event.set()
+        self.assertTrue(group.stop(timeout=1.0))
+        self.assertEqual(group.status(), GroupStatus(total=4, initial=1, stopped=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
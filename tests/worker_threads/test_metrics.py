@@ -0,0 +1,145 @@
+import queue
+import threading
+import time
+import unittest
+from unittest import mock
+from src.worker_threads.control import ThreadControlMixin
+from src.worker_threads.core import CycleWorkerThread, TaskWorkerThread
+from src.worker_threads.errors import ErrorPolicy
+from src.worker_threads.metrics import MetricsRegistry, WorkerMetrics, registry
+
+
+class WorkerMetricsClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    worker metrics within <src.worker_threads.metrics>.
+    """
+    class SpecificTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, that needs 1 ms per task and fails on
+        negative tasks.
+        """
+        def run_task(self, task: int) -> None:
+            if task < 0:
+                raise ValueError(task)
+            time.sleep(0.001)
+
+        def run_batch(self, tasks: list) -> None:
+            for task in tasks:
+                self.run_task(task)
+
+    def test_metrics_disabled_by_default(self):
+        """
+        This test checks if no metrics are collected unless they are enabled.
+        """
+        worker = CycleWorkerThread(target=lambda: None)
+        self.assertIsNone(worker.metrics)
+        self.assertNotIn(worker.name, [item.name for item in registry.snapshot()])
+
+    def test_task_worker_metrics(self):
+        """
+        This test checks if executed tasks, failures, latencies and state times
+        are collected for task workers.
+        """
+        tasks = queue.Queue()
+        for i in range(50):
+            tasks.put(i)
+        tasks.put(-1)
+        worker = self.SpecificTaskWorker(tasks)
+        metrics = worker.enable_metrics()
+        self.assertIs(worker.enable_metrics(), metrics)
+        with mock.patch.object(threading, "excepthook"):
+            worker.start()
+            worker.join(timeout=2.0)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot.name, worker.name)
+        self.assertEqual(snapshot.state, "stopped")
+        self.assertEqual(snapshot.executed, 50)
+        self.assertEqual(snapshot.failures, 1)
+        self.assertEqual(sum(snapshot.histogram.values()), 51)
+        self.assertTrue(0.001 <= snapshot.mean_latency < 0.01)
+        self.assertTrue(0.001 <= snapshot.percentile(0.5) < 0.01)
+        self.assertTrue(0.05 <= snapshot.busy_time < 0.5)
+        self.assertGreater(snapshot.utilization, 0.5)
+        self.assertIn(worker.name, [item.name for item in registry.snapshot()])
+        worker.disable_metrics()
+        self.assertIsNone(worker.metrics)
+        self.assertNotIn(worker.name, [item.name for item in registry.snapshot()])
+
+    def test_cycle_worker_metrics(self):
+        """
+        This test checks if cycles, sleeping and state times are collected for
+        cycle workers within a custom registry.
+        """
+        custom = MetricsRegistry()
+        worker = CycleWorkerThread(delay=0.01, target=lambda: None)
+        metrics = worker.enable_metrics(custom)
+        worker.start()
+        time.sleep(0.1)
+        worker.pause()
+        time.sleep(0.1)
+        worker.stop()
+        worker.join(timeout=2.0)
+        snapshot = custom.snapshot()[0]
+        self.assertEqual(snapshot.name, worker.name)
+        self.assertGreater(snapshot.executed, 4)
+        self.assertTrue(0.05 <= snapshot.sleep_time < 0.15)
+        self.assertTrue(0.08 <= snapshot.state_times["running"] < 0.15)
+        self.assertTrue(0.08 <= snapshot.state_times["paused"] < 0.15)
+        self.assertLess(snapshot.utilization, 0.5)
+        self.assertIsInstance(metrics, WorkerMetrics)
+
+    def test_units_of_batches_and_cycles(self):
+        """
+        This test checks if:
+        1) tasks of a batch count one by one, like in the error statistics,
+           while a batch is one call with one latency,
+        2) cycles count the same way, each being one call
+        """
+        # 1) ###################################################################
+        tasks = queue.Queue()
+        for task in (0, 1, 2, 3, 4, -1, 6, 7, 8, 9):
+            tasks.put(task)
+        worker = self.SpecificTaskWorker(tasks, max_batch_size=5,
+                                         error_policy=ErrorPolicy(max_attempts=1))
+        metrics = worker.enable_metrics(MetricsRegistry())
+        worker.start()
+        worker.join(timeout=2.0)
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot.executed, snapshot.failures, snapshot.calls), (5, 5, 2))
+        self.assertEqual(snapshot.failures, worker.error_stats.failures)
+        self.assertEqual(sum(snapshot.histogram.values()), snapshot.calls)
+        self.assertAlmostEqual(snapshot.mean_latency, snapshot.busy_time / 2)
+        # 2) ###################################################################
+        cycles = iter(range(10))
+
+        def routine() -> None:
+            if next(cycles) % 2:
+                raise ValueError("odd cycle")
+
+        worker = CycleWorkerThread(target=routine, error_policy=ErrorPolicy(max_attempts=1))
+        metrics = worker.enable_metrics(MetricsRegistry())
+        worker.start()
+        while worker.cycle_stats.cycles < 10:
+            time.sleep(0.001)
+        worker.stop()
+        worker.join(timeout=2.0)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot.failures, worker.error_stats.failures)
+        self.assertEqual(snapshot.executed + snapshot.failures, snapshot.calls)
+        self.assertEqual(sum(snapshot.histogram.values()), snapshot.calls)
+
+    def test_registry_holds_weak_references(self):
+        """
+        This test checks if the registry does not keep workers alive.
+        """
+        custom = MetricsRegistry()
+        mixin = ThreadControlMixin()
+        mixin.enable_metrics(custom)
+        self.assertEqual(len(custom.snapshot()), 1)
+        del mixin
+        self.assertEqual(custom.snapshot(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
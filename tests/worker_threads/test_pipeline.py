@@ -0,0 +1,156 @@
+import queue
+import threading
+import time
+import unittest
+from src.worker_threads.core import CycleWorkerThread
+from src.worker_threads.pipeline import Pipeline
+
+
+class PipelineClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    Pipeline class within <src.worker_threads.pipeline>.
+    """
+    def setUp(self):
+        self.__output = queue.Queue()
+        self.__counter = iter(range(10 ** 9))
+        self.__source = CycleWorkerThread(delay=0.005, target=self.__produce, daemon=True)
+        self.__results = []
+        self.__lock = threading.Lock()
+
+    def __produce(self) -> None:
+        for _ in range(10):
+            self.__output.put(next(self.__counter))
+
+    def __collect(self, item: int) -> None:
+        with self.__lock:
+            self.__results.append(item)
+
+    def test_invalid_stages(self):
+        """
+        This test checks if invalid stages are rejected.
+        """
+        pipeline = Pipeline(self.__source, self.__output)
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("first", print, workers=0)
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("first", print, maxsize=0)
+        pipeline.add_stage("first", print)
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("first", print)
+
+    def test_stages_chained(self):
+        """
+        This test checks if items pass all stages in order and results of None
+        are dropped.
+        """
+        pipeline = Pipeline(self.__source, self.__output, daemon=True)
+        pipeline.add_stage("even", lambda item: item if item % 2 == 0 else None, workers=2)
+        pipeline.add_stage("double", lambda item: 2 * item, workers=2)
+        pipeline.add_stage("collect", self.__collect)
+        pipeline.start()
+        time.sleep(0.1)
+        pipeline.stop()
+        pipeline.join(timeout=2.0)
+        self.assertFalse(pipeline.is_alive())
+        self.assertTrue(self.__source.is_stopped())
+        self.assertTrue(self.__results)
+        self.assertTrue(all(item % 4 == 0 for item in self.__results))
+        with self.assertRaises(RuntimeError):
+            pipeline.add_stage("late", print)
+
+    def test_backpressure(self):
+        """
+        This test checks if a slow stage:
+        1) blocks the previous stages and pauses the source,
+        2) lets the source resume, once the backlog dropped
+        """
+        pipeline = Pipeline(self.__source, self.__output, daemon=True)
+        pipeline.add_stage("fast", lambda item: item, workers=2, maxsize=50)
+        pipeline.add_stage("slow", lambda item: (time.sleep(0.002), self.__collect(item)),
+                           maxsize=20)
+        pipeline.start()
+        # 1) ###################################################################
+        deadline = time.monotonic() + 2.0
+        while not pipeline.throttled:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+        time.sleep(0.05)
+        self.assertTrue(self.__source.is_paused())
+        depths = pipeline.depths()
+        self.assertLessEqual(depths["slow"], 20)
+        # The source may produce for one more check interval before it is paused
+        self.assertLessEqual(depths["fast"], 50 + 100)
+        # 2) ###################################################################
+        with self.__lock:
+            count = len(self.__results)
+        time.sleep(0.3)
+        with self.__lock:
+            self.assertGreater(len(self.__results), count)
+        self.assertGreater(self.__source.cycle_stats.cycles, 5)
+        pipeline.stop()
+        pipeline.join(timeout=2.0)
+        self.assertFalse(pipeline.is_alive())
+
+    def test_stop_releases_blocked_stage(self):
+        """
+        This test checks if:
+        1) stop wakes up workers blocked on a full stage right away and counts
+           their results as dropped,
+        2) stop reports a pipeline, which did not end in time, while the
+           pipeline stops waiting for its workers as well
+        """
+        release = threading.Event()
+        pipeline = Pipeline(self.__source, self.__output, daemon=True)
+        pipeline.add_stage("fast", lambda item: item, maxsize=10)
+        pipeline.add_stage("blocked", lambda item: release.wait(), maxsize=5)
+        pipeline.start()
+        deadline = time.monotonic() + 2.0
+        while pipeline.depths()["blocked"] < 5:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+        time.sleep(0.02)
+        workers = pipeline.stages[0].workers
+        self.assertTrue(all(worker.is_working() for worker in workers))
+        self.assertEqual(pipeline.stages[0].dropped, 0)
+        # 1) ###################################################################
+        # The last stage is still stuck in its function, the blocked put is not
+        self.assertFalse(pipeline.stop(timeout=0.1))
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+        self.assertEqual(pipeline.stages[0].dropped, 1)
+        self.assertEqual(pipeline.stages[1].dropped, 0)
+        # 2) ###################################################################
+        pipeline.join(timeout=0.5)
+        self.assertFalse(pipeline.is_alive())
+        self.assertTrue(pipeline.stages[1].workers[0].is_alive())
+        release.set()
+        pipeline.join(timeout=2.0)
+        self.assertFalse(pipeline.is_alive())
+
+    def test_pause_resume_stop_forwarded(self):
+        """
+        This test checks if control events are forwarded to the source and all
+        stage workers.
+        """
+        pipeline = Pipeline(self.__source, self.__output, daemon=True)
+        pipeline.add_stage("first", lambda item: item, workers=2)
+        pipeline.add_stage("second", self.__collect, workers=2)
+        pipeline.start()
+        time.sleep(0.05)
+        pipeline.pause()
+        workers = [worker for stage in pipeline.stages for worker in stage.workers]
+        self.assertEqual(len(workers), 4)
+        self.assertTrue(self.__source.is_paused())
+        self.assertTrue(all(worker.is_paused() for worker in workers))
+        pipeline.resume()
+        self.assertTrue(self.__source.is_running())
+        self.assertTrue(all(worker.is_running() for worker in workers))
+        pipeline.stop()
+        pipeline.join(timeout=2.0)
+        self.assertFalse(pipeline.is_alive())
+        self.assertFalse(self.__source.is_alive())
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import math
+import queue
+import time
+import unittest
+from src.worker_threads.core import TaskWorkerThread
+from src.worker_threads.pool import TaskWorkerPool
+
+
+class TaskWorkerPoolClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    TaskWorkerPool class within <src.worker_threads.pool>.
+    """
+    class SpecificTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, that needs 10 ms to finish one task.
+        """
+        def run_task(self, task: int) -> None:
+            time.sleep(0.01)
+
+    def setUp(self):
+        self.__tasks = queue.Queue()
+        for i in range(200):
+            self.__tasks.put(i)
+
+    def test_invalid_arguments(self):
+        """
+        This test checks if invalid pool configurations are rejected.
+        """
+        with self.assertRaises(ValueError):
+            TaskWorkerPool(self.__tasks)
+        with self.assertRaises(ValueError):
+            TaskWorkerPool(self.__tasks, run_task=print, worker_class=TaskWorkerThread)
+        with self.assertRaises(ValueError):
+            TaskWorkerPool(self.__tasks, run_task=print, min_workers=3, max_workers=2)
+        with self.assertRaises(ValueError):
+            TaskWorkerPool(self.__tasks, run_task=print, tasks_per_worker=0)
+
+    def test_scale_up_and_down(self):
+        """
+        This test checks if the pool grows up to its upper bound while there is
+        a backlog and shrinks to its lower bound once the queue is drained.
+        """
+        pool = TaskWorkerPool(
+            self.__tasks,
+            worker_class=self.SpecificTaskWorker,
+            max_workers=4,
+            tasks_per_worker=10
+        )
+        pool.start()
+        time.sleep(0.2)
+        self.assertEqual(pool.size, 4)
+        self.assertTrue(pool.is_working())
+        self.__tasks.join()
+        time.sleep(0.1)
+        self.assertEqual(pool.size, 1)
+        self.assertEqual(pool.utilization, 0.0)
+        self.__tasks.put(0)
+        self.__tasks.join()
+        pool.stop()
+        pool.join(timeout=2.0)
+        self.assertFalse(pool.is_alive())
+
+    def test_bounds_kept_while_idle(self):
+        """
+        This test checks if the pool:
+        1) keeps its lower bound of workers while the queue is empty,
+        2) shrinks surplus blocking workers once the queue is drained
+        """
+        # 1) ###################################################################
+        pool = TaskWorkerPool(queue.Queue(), run_task=print, min_workers=3, max_workers=6,
+                              daemon=True)
+        pool.start()
+        time.sleep(0.1)
+        self.assertEqual(pool.size, 3)
+        pool.stop()
+        pool.join(timeout=2.0)
+        self.assertFalse(pool.is_alive())
+        # 2) ###################################################################
+        pool = TaskWorkerPool(
+            self.__tasks,
+            worker_class=self.SpecificTaskWorker,
+            min_workers=2,
+            max_workers=6,
+            tasks_per_worker=10,
+            scale_interval=0.01,
+            daemon=True,
+            idle_timeout=math.inf
+        )
+        pool.start()
+        time.sleep(0.1)
+        self.assertEqual(pool.size, 6)
+        self.__tasks.join()
+        time.sleep(0.2)
+        self.assertEqual(pool.size, 2)
+        pool.stop()
+        pool.join(timeout=2.0)
+        self.assertFalse(pool.is_alive())
+        self.assertEqual(pool.size, 0)
+
+    def test_pause_resume_stop_forwarded(self):
+        """
+        This test checks if control events are forwarded to all workers.
+        """
+        processed = []
+        pool = TaskWorkerPool(
+            self.__tasks,
+            run_task=lambda task: (processed.append(task), time.sleep(0.01)),
+            max_workers=2
+        )
+        pool.start()
+        time.sleep(0.1)
+        pool.pause()
+        workers = pool.workers
+        self.assertEqual(len(workers), 2)
+        self.assertTrue(all(worker.is_paused() for worker in workers))
+        time.sleep(0.05)
+        count = len(processed)
+        time.sleep(0.05)
+        self.assertEqual(len(processed), count)
+        pool.resume()
+        self.assertTrue(all(worker.is_running() for worker in workers))
+        pool.stop()
+        pool.join(timeout=2.0)
+        self.assertFalse(pool.is_alive())
+        self.assertTrue(all(worker.is_stopped() for worker in workers))
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+
+    def test_stop_drain(self):
+        """
+        This test checks if a draining pool finishes all queued tasks, while a
+        pool stopped right away abandons them.
+        """
+        pool = TaskWorkerPool(self.__tasks, worker_class=self.SpecificTaskWorker,
+                              min_workers=2, max_workers=2, daemon=True)
+        pool.start()
+        time.sleep(0.05)
+        self.assertTrue(pool.stop(timeout=5.0, drain=True))
+        self.assertTrue(self.__tasks.empty())
+        for i in range(200):
+            self.__tasks.put(i)
+        pool = TaskWorkerPool(self.__tasks, worker_class=self.SpecificTaskWorker,
+                              min_workers=2, max_workers=2, daemon=True)
+        pool.start()
+        time.sleep(0.05)
+        self.assertTrue(pool.stop(timeout=2.0))
+        self.assertFalse(any(worker.is_alive() for worker in pool.workers))
+        self.assertGreater(self.__tasks.qsize(), 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
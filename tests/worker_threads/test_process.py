@@ -0,0 +1,171 @@
+import multiprocessing
+import time
+import unittest
+from src.worker_threads.process import CycleWorkerProcess, TaskWorkerProcess
+
+
+def increment(counter) -> None:
+    """
+    Simulating a specific routine, that needs 10 ms to increment a counter.
+    """
+    with counter.get_lock():
+        counter.value += 1
+    time.sleep(0.01)
+
+
+class SquareTaskWorker(TaskWorkerProcess):
+    """
+    Simulating a specific worker, that squares all numbers it receives.
+    """
+    def __init__(self, tasks, results, **kwargs) -> None:
+        super().__init__(tasks, **kwargs)
+        self.results = results
+
+    def run_task(self, task: int) -> None:
+        self.results.put(task * task)
+
+
+class CycleWorkerProcessClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    CycleWorkerProcess class within <src.worker_threads.process>.
+    """
+    def setUp(self):
+        self.__counter = multiprocessing.Value("i", 0)
+        self.__worker = CycleWorkerProcess(target=increment, args=(self.__counter,))
+
+    def tearDown(self):
+        if self.__worker.is_alive():
+            self.__worker.terminate()
+        del self.__worker
+
+    def test_property_delay_timeout(self):
+        """
+        This test checks if the properties delay and timeout are set correctly.
+        """
+        self.assertEqual(self.__worker.delay, 0.0)
+        self.assertEqual(self.__worker.timeout, 1000.0)
+        self.__worker.delay = 1.0
+        self.__worker.timeout = 500.0
+        self.assertEqual(self.__worker.delay, 1.0)
+        self.assertEqual(self.__worker.timeout, 500.0)
+        with self.assertRaises(ValueError) as context:
+            self.__worker.delay = -1.0
+        self.assertTrue("Delay must be non-negative" in str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            self.__worker.timeout = -500.0
+        self.assertTrue("Timeout must be non-negative" in str(context.exception))
+
+    def test_start_pause_resume_stop(self):
+        """
+        This test checks if a worker process can be controlled from its parent.
+        """
+        self.assertTrue(self.__worker.is_initial())
+        self.__worker.start()
+        time.sleep(0.2)
+        self.assertTrue(self.__worker.is_running())
+        self.assertIn("running", repr(self.__worker))
+        self.__worker.pause()
+        time.sleep(0.05)
+        self.assertFalse(self.__worker.is_working())
+        count = self.__counter.value
+        self.assertGreater(count, 0)
+        time.sleep(0.1)
+        self.assertEqual(self.__counter.value, count)
+        self.__worker.resume()
+        time.sleep(0.1)
+        self.assertGreater(self.__counter.value, count)
+        self.__worker.stop()
+        self.__worker.join(timeout=2.0)
+        self.assertFalse(self.__worker.is_alive())
+        self.assertEqual(self.__worker.exitcode, 0)
+        self.assertTrue(self.__worker.is_stopped())
+
+    def test_start_pause_timeout(self):
+        """
+        This test checks if a worker process automatically stops working once
+        the maximum pause time passed.
+        """
+        self.__worker.timeout = 0.2
+        self.__worker.start()
+        time.sleep(0.1)
+        self.__worker.pause()
+        self.__worker.join(timeout=2.0)
+        self.assertFalse(self.__worker.is_alive())
+        self.assertTrue(self.__worker.is_stopped())
+
+    def test_target_None(self):
+        """
+        This test checks if a worker process without a work routine is stopped
+        immediately.
+        """
+        worker = CycleWorkerProcess(target=None)
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertTrue(worker.is_stopped())
+
+    def test_stop_interrupts_delay(self):
+        """
+        This test checks if a stop event of the parent interrupts a long delay
+        of the worker process.
+        """
+        self.__worker.delay = 100.0
+        self.__worker.start()
+        while self.__counter.value == 0:
+            time.sleep(0.01)
+        start = time.monotonic()
+        self.assertTrue(self.__worker.stop(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(self.__counter.value, 1)
+
+
+class TaskWorkerProcessClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    TaskWorkerProcess class within <src.worker_threads.process>.
+    """
+    def setUp(self):
+        self.__tasks = multiprocessing.JoinableQueue()
+        self.__results = multiprocessing.Queue()
+
+    def test_worker_end_no_tasks_left(self):
+        """
+        This test checks if all tasks are processed and the worker stops once
+        the queue is empty.
+        """
+        for i in range(10):
+            self.__tasks.put(i)
+        time.sleep(0.05)
+        worker = SquareTaskWorker(self.__tasks, self.__results)
+        worker.start()
+        self.__tasks.join()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertTrue(worker.is_stopped())
+        results = sorted(self.__results.get(timeout=1.0) for _ in range(10))
+        self.assertEqual(results, [i * i for i in range(10)])
+
+    def test_blocking_worker_pause_resume(self):
+        """
+        This test checks if a blocking worker process survives an empty queue
+        and only processes tasks while it is running.
+        """
+        worker = SquareTaskWorker(self.__tasks, self.__results, idle_timeout=float("inf"))
+        worker.start()
+        time.sleep(0.2)
+        self.assertTrue(worker.is_alive())
+        worker.pause()
+        time.sleep(0.1)
+        self.__tasks.put(3)
+        time.sleep(0.1)
+        self.assertTrue(self.__results.empty())
+        worker.resume()
+        self.assertEqual(self.__results.get(timeout=1.0), 9)
+        worker.stop()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
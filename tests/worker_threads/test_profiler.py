@@ -0,0 +1,174 @@
+import gc
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+from src.worker_threads.core import CycleWorkerThread
+from src.worker_threads.pool import _CallableTaskWorker
+from src.worker_threads.profiler import SamplingProfiler
+
+
+def _hot_function(seconds: float) -> None:
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def _cold_function() -> None:
+    pass
+
+
+def _routine() -> None:
+    _hot_function(0.005)
+    _cold_function()
+
+
+class SamplingProfilerClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    SamplingProfiler class within <src.worker_threads.profiler>.
+    """
+    def test_invalid_workers(self):
+        """
+        This test checks if only other threads can be profiled.
+        """
+        profiler = SamplingProfiler()
+        with self.assertRaises(TypeError):
+            profiler.add(object())
+        with self.assertRaises(ValueError):
+            profiler.add(profiler)
+
+    def test_hot_routine_sampled(self):
+        """
+        This test checks if:
+        1) samples point to the function a routine spends its time in,
+        2) the collapsed output has one line per stack rooted at the worker,
+        3) output per worker leaves out the worker's name
+        """
+        worker = CycleWorkerThread(target=_routine, daemon=True)
+        worker.name = "hot-worker"
+        profiler = SamplingProfiler([worker], interval=0.002)
+        worker.start()
+        profiler.start()
+        time.sleep(0.3)
+        profiler.stop(timeout=1.0)
+        worker.stop(timeout=1.0)
+        # 1) ###################################################################
+        self.assertGreater(profiler.samples(), 20)
+        self.assertEqual(profiler.samples(worker), profiler.samples())
+        # 2) ###################################################################
+        lines = profiler.collapsed().splitlines()
+        counts = {}
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            frames = stack.split(";")
+            self.assertEqual(frames[0], "hot-worker")
+            self.assertFalse(any("_bootstrap" in frame for frame in frames))
+            counts[frames[-1].split(" ")[0]] = \
+                counts.get(frames[-1].split(" ")[0], 0) + int(count)
+        self.assertEqual(sum(counts.values()), profiler.samples())
+        self.assertGreater(counts.get("_hot_function", 0), 0.8 * profiler.samples())
+        # 3) ###################################################################
+        single = profiler.collapsed(worker)
+        self.assertFalse(single.startswith("hot-worker"))
+        self.assertIn("_routine", single)
+
+    def test_idle_workers_not_sampled(self):
+        """
+        This test checks if idle workers are only sampled on request.
+        """
+        tasks = queue.Queue()
+        worker = _CallableTaskWorker(tasks, print, idle_timeout=float("inf"), daemon=True)
+        profiler = SamplingProfiler([worker], interval=0.002)
+        worker.start()
+        profiler.start()
+        time.sleep(0.05)
+        self.assertEqual(profiler.samples(), 0)
+        profiler.working_only = False
+        time.sleep(0.05)
+        self.assertGreater(profiler.samples(worker), 0)
+        profiler.stop(timeout=1.0)
+        worker.stop(timeout=1.0)
+
+    def test_switch_at_runtime(self):
+        """
+        This test checks if:
+        1) pausing the profiler stops sampling,
+        2) resuming continues it,
+        3) samples are kept after stopping until cleared
+        """
+        event = threading.Event()
+        worker = CycleWorkerThread(target=event.wait, args=(5.0,), daemon=True)
+        profiler = SamplingProfiler([worker], interval=0.002, lines=True)
+        worker.start()
+        profiler.start()
+        time.sleep(0.05)
+        # 1) ###################################################################
+        profiler.pause()
+        time.sleep(0.01)
+        samples = profiler.samples()
+        self.assertGreater(samples, 0)
+        time.sleep(0.05)
+        self.assertEqual(profiler.samples(), samples)
+        # 2) ###################################################################
+        profiler.resume()
+        time.sleep(0.05)
+        self.assertGreater(profiler.samples(), samples)
+        # 3) ###################################################################
+        profiler.stop(timeout=1.0)
+        event.set()
+        worker.stop(timeout=1.0)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "stacks.txt")
+            profiler.dump(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), profiler.collapsed())
+        self.assertIn("wait", profiler.collapsed())
+        profiler.clear()
+        self.assertEqual(profiler.samples(), 0)
+        self.assertEqual(profiler.collapsed(), "")
+        self.assertEqual(profiler.workers, [worker])
+
+    def test_pause_without_timeout(self):
+        """
+        This test checks if a paused profiler does not stop by the timeout of
+        cycle workers and is stopped at once.
+        """
+        profiler = SamplingProfiler(interval=0.002)
+        profiler.timeout = 0.01
+        profiler.start()
+        profiler.pause()
+        time.sleep(0.05)
+        self.assertTrue(profiler.is_paused())
+        start = time.monotonic()
+        self.assertTrue(profiler.stop(timeout=1.0))
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_ended_workers_freed(self):
+        """
+        This test checks if ended workers are not kept alive by the profiler,
+        while their samples are kept.
+        """
+        worker = CycleWorkerThread(target=_routine, daemon=True)
+        worker.name = "short-lived"
+        profiler = SamplingProfiler([worker], interval=0.002)
+        worker.start()
+        profiler.start()
+        time.sleep(0.1)
+        worker.stop(timeout=1.0)
+        time.sleep(0.02)
+        samples = profiler.samples()
+        self.assertGreater(samples, 0)
+        del worker
+        gc.collect()
+        self.assertEqual(profiler.workers, [])
+        time.sleep(0.02)
+        self.assertEqual(profiler.samples(), samples)
+        self.assertTrue(profiler.collapsed().startswith("short-lived;"))
+        self.assertTrue(profiler.stop(timeout=1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
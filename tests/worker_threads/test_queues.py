@@ -0,0 +1,111 @@
+import queue
+import time
+import unittest
+from src.worker_threads.core import TaskWorkerThread
+from src.worker_threads.queues import PriorityTaskQueue
+
+
+class PriorityTaskQueueClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    PriorityTaskQueue class within <src.worker_threads.queues>.
+    """
+    class RecordingTaskWorker(TaskWorkerThread):
+        """
+        Simulating a specific worker, that records all tasks it received.
+        """
+        def __init__(self, tasks) -> None:
+            super().__init__(tasks)
+            self.tasks = []
+
+        def run_task(self, task: str) -> None:
+            self.tasks.append(task)
+
+    def setUp(self):
+        self.__expired = []
+        self.__queue = PriorityTaskQueue(max_starvation=None, on_expired=self.__expired.append)
+
+    def test_priority_order(self):
+        """
+        This test checks if tasks are served by priority and FIFO within the
+        same priority.
+        """
+        self.__queue.put("bulk-1", priority=5)
+        self.__queue.put("default-1")
+        self.__queue.put("urgent-1", priority=-1)
+        self.__queue.put("bulk-2", priority=5)
+        self.__queue.put("urgent-2", priority=-1)
+        result = [self.__queue.get_nowait() for _ in range(5)]
+        self.assertEqual(result, ["urgent-1", "urgent-2", "default-1", "bulk-1", "bulk-2"])
+        with self.assertRaises(queue.Empty):
+            self.__queue.get_nowait()
+
+    def test_expired_tasks_diverted(self):
+        """
+        This test checks if expired tasks are passed to the handler instead of
+        being handed out and still count as done.
+        """
+        now = time.monotonic()
+        self.__queue.put("expired", deadline=now - 1.0)
+        self.__queue.put("valid", deadline=now + 10.0)
+        self.__queue.put("expired-only", priority=3, deadline=now - 1.0)
+        worker = self.RecordingTaskWorker(self.__queue)
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(worker.tasks, ["valid"])
+        self.assertEqual(self.__expired, ["expired", "expired-only"])
+        self.assertEqual(self.__queue.unfinished_tasks, 0)
+        stats = self.__queue.wait_stats()
+        self.assertEqual(stats[0].expired, 1)
+        self.assertEqual(stats[3].expired, 1)
+        # Only handed out tasks count towards the wait time
+        self.assertEqual(stats[0].count, 1)
+        self.assertEqual(stats[3].count, 0)
+        self.assertEqual(stats[3].max_wait, 0.0)
+
+    def test_starvation_protection(self):
+        """
+        This test checks if a low priority task is served once it waited
+        longer than the starvation limit.
+        """
+        tasks = PriorityTaskQueue(max_starvation=0.05)
+        tasks.put("bulk", priority=9)
+        tasks.put("urgent-1")
+        self.assertEqual(tasks.get_nowait(), "urgent-1")
+        time.sleep(0.06)
+        tasks.put("urgent-2")
+        self.assertEqual(tasks.get_nowait(), "bulk")
+        self.assertEqual(tasks.get_nowait(), "urgent-2")
+
+    def test_wait_stats(self):
+        """
+        This test checks if the queue wait time is tracked per priority.
+        """
+        self.__queue.put("bulk", priority=1)
+        self.__queue.put("urgent")
+        time.sleep(0.05)
+        self.__queue.get_nowait()
+        time.sleep(0.05)
+        self.__queue.get_nowait()
+        stats = self.__queue.wait_stats()
+        self.assertEqual(sorted(stats), [0, 1])
+        self.assertEqual(stats[0].count, 1)
+        self.assertTrue(0.05 <= stats[0].mean_wait < 0.1)
+        self.assertTrue(0.1 <= stats[1].max_wait < 0.15)
+        self.assertEqual(stats[1].expired, 0)
+
+    def test_blocking_get_timeout(self):
+        """
+        This test checks if a blocking get keeps its timeout while skipping
+        expired tasks.
+        """
+        self.__queue.put("expired", deadline=time.monotonic() - 1.0)
+        start = time.monotonic()
+        with self.assertRaises(queue.Empty):
+            self.__queue.get(timeout=0.1)
+        self.assertTrue(0.1 <= time.monotonic() - start < 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import queue
+import threading
+import time
+import unittest
+from src.worker_threads.core import CycleWorkerThread
+from src.worker_threads.pool import TaskWorkerPool, _CallableTaskWorker
+from src.worker_threads.ratelimit import TokenBucket
+
+
+class TokenBucketClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    TokenBucket class within <src.worker_threads.ratelimit>.
+    """
+    def test_invalid_arguments(self):
+        """
+        This test checks if invalid limits are rejected.
+        """
+        with self.assertRaises(ValueError):
+            TokenBucket(0.0)
+        with self.assertRaises(ValueError):
+            TokenBucket(10.0, burst=0.5)
+        bucket = TokenBucket(10.0)
+        with self.assertRaises(ValueError):
+            bucket.rate = -1.0
+        self.assertEqual(bucket.rate, 10.0)
+
+    def test_take_burst_and_refill(self):
+        """
+        This test checks if:
+        1) a full bucket grants a burst without waiting,
+        2) further takers are told how long to wait,
+        3) a take larger than the burst leaves a debt
+        """
+        bucket = TokenBucket(100.0, burst=5)
+        # 1) ###################################################################
+        self.assertEqual([bucket.take() for _ in range(5)], [0.0] * 5)
+        # 2) ###################################################################
+        wait = bucket.take()
+        self.assertTrue(0.005 < wait <= 0.01)
+        time.sleep(wait)
+        self.assertEqual(bucket.take(), 0.0)
+        # 3) ###################################################################
+        time.sleep(0.06)
+        self.assertEqual(bucket.take(10), 0.0)
+        self.assertLess(bucket.tokens, -4.0)
+        self.assertGreater(bucket.take(), 0.04)
+
+    def test_acquire_timeout(self):
+        """
+        This test checks if acquire keeps the rate and gives up on timeout.
+        """
+        bucket = TokenBucket(200.0)
+        start = time.monotonic()
+        for _ in range(21):
+            self.assertTrue(bucket.acquire())
+        self.assertTrue(0.09 <= time.monotonic() - start < 0.2)
+        bucket.rate = 1.0
+        bucket.take()
+        self.assertFalse(bucket.acquire(timeout=0.05))
+
+    def test_rate_change_wakes_waiters(self):
+        """
+        This test checks if raising the rate wakes up waiting takers at once.
+        """
+        bucket = TokenBucket(0.1)
+        bucket.take()
+        timer = threading.Timer(0.05, setattr, (bucket, "rate", 1000.0))
+        timer.start()
+        start = time.monotonic()
+        self.assertTrue(bucket.acquire(timeout=5.0))
+        self.assertLess(time.monotonic() - start, 0.5)
+        timer.join()
+
+
+class RateLimitedWorkersClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to rate
+    limited workers within <src.worker_threads.core>.
+    """
+    def test_shared_limit_across_workers(self):
+        """
+        This test checks if a worker and a pool sharing one bucket together
+        keep its rate, while the burst passes at full speed.
+        """
+        bucket = TokenBucket(500.0, burst=50)
+        tasks = queue.Queue()
+        for i in range(150):
+            tasks.put(i)
+        processed = []
+        worker = _CallableTaskWorker(tasks, processed.append, rate_limit=bucket, daemon=True)
+        pool = TaskWorkerPool(tasks, run_task=processed.append, min_workers=2, max_workers=2,
+                              rate_limit=bucket, daemon=True)
+        start = time.monotonic()
+        worker.start()
+        pool.start()
+        tasks.join()
+        elapsed = time.monotonic() - start
+        self.assertEqual(sorted(processed), list(range(150)))
+        # 50 tasks of the burst plus 100 tasks at 500 per second
+        self.assertTrue(0.18 <= elapsed < 0.5, elapsed)
+        pool.stop(timeout=2.0)
+        worker.join(timeout=2.0)
+
+    def test_batches_take_one_token_per_task(self):
+        """
+        This test checks if batches take one token per task.
+        """
+        bucket = TokenBucket(100.0, burst=10)
+        tasks = queue.Queue()
+        for i in range(30):
+            tasks.put(i)
+        worker = _CallableTaskWorker(tasks, None, max_batch_size=10, rate_limit=bucket)
+        worker.run_batch = lambda batch: None
+        start = time.monotonic()
+        worker.start()
+        worker.join(timeout=2.0)
+        self.assertTrue(0.18 <= time.monotonic() - start < 0.4)
+
+    def test_stop_while_throttled(self):
+        """
+        This test checks if a worker waiting for a token is stopped at once and
+        hands its task back to the queue.
+        """
+        bucket = TokenBucket(0.1)
+        bucket.take()
+        tasks = queue.Queue()
+        tasks.put(1)
+        worker = _CallableTaskWorker(tasks, lambda task: None, rate_limit=bucket)
+        worker.start()
+        time.sleep(0.05)
+        self.assertFalse(worker.is_working())
+        start = time.monotonic()
+        self.assertTrue(worker.stop(timeout=2.0))
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(tasks.get_nowait(), 1)
+
+    def test_cycle_rate_adjusted_at_runtime(self):
+        """
+        This test checks if cycles are limited and a worker waiting for a token
+        picks up a higher rate at once.
+        """
+        bucket = TokenBucket(0.5)
+        cycles = []
+        worker = CycleWorkerThread(target=cycles.append, args=(None,), rate_limit=bucket)
+        worker.start()
+        time.sleep(0.1)
+        self.assertEqual(len(cycles), 1)
+        bucket.rate = 200.0
+        time.sleep(0.1)
+        worker.stop(timeout=2.0)
+        self.assertTrue(10 <= len(cycles) <= 25, len(cycles))
+
+
+if __name__ == "__main__":
+    unittest.main()
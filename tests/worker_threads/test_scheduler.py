@@ -0,0 +1,131 @@
+import time
+import unittest
+from src.worker_threads.scheduler import CycleScheduler, ScheduledRoutine
+
+
+class CycleSchedulerClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    CycleScheduler class within <src.worker_threads.scheduler>.
+    """
+    def setUp(self):
+        self.__scheduler = CycleScheduler(threads=2)
+
+    def tearDown(self):
+        if not self.__scheduler.is_initial():
+            self.__scheduler.stop()
+            self.__scheduler.join(timeout=2.0)
+        del self.__scheduler
+
+    def test_invalid_arguments(self):
+        """
+        This test checks if invalid configurations are rejected.
+        """
+        with self.assertRaises(ValueError) as context:
+            CycleScheduler(threads=0)
+        self.assertTrue("Number of threads must be positive" in str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            ScheduledRoutine(delay=-1.0)
+        self.assertTrue("Delay must be non-negative" in str(context.exception))
+        routine = self.__scheduler.schedule(print, delay=1.0)
+        with self.assertRaises(ValueError) as context:
+            self.__scheduler.add(routine)
+        self.assertTrue("Routine is already scheduled" in str(context.exception))
+
+    def test_routines_with_own_delays(self):
+        """
+        This test checks if many routines with different delays are executed
+        on a small number of threads according to their delay.
+        """
+        counters = {0.05: [], 0.1: [], 0.5: []}
+        for delay, calls in counters.items():
+            for _ in range(20):
+                self.__scheduler.schedule(calls.append, delay=delay, args=(None,))
+        self.__scheduler.start()
+        time.sleep(0.32)
+        self.__scheduler.stop()
+        self.__scheduler.join(timeout=2.0)
+        self.assertFalse(self.__scheduler.is_alive())
+        self.assertEqual(len(counters[0.05]), 20 * 7)
+        self.assertEqual(len(counters[0.1]), 20 * 4)
+        self.assertEqual(len(counters[0.5]), 20 * 1)
+        self.assertEqual(self.__scheduler.routines, [])
+
+    def test_routine_pause_resume_stop(self):
+        """
+        This test checks if a single routine can transition into all states
+        without affecting other routines.
+        """
+        calls, other_calls = [], []
+        routine = self.__scheduler.schedule(calls.append, delay=0.01, args=(None,))
+        other = self.__scheduler.schedule(other_calls.append, delay=0.01, args=(None,))
+        self.__scheduler.start()
+        time.sleep(0.05)
+        routine.pause()
+        self.assertTrue(routine.is_paused())
+        time.sleep(0.02)
+        count, other_count = len(calls), len(other_calls)
+        time.sleep(0.05)
+        self.assertEqual(len(calls), count)
+        self.assertGreater(len(other_calls), other_count)
+        routine.resume()
+        time.sleep(0.05)
+        self.assertGreater(len(calls), count)
+        routine.stop()
+        self.assertTrue(routine.is_stopped())
+        self.assertEqual(self.__scheduler.routines, [other])
+
+    def test_routine_pause_timeout(self):
+        """
+        This test checks if a routine automatically stops once the maximum
+        pause time passed.
+        """
+        routine = self.__scheduler.schedule(lambda: None, delay=0.01, timeout=0.1)
+        self.__scheduler.start()
+        routine.pause()
+        time.sleep(0.05)
+        self.assertTrue(routine.is_paused())
+        time.sleep(0.1)
+        self.assertTrue(routine.is_stopped())
+
+    def test_scheduler_pause_resume(self):
+        """
+        This test checks if pausing the scheduler pauses all routines.
+        """
+        calls = []
+        self.__scheduler.schedule(calls.append, delay=0.01, args=(None,))
+        self.__scheduler.start()
+        time.sleep(0.05)
+        self.__scheduler.pause()
+        time.sleep(0.02)
+        count = len(calls)
+        time.sleep(0.05)
+        self.assertEqual(len(calls), count)
+        self.__scheduler.resume()
+        time.sleep(0.05)
+        self.assertGreater(len(calls), count)
+
+    def test_stop_timeout(self):
+        """
+        This test checks if stop waits for the threads of the scheduler to end.
+        """
+        self.__scheduler.schedule(time.sleep, delay=0.01, args=(0.1,))
+        self.__scheduler.start()
+        time.sleep(0.05)
+        self.assertFalse(self.__scheduler.stop(timeout=0.01))
+        self.assertTrue(self.__scheduler.stop(timeout=1.0))
+        self.assertFalse(self.__scheduler.is_alive())
+
+    def test_routine_without_target(self):
+        """
+        This test checks if a routine without a target is stopped immediately.
+        """
+        routine = self.__scheduler.add(ScheduledRoutine())
+        self.__scheduler.start()
+        time.sleep(0.05)
+        self.assertTrue(routine.is_stopped())
+        self.assertTrue(self.__scheduler.is_running())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import threading
+import time
+import unittest
+from src.worker_threads.errors import ErrorPolicy
+from src.worker_threads.stealing import WorkStealingExecutor
+
+
+class WorkStealingExecutorClass(unittest.TestCase):
+    """
+    This class represents a wrapper class for all unittests related to the
+    WorkStealingExecutor class within <src.worker_threads.stealing>.
+    """
+    def setUp(self):
+        self.__processed = []
+        self.__lock = threading.Lock()
+
+    def __record(self, task: int) -> int:
+        with self.__lock:
+            self.__processed.append(task)
+        return 2 * task
+
+    def test_invalid_arguments(self):
+        """
+        This test checks if invalid arguments are rejected.
+        """
+        with self.assertRaises(ValueError):
+            WorkStealingExecutor(self.__record, workers=0)
+
+    def test_all_tasks_processed(self):
+        """
+        This test checks if all tasks are processed exactly once and results
+        are passed to the futures of submitted tasks.
+        """
+        executor = WorkStealingExecutor(self.__record, workers=8, daemon=True)
+        executor.start()
+        for i in range(5000):
+            executor.put(i)
+        futures = [executor.submit(i) for i in range(5000, 5100)]
+        self.assertTrue(executor.join_tasks(timeout=5.0))
+        self.assertEqual(sorted(self.__processed), list(range(5100)))
+        self.assertEqual([future.result() for future in futures],
+                         [2 * i for i in range(5000, 5100)])
+        self.assertEqual(executor.qsize(), 0)
+        self.assertTrue(executor.stop(timeout=2.0))
+        with self.assertRaises(RuntimeError):
+            executor.put(1)
+
+    def test_idle_workers_steal(self):
+        """
+        This test checks if tasks put into one deque are spread across idle
+        workers by stealing.
+        """
+        executor = WorkStealingExecutor(lambda task: time.sleep(0.005), workers=4, daemon=True)
+        executor.start()
+        workers = executor.workers
+        for _ in range(200):
+            workers[0]._queue.put(None)
+        time.sleep(0.05)
+        self.assertEqual(sum(worker.is_working() for worker in workers), 4)
+        self.assertTrue(executor.join_tasks(timeout=5.0))
+        self.assertGreater(executor.steals, 0)
+        self.assertTrue(executor.stop(timeout=2.0))
+
+    def test_tasks_submitted_by_workers(self):
+        """
+        This test checks if tasks put by a worker go to its own deque and are
+        waited for by join_tasks.
+        """
+        executor = None
+
+        def split(task: int) -> None:
+            if task > 1:
+                executor.put(task // 2)
+                executor.put(task - task // 2)
+            else:
+                self.__record(task)
+
+        executor = WorkStealingExecutor(split, workers=4, daemon=True)
+        executor.start()
+        executor.put(1000)
+        self.assertTrue(executor.join_tasks(timeout=5.0))
+        self.assertEqual(len(self.__processed), 1000)
+        self.assertTrue(executor.stop(timeout=2.0))
+
+    def test_retries_joined(self):
+        """
+        This test checks if join_tasks waits for pending retries.
+        """
+        attempts = []
+
+        def flaky(task: int) -> None:
+            attempts.append(task)
+            if len(attempts) < 3:
+                raise ValueError(task)
+
+        executor = WorkStealingExecutor(flaky, workers=2, daemon=True,
+                                        error_policy=ErrorPolicy(max_attempts=3, backoff=0.05))
+        executor.start()
+        executor.put(1)
+        self.assertTrue(executor.join_tasks(timeout=2.0))
+        self.assertEqual(attempts, [1, 1, 1])
+        self.assertTrue(executor.stop(timeout=2.0))
+
+    def test_pause_resume_stop_forwarded(self):
+        """
+        This test checks if control events are forwarded to all workers and
+        stop drains the deques on request.
+        """
+        executor = WorkStealingExecutor(lambda task: (self.__record(task), time.sleep(0.001)),
+                                        workers=4, daemon=True)
+        executor.start()
+        executor.pause()
+        workers = executor.workers
+        self.assertTrue(all(worker.is_paused() for worker in workers))
+        for i in range(400):
+            executor.put(i)
+        time.sleep(0.05)
+        self.assertEqual(self.__processed, [])
+        self.assertFalse(executor.join_tasks(timeout=0.01))
+        executor.resume()
+        self.assertTrue(all(worker.is_running() for worker in workers))
+        self.assertTrue(executor.stop(timeout=2.0, drain=True))
+        self.assertEqual(sorted(self.__processed), list(range(400)))
+        self.assertFalse(executor.is_alive())
+        self.assertTrue(all(worker.is_stopped() for worker in workers))
+
+
+if __name__ == "__main__":
+    unittest.main()